@@ -22,8 +22,25 @@ def get_cors_origin_regex() -> str | None:
     )
 
 
+def get_almanac_locations() -> list[tuple[float, float]]:
+    """Get locations whose almanac tables are built at startup.
+
+    Semicolon-separated ``lat,lon`` pairs, e.g. ``"40.71,-74.01;51.51,-0.13"``.
+    """
+    locations_str = os.environ.get("ALMANAC_LOCATIONS", "")
+    locations = []
+    for pair in locations_str.split(";"):
+        if pair.strip():
+            lat, lon = pair.split(",")
+            locations.append((float(lat), float(lon)))
+    return locations
+
+
 # Simple config without pydantic for CORS
 CORS_ORIGINS = get_cors_origins()
 CORS_ORIGIN_REGEX = get_cors_origin_regex()
 N2YO_API_KEY = os.environ.get("N2YO_API_KEY", "")
 ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
+ALMANAC_LOCATIONS = get_almanac_locations()
+# Grid cell size in degrees for the report cache (0.05° is about 5 km)
+RESULT_CACHE_GRID_DEGREES = float(os.environ.get("RESULT_CACHE_GRID_DEGREES", "0.05"))
@@ -1,22 +1,48 @@
 """FastAPI application for AstroSky API."""
 
+import asyncio
 from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
 
-from app.config import CORS_ORIGINS, CORS_ORIGIN_REGEX
+from app.config import ALMANAC_LOCATIONS, CORS_ORIGINS, CORS_ORIGIN_REGEX
 from app.database import init_db
-from app.routers import health, report, observations
+from app.routers import calendar, health, report, observations
+from skycli.ephemeris import warm_up
+from skycli.sources.events import update_event_store
+from skycli.sources.iss import TLE_REFRESH_HOURS, ensure_tle
+from skycli.sources.sun_moon import ensure_almanac_table
+
+
+async def refresh_tle() -> None:
+    """Keep the ISS elements fresh for local pass predictions."""
+    while True:
+        await asyncio.to_thread(ensure_tle)
+        await asyncio.sleep(TLE_REFRESH_HOURS * 3600)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize database on startup."""
+    """Initialize database, load the ephemeris and prepare precomputed data on startup.
+
+    The event store is only computed here if the image didn't ship one;
+    otherwise it is just extended when a new year comes into range. The ISS
+    elements are downloaded in the background and refreshed daily.
+    """
     init_db()
+    warm_up()
+    update_event_store()
+    year = datetime.now(timezone.utc).year
+    for lat, lon in ALMANAC_LOCATIONS:
+        ensure_almanac_table(lat, lon, year)
+    tle_task = asyncio.create_task(refresh_tle())
     yield
+    tle_task.cancel()
 
 
 # Rate limiter configuration
@@ -48,4 +74,5 @@ app.add_middleware(
 # Routers
 app.include_router(health.router, prefix="/api")
 app.include_router(report.router, prefix="/api")
+app.include_router(calendar.router, prefix="/api")
 app.include_router(observations.router, prefix="/api")
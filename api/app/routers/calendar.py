@@ -0,0 +1,37 @@
+"""Calendar endpoint - every astronomical event over whole years."""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query, Request
+from pydantic import BaseModel
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.routers.report import AstroEvent
+from skycli.sources.events import get_event_calendar
+
+
+router = APIRouter(tags=["calendar"])
+limiter = Limiter(key_func=get_remote_address)
+
+
+class CalendarResponse(BaseModel):
+    year: int
+    years: int
+    events: list[AstroEvent]
+
+
+@router.get("/calendar", response_model=CalendarResponse)
+@limiter.limit("30/minute")
+def get_calendar(
+    request: Request,
+    year: Annotated[int, Query(ge=1900, le=2100, description="First year of the calendar")],
+    years: Annotated[int, Query(ge=1, le=10, description="Whole years to cover")] = 1,
+) -> CalendarResponse:
+    """Get every event from January 1 of ``year`` for ``years`` years, in UTC.
+
+    Events are geocentric, so the calendar doesn't depend on location. It is
+    served from the event store; years adjoining the stored span are added
+    to it, and years further away are computed for this request only.
+    """
+    return CalendarResponse(year=year, years=years, events=get_event_calendar(year, years))
@@ -1,19 +1,31 @@
 """Report endpoint - wraps skycli build_report()."""
 
-from datetime import datetime, timezone
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Query, Request
+from fastapi import APIRouter, HTTPException, Query, Request
 from pydantic import BaseModel
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from app.config import RESULT_CACHE_GRID_DEGREES
+from skycli.ephemeris import ephemeris_span
 from skycli.report import build_report
+from skycli.result_cache import DEFAULT_POLICIES, ResultCache
 
 
 router = APIRouter(tags=["report"])
 limiter = Limiter(key_func=get_remote_address)
 
+# Shared by all requests in this worker; nearby users hit the same grid cells
+report_cache = ResultCache(
+    {
+        section: replace(policy, grid_degrees=RESULT_CACHE_GRID_DEGREES)
+        for section, policy in DEFAULT_POLICIES.items()
+    }
+)
+
 
 # Pydantic models matching skycli TypedDicts
 class Location(BaseModel):
@@ -26,6 +38,10 @@ class SunTimes(BaseModel):
     sunset: datetime
     astronomical_twilight_start: datetime
     astronomical_twilight_end: datetime
+    nautical_twilight_start: datetime | None = None
+    nautical_twilight_end: datetime | None = None
+    civil_twilight_start: datetime | None = None
+    civil_twilight_end: datetime | None = None
 
 
 class MoonInfo(BaseModel):
@@ -62,6 +78,8 @@ class ShowerInfo(BaseModel):
     peak_date: str
     radiant_constellation: str
     is_peak: bool
+    best_time: datetime | None = None  # Hour with the highest expected rate
+    best_rate: float | None = None  # Expected meteors per hour then
 
 
 class DSOInfo(BaseModel):
@@ -128,5 +146,15 @@ def get_report(
     else:
         report_date = datetime.now(timezone.utc)
 
-    report = build_report(lat, lon, report_date)
+    # The report searches the whole UTC day and the next, so both must be
+    # inside the ephemeris
+    first, last = ephemeris_span()
+    day = report_date.replace(hour=0, minute=0, second=0, microsecond=0)
+    if not first <= day <= last - timedelta(days=2):
+        raise HTTPException(
+            status_code=422,
+            detail=f"date must be between {first + timedelta(days=1):%Y-%m-%d} and {last - timedelta(days=2):%Y-%m-%d}",
+        )
+
+    report = build_report(lat, lon, report_date, cache=report_cache)
     return ReportResponse(**report)
@@ -0,0 +1,121 @@
+"""Benchmark the Skyfield and Astronomy Engine backends operation by operation.
+
+For each operation in skycli.backends, reports the median latency of each
+backend over several locations and dates, plus how far Astronomy Engine's
+answers are from Skyfield's. A fresh NightContext is built for every call,
+as a report does, so Skyfield's per-context setup is part of its time.
+
+Also reports cold start: a new interpreter's time to its first moon phase on
+each backend, which for Skyfield includes loading the kernel.
+
+Run from the repo root:
+
+    python benchmarks/bench_backends.py
+"""
+
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from skycli.backends import BACKENDS, OPERATIONS
+from skycli.context import NightContext
+from skycli.sources.planets import PLANETS
+from skycli.sources.sun_moon import SOLAR_LEVELS
+
+REPEATS = 10
+LOCATIONS = [(40.7128, -74.0060), (-33.87, 151.21), (64.15, -21.94)]
+DATES = [datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc), datetime(2025, 7, 4, 2, 0, tzinfo=timezone.utc)]
+BODIES = ["Moon", *PLANETS]
+
+COLD_START = """
+import time
+start = time.perf_counter()
+from datetime import datetime, timezone
+from skycli.backends import BACKENDS
+from skycli.context import NightContext
+BACKENDS[{name!r}].moon_phase(NightContext(0.0, 0.0, datetime(2025, 1, 1, tzinfo=timezone.utc)))
+print(time.perf_counter() - start)
+"""
+
+
+def run(backend, operation: str, context: NightContext):
+    """Run one operation, in the form the report uses it."""
+    if operation == "position":
+        return backend.altaz(context, BODIES)
+    if operation == "rise_set":
+        return backend.rise_set(context, BODIES)
+    if operation == "twilight":
+        return backend.sun_crossings(context, SOLAR_LEVELS)
+    return backend.moon_phase(context)
+
+
+def latency(backend, operation: str, lat: float, lon: float, date: datetime) -> float:
+    """Median latency of one operation in milliseconds."""
+    run(backend, operation, NightContext(lat, lon, date))  # warm up
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        run(backend, operation, NightContext(lat, lon, date))
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1000
+
+
+def _angle(alt1: float, az1: float, alt2: float, az2: float) -> float:
+    """Angle between two horizon directions, in arcseconds."""
+    a1, z1, a2, z2 = np.radians([alt1, az1, alt2, az2])
+    cos_angle = np.sin(a1) * np.sin(a2) + np.cos(a1) * np.cos(a2) * np.cos(z1 - z2)
+    return float(np.degrees(np.arccos(np.clip(cos_angle, -1.0, 1.0))) * 3600)
+
+
+def _time_error(reference: list, other: list) -> float:
+    """Largest gap in seconds between matching events, or inf if the events differ."""
+    if len(reference) != len(other):
+        return float("inf")
+    return max((abs((a[0] - b[0]).total_seconds()) for a, b in zip(reference, other)), default=0.0)
+
+
+def discrepancy(operation: str, reference, other) -> float:
+    """Worst difference between two backends' results for one operation."""
+    if operation == "position":
+        return max(_angle(*reference[name], *other[name]) for name in reference)
+    if operation == "rise_set":
+        return max(_time_error(reference[name], other[name]) for name in reference)
+    if operation == "twilight":
+        return _time_error(reference, other)
+    return abs((reference - other + 180) % 360 - 180) * 3600
+
+
+def cold_start(name: str) -> float:
+    """Seconds from a fresh interpreter to its first moon phase on one backend."""
+    output = subprocess.run(
+        [sys.executable, "-c", COLD_START.format(name=name)], capture_output=True, text=True, check=True
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    names = list(BACKENDS)
+    units = {"position": "arcsec", "rise_set": "s", "twilight": "s", "moon_phase": "arcsec"}
+    print(f"{'operation':>10}  " + "  ".join(f"{name:>10}" for name in names) + "  max difference")
+    for operation in OPERATIONS:
+        times = {name: [] for name in names}
+        worst = 0.0
+        for lat, lon in LOCATIONS:
+            for date in DATES:
+                for name in names:
+                    times[name].append(latency(BACKENDS[name], operation, lat, lon, date))
+                results = [run(BACKENDS[name], operation, NightContext(lat, lon, date)) for name in names]
+                worst = max(worst, discrepancy(operation, results[0], results[1]))
+        row = "  ".join(f"{np.median(times[name]):>8.2f}ms" for name in names)
+        print(f"{operation:>10}  {row}  {worst:.1f} {units[operation]}")
+
+    print()
+    for name in names:
+        print(f"cold start ({name}): {cold_start(name) * 1000:.0f}ms")
+
+
+if __name__ == "__main__":
+    main()
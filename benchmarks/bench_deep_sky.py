@@ -0,0 +1,72 @@
+"""Benchmark deep sky query latency against catalog size.
+
+Registers synthetic catalogs of increasing size (objects spread uniformly
+over the sky, magnitudes 2-15) and times get_visible_dso against each.
+
+Run from the repo root:
+
+    python benchmarks/bench_deep_sky.py
+"""
+
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from skycli.data.catalog import Catalog, get_catalog, register_catalog
+from skycli.sources.deep_sky import get_visible_dso
+
+SIZES = [110, 1_000, 10_000, 100_000]
+REPEATS = 20
+LOCATIONS = [(40.7128, -74.0060), (-33.87, 151.21), (64.15, -21.94)]
+DATE = datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc)
+
+
+def synthetic_catalog(size: int, seed: int = 42) -> Catalog:
+    """Build a catalog of `size` objects spread uniformly over the sky."""
+    rng = np.random.default_rng(seed)
+    ra = rng.uniform(0, 360, size)
+    dec = np.degrees(np.arcsin(rng.uniform(-1, 1, size)))
+    mag = rng.uniform(2, 15, size)
+    records = [
+        {
+            "id": f"X{i:06d}",
+            "name": f"Object {i}",
+            "constellation": "Syn",
+            "ra": float(ra[i]),
+            "dec": float(dec[i]),
+            "mag": round(float(mag[i]), 1),
+            "size": 5.0,
+            "type": "Galaxy",
+            "equipment": "large-scope",
+            "tip": "Synthetic benchmark object",
+        }
+        for i in range(size)
+    ]
+    return Catalog.from_records(records)
+
+
+def time_query(catalog: str, lat: float, lon: float) -> float:
+    """Median latency of one query in milliseconds."""
+    get_visible_dso(lat, lon, DATE, catalog=catalog)  # warm up
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        get_visible_dso(lat, lon, DATE, catalog=catalog)
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1000
+
+
+def main() -> None:
+    for size in SIZES:
+        register_catalog(f"synthetic-{size}", synthetic_catalog(size))
+
+    header = f"{'catalog':>18}  {'objects':>8}  " + "  ".join(f"{lat:>+7.1f}°" for lat, _ in LOCATIONS)
+    print(header)
+    for name, size in [("messier", len(get_catalog("messier")))] + [(f"synthetic-{n}", n) for n in SIZES]:
+        timings = [time_query(name, lat, lon) for lat, lon in LOCATIONS]
+        print(f"{name:>18}  {size:>8}  " + "  ".join(f"{ms:>6.2f}ms" for ms in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark build_report with and without a shared NightContext.
+
+"before" calls the Skyfield-based sources the way build_report used to,
+each building its own location, observer and Time objects. "after" is
+build_report itself, which builds one NightContext and hands it to every
+source. Network-backed sections (weather, ISS) and the geocentric events
+section are excluded so only the shared setup is measured.
+
+Run from the repo root:
+
+    python benchmarks/bench_report.py
+"""
+
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+from skycli.report import build_report
+from skycli.sources.deep_sky import get_visible_dso
+from skycli.sources.meteors import get_active_showers
+from skycli.sources.planets import get_visible_planets
+from skycli.sources.sun_moon import get_moon_info, get_sun_times
+
+REPEATS = 20
+SECTIONS = ["moon", "planets", "meteors", "deepsky"]
+LOCATIONS = [(40.7128, -74.0060), (-33.87, 151.21), (64.15, -21.94)]
+DATES = [datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc), datetime(2025, 7, 4, 2, 0, tzinfo=timezone.utc)]
+
+
+def before(lat: float, lon: float, date: datetime) -> None:
+    """Every source sets up its own observer and times."""
+    get_sun_times(lat, lon, date)
+    get_moon_info(lat, lon, date)
+    get_visible_planets(lat, lon, date)
+    get_active_showers(date)
+    get_visible_dso(lat, lon, date)
+
+
+def after(lat: float, lon: float, date: datetime) -> None:
+    """build_report shares one NightContext across sources."""
+    build_report(lat, lon, date, only=SECTIONS)
+
+
+def time_call(fn, lat: float, lon: float, date: datetime) -> float:
+    """Median latency of one call in milliseconds."""
+    fn(lat, lon, date)  # warm up
+    samples = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        fn(lat, lon, date)
+        samples.append(time.perf_counter() - start)
+    return float(np.median(samples)) * 1000
+
+
+def main() -> None:
+    print(f"{'location':>18}  {'date':>10}  {'before':>9}  {'after':>9}")
+    for lat, lon in LOCATIONS:
+        for date in DATES:
+            b = time_call(before, lat, lon, date)
+            a = time_call(after, lat, lon, date)
+            print(f"{lat:>+8.2f},{lon:>+8.2f}  {date:%Y-%m-%d}  {b:>7.2f}ms  {a:>7.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+"""Year-long sun and moon almanac tables for a location.
+
+A table holds one row per UTC day of a year with that day's sunrise, sunset,
+twilight boundaries, moonrise and moonset, all found by a single search over
+the whole year (see :func:`skycli.sources.sun_moon.build_almanac_table`).
+Tables are saved as ``.npz`` files under the user cache directory and loaded
+once per process, after which a day's times are a row lookup instead of a
+root search.
+
+Tables are keyed by coordinates rounded to four decimals (about 10 m), so a
+saved location always maps to the same file.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+from skycli.data import CACHE_DIR
+
+# Event columns, in storage order
+COLUMNS = (
+    "sunrise",
+    "sunset",
+    "astronomical_twilight_start",
+    "astronomical_twilight_end",
+    "nautical_twilight_start",
+    "nautical_twilight_end",
+    "civil_twilight_start",
+    "civil_twilight_end",
+    "moonrise",
+    "moonset",
+)
+
+COORD_DECIMALS = 4
+# Bumped whenever the way tables are computed changes, so stale files are rebuilt
+TABLE_VERSION = 1
+# Locations remembered as having no table, least recently looked up first out
+MISSING_CACHE_SIZE = 1024
+
+_tables: dict[tuple[float, float, int], "AlmanacTable"] = {}
+# Keys recently found to have no table file, so repeat lookups skip the disk.
+# A table built by another process meanwhile isn't seen until its key drops out.
+_missing: OrderedDict[tuple[float, float, int], None] = OrderedDict()
+_missing_lock = threading.Lock()
+
+
+def table_key(lat: float, lon: float, year: int) -> tuple[float, float, int]:
+    """Key a table by rounded coordinates and year."""
+    return round(lat, COORD_DECIMALS), round(lon, COORD_DECIMALS), year
+
+
+@dataclass(frozen=True, eq=False)
+class AlmanacTable:
+    """Sun and moon event times for every UTC day of one year at one place.
+
+    ``times`` has a row per day of the year and a column per entry of
+    :data:`COLUMNS`, holding POSIX timestamps, or NaN where the event doesn't
+    happen that day (e.g. no moonrise, or no astronomical night in summer at
+    high latitudes).
+    """
+
+    lat: float
+    lon: float
+    year: int
+    times: np.ndarray
+
+    def day(self, date: datetime) -> dict[str, datetime | None]:
+        """Get one day's events by column name."""
+        row = self.times[date.timetuple().tm_yday - 1]
+        return {
+            name: None if np.isnan(value) else datetime.fromtimestamp(value, timezone.utc)
+            for name, value in zip(COLUMNS, row)
+        }
+
+    @classmethod
+    def from_days(cls, lat: float, lon: float, year: int, days: list[dict]) -> "AlmanacTable":
+        """Build a table from per-day dicts of event datetimes (or None)."""
+        times = np.array(
+            [[np.nan if day[name] is None else day[name].timestamp() for name in COLUMNS] for day in days],
+            dtype=np.float64,
+        ).reshape(len(days), len(COLUMNS))
+        return cls(lat=lat, lon=lon, year=year, times=times)
+
+    def save(self, path: Path) -> None:
+        """Write the table to an ``.npz`` file."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                times=self.times,
+                coords=np.array([self.lat, self.lon]),
+                year=self.year,
+                version=TABLE_VERSION,
+            )
+
+    @classmethod
+    def load(cls, path: Path) -> "AlmanacTable":
+        """Read a table written by :meth:`save`."""
+        with np.load(path) as data:
+            if int(data["version"]) != TABLE_VERSION:
+                raise ValueError(f"Almanac table {path} is from an older version")
+            lat, lon = (float(value) for value in data["coords"])
+            return cls(lat=lat, lon=lon, year=int(data["year"]), times=data["times"])
+
+
+def table_path(lat: float, lon: float, year: int) -> Path:
+    """Where the table for a location and year is stored."""
+    lat, lon, year = table_key(lat, lon, year)
+    return CACHE_DIR / "almanac" / f"{lat:+.{COORD_DECIMALS}f}_{lon:+.{COORD_DECIMALS}f}_{year}.npz"
+
+
+def store_table(table: AlmanacTable) -> Path:
+    """Save a table to the cache directory and keep it in memory."""
+    path = table_path(table.lat, table.lon, table.year)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table.save(path)
+    key = table_key(table.lat, table.lon, table.year)
+    _tables[key] = table
+    with _missing_lock:
+        _missing.pop(key, None)
+    return path
+
+
+def get_table(lat: float, lon: float, year: int) -> AlmanacTable | None:
+    """Get the table for a location and year if one has been built.
+
+    Looks in memory first, then in the cache directory. Returns None when
+    there is no usable table, in which case callers search directly; that
+    answer is remembered for the last MISSING_CACHE_SIZE locations, so
+    repeat lookups don't touch the disk.
+    """
+    key = table_key(lat, lon, year)
+    table = _tables.get(key)
+    if table is None:
+        with _missing_lock:
+            if key in _missing:
+                _missing.move_to_end(key)
+                return None
+        path = table_path(lat, lon, year)
+        try:
+            table = AlmanacTable.load(path)
+        except (OSError, ValueError, KeyError):
+            with _missing_lock:
+                _missing[key] = None
+                if len(_missing) > MISSING_CACHE_SIZE:
+                    _missing.popitem(last=False)
+            return None
+        _tables[key] = table
+    return table
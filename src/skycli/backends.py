@@ -0,0 +1,182 @@
+"""Interchangeable computation backends: Skyfield and Astronomy Engine.
+
+Both libraries can answer the questions the report asks about solar system
+bodies. Each backend implements the same four operations:
+
+- ``position``: apparent altitude and azimuth of bodies at the report time
+- ``rise_set``: horizon crossings of bodies during the report's UTC day
+- ``twilight``: crossings of the Sun's altitude levels during that day
+- ``moon_phase``: the Moon's phase angle at the report time
+
+and the engine used for each operation is picked separately, so the report
+can run every operation on whichever engine is faster for it (see
+``benchmarks/bench_backends.py``). Skyfield is the default throughout.
+Astronomy Engine needs no kernel file, so sections that only use it start
+without loading one.
+
+Set ``ASTROSKY_BACKENDS`` to override the defaults, e.g.
+``ASTROSKY_BACKENDS="rise_set=astronomy,moon_phase=astronomy"``, or call
+:func:`set_backend`.
+"""
+
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Protocol
+
+import astronomy
+import numpy as np
+from skyfield import almanac
+from skyfield.functions import to_spherical
+
+from skycli.context import NightContext
+from skycli.ephemeris import get_body, get_ephemeris
+from skycli.rise_set import HORIZON_DEGREES, find_altitude_crossings, find_risings_and_settings
+
+OPERATIONS = ("position", "rise_set", "twilight", "moon_phase")
+
+
+class Backend(Protocol):
+    """Operations every computation backend provides."""
+
+    name: str
+
+    def altaz(self, context: NightContext, bodies: list[str]) -> dict[str, tuple[float, float]]:
+        """Apparent ``(altitude, azimuth)`` in degrees of each body at ``context.t``, without refraction."""
+
+    def rise_set(self, context: NightContext, bodies: list[str]) -> dict[str, list[tuple[datetime, bool]]]:
+        """Time-ordered ``(utc_datetime, is_rise)`` horizon crossings of each body in the UTC day."""
+
+    def sun_crossings(self, context: NightContext, levels: tuple[float, ...]) -> list[tuple[datetime, int, bool]]:
+        """Time-ordered ``(utc_datetime, level_index, rising)`` Sun altitude crossings in the UTC day."""
+
+    def moon_phase(self, context: NightContext) -> float:
+        """Moon phase angle in degrees: 0 new, 90 first quarter, 180 full."""
+
+
+class SkyfieldBackend:
+    """Skyfield with the shared kernel and the batched rise/set solver."""
+
+    name = "skyfield"
+
+    def altaz(self, context: NightContext, bodies: list[str]) -> dict[str, tuple[float, float]]:
+        # Observer state once, then every body's apparent position from it,
+        # rotated into the horizon frame together
+        position = context.position
+        apparent_au = np.column_stack([position.observe(get_body(name)).apparent().xyz.au for name in bodies])
+        _, alt_radians, az_radians = to_spherical(context.location.rotation_at(context.t) @ apparent_au)
+        return {
+            name: (float(alt), float(az))
+            for name, alt, az in zip(bodies, np.degrees(alt_radians), np.degrees(az_radians))
+        }
+
+    def rise_set(self, context: NightContext, bodies: list[str]) -> dict[str, list[tuple[datetime, bool]]]:
+        return find_risings_and_settings(context.day_grid, {name: get_body(name) for name in bodies})
+
+    def sun_crossings(self, context: NightContext, levels: tuple[float, ...]) -> list[tuple[datetime, int, bool]]:
+        return find_altitude_crossings(context.day_grid, get_body("Sun"), levels)
+
+    def moon_phase(self, context: NightContext) -> float:
+        eph, _ = get_ephemeris()
+        return float(almanac.moon_phase(eph, context.t).degrees)
+
+
+def _astronomy_time(dt: datetime) -> astronomy.Time:
+    return astronomy.Time.Make(dt.year, dt.month, dt.day, dt.hour, dt.minute, dt.second + dt.microsecond / 1e6)
+
+
+class AstronomyEngineBackend:
+    """Astronomy Engine's analytic theories; no kernel file needed."""
+
+    name = "astronomy"
+
+    @staticmethod
+    def _observer(context: NightContext) -> astronomy.Observer:
+        return astronomy.Observer(context.lat, context.lon)
+
+    @staticmethod
+    def _instant(context: NightContext) -> astronomy.Time:
+        # The report instant to the minute, as NightContext.t
+        return _astronomy_time(context.date.replace(second=0, microsecond=0))
+
+    @staticmethod
+    def _crossings(
+        context: NightContext, body: astronomy.Body, altitude: float
+    ) -> list[tuple[datetime, bool]]:
+        """Every crossing of one altitude by a body's centre during the UTC day."""
+        observer = AstronomyEngineBackend._observer(context)
+        day = datetime(context.date.year, context.date.month, context.date.day, tzinfo=timezone.utc)
+        t0 = _astronomy_time(day)
+        t1 = _astronomy_time(day + timedelta(days=1))
+
+        crossings = []
+        for direction, is_rise in ((astronomy.Direction.Rise, True), (astronomy.Direction.Set, False)):
+            start = t0
+            while start.ut < t1.ut:
+                found = astronomy.SearchAltitude(body, observer, direction, start, t1.ut - start.ut, altitude)
+                if found is None or found.ut >= t1.ut:
+                    break
+                crossings.append((found.Utc().replace(tzinfo=timezone.utc), is_rise))
+                start = found.AddDays(1e-5)  # Step past this root (about a second)
+        crossings.sort(key=lambda crossing: crossing[0])
+        return crossings
+
+    def altaz(self, context: NightContext, bodies: list[str]) -> dict[str, tuple[float, float]]:
+        observer = self._observer(context)
+        time = self._instant(context)
+        positions = {}
+        for name in bodies:
+            equator = astronomy.Equator(astronomy.Body[name], time, observer, True, True)
+            horizon = astronomy.Horizon(time, observer, equator.ra, equator.dec, astronomy.Refraction.Airless)
+            positions[name] = (horizon.altitude, horizon.azimuth)
+        return positions
+
+    def rise_set(self, context: NightContext, bodies: list[str]) -> dict[str, list[tuple[datetime, bool]]]:
+        return {name: self._crossings(context, astronomy.Body[name], HORIZON_DEGREES) for name in bodies}
+
+    def sun_crossings(self, context: NightContext, levels: tuple[float, ...]) -> list[tuple[datetime, int, bool]]:
+        crossings = [
+            (dt, level, is_rise)
+            for level, altitude in enumerate(levels)
+            for dt, is_rise in self._crossings(context, astronomy.Body.Sun, altitude)
+        ]
+        crossings.sort(key=lambda crossing: crossing[0])
+        return crossings
+
+    def moon_phase(self, context: NightContext) -> float:
+        return astronomy.MoonPhase(self._instant(context))
+
+
+BACKENDS: dict[str, Backend] = {
+    SkyfieldBackend.name: SkyfieldBackend(),
+    AstronomyEngineBackend.name: AstronomyEngineBackend(),
+}
+
+
+def _parse_selection(value: str) -> dict[str, str]:
+    """Parse ``operation=backend`` pairs separated by commas."""
+    selection = {}
+    for pair in value.split(","):
+        if pair.strip():
+            operation, name = (part.strip() for part in pair.split("="))
+            if operation not in OPERATIONS:
+                raise ValueError(f"Unknown operation {operation!r}. Valid: {', '.join(OPERATIONS)}")
+            if name not in BACKENDS:
+                raise ValueError(f"Unknown backend {name!r}. Valid: {', '.join(BACKENDS)}")
+            selection[operation] = name
+    return selection
+
+
+_selected: dict[str, str] = {
+    **dict.fromkeys(OPERATIONS, SkyfieldBackend.name),
+    **_parse_selection(os.environ.get("ASTROSKY_BACKENDS", "")),
+}
+
+
+def set_backend(operation: str, name: str) -> None:
+    """Use the backend called ``name`` for ``operation`` from now on."""
+    _selected.update(_parse_selection(f"{operation}={name}"))
+
+
+def get_backend(operation: str) -> Backend:
+    """Get the backend selected for an operation."""
+    return BACKENDS[_selected[operation]]
@@ -13,7 +13,8 @@ from skycli.locations import (
     get_location,
     get_default_location,
 )
-from skycli.sources.events import get_upcoming_events
+from skycli.sources.events import get_event_calendar, get_upcoming_events
+from skycli.sources.sun_moon import ensure_almanac_table
 
 
 class LatitudeType(click.ParamType):
@@ -51,6 +52,18 @@ LONGITUDE = LongitudeType()
 
 SECTIONS = ["moon", "planets", "iss", "meteors", "events", "deepsky"]
 
+# Event types accepted by --type, and the AstroEvent types each selects
+EVENT_TYPES = {
+    "conjunction": ["conjunction"],
+    "opposition": ["opposition"],
+    "moon": ["moon_phase"],
+    "seasonal": ["equinox", "solstice"],
+    "eclipse": ["eclipse"],
+    "elongation": ["elongation"],
+    "perihelion": ["perihelion"],
+    "meteor": ["meteor"],
+}
+
 
 def parse_sections(value: str) -> list[str]:
     """Parse comma-separated section names."""
@@ -179,8 +192,9 @@ def tonight(
 ) -> None:
     """Show what's visible in the night sky tonight."""
     # Resolve location
+    saved = True
     if lat is not None and lon is not None:
-        pass  # Use explicit coordinates
+        saved = False  # Use explicit coordinates
     elif location_name:
         try:
             lat, lon = get_location(location_name)
@@ -206,6 +220,11 @@ def tonight(
     else:
         date = date.replace(tzinfo=timezone.utc)
 
+    # Saved locations get a year-long almanac table, built once and cached on
+    # disk, so later runs look up sun and moon times instead of searching
+    if saved:
+        ensure_almanac_table(lat, lon, date.year)
+
     # Build the report
     report_data = build_report(
         lat=lat,
@@ -257,7 +276,8 @@ def render_events_standalone(events: list, start_date: datetime, days: int, no_c
 @click.option("--lon", type=LONGITUDE, default=None, help="Longitude (-180 to 180)")
 @click.option("-l", "--location", "location_name", type=str, default=None, help="Use saved location")
 @click.option("--days", type=click.IntRange(1, 30), default=7, help="Days to look ahead (1-30)")
-@click.option("--type", "event_type", type=click.Choice(["conjunction", "opposition", "moon", "seasonal"]), default=None, help="Filter by event type")
+@click.option("--type", "event_type", type=click.Choice(list(EVENT_TYPES)), default=None, help="Filter by event type")
+@click.option("--workers", type=click.IntRange(1), default=1, help="Processes to compute events with")
 @click.option("--json", "json_output", is_flag=True, help="Output as JSON")
 @click.option("--no-color", is_flag=True, help="Disable colored output")
 def events(
@@ -266,6 +286,7 @@ def events(
     location_name: Optional[str],
     days: int,
     event_type: Optional[str],
+    workers: int,
     json_output: bool,
     no_color: bool,
 ) -> None:
@@ -289,34 +310,93 @@ def events(
         )
 
     start = datetime.now(timezone.utc)
-    all_events = get_upcoming_events(lat, lon, start, days=days)
+    all_events = get_upcoming_events(lat, lon, start, days=days, workers=workers)
 
     # Filter by type if specified
     if event_type:
-        type_map = {
-            "conjunction": "conjunction",
-            "opposition": "opposition",
-            "moon": "moon_phase",
-            "seasonal": ["equinox", "solstice"],
-        }
-        filter_types = type_map[event_type]
-        if isinstance(filter_types, str):
-            filter_types = [filter_types]
-        all_events = [e for e in all_events if e["type"] in filter_types]
+        all_events = [e for e in all_events if e["type"] in EVENT_TYPES[event_type]]
 
     if json_output:
-        import json
-
-        def serialize(obj):
-            if isinstance(obj, datetime):
-                return obj.isoformat()
-            raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
-
-        click.echo(json.dumps(all_events, default=serialize, indent=2))
+        click.echo(_events_json(all_events))
     else:
         output = render_events_standalone(all_events, start, days, no_color=no_color)
         click.echo(output)
 
 
+def _events_json(events: list) -> str:
+    """Serialize events to JSON with ISO dates."""
+    import json
+
+    def serialize(obj):
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj)} is not JSON serializable")
+
+    return json.dumps(events, default=serialize, indent=2)
+
+
+def render_calendar(events: list, year: int, years: int, no_color: bool = False) -> str:
+    """Render a multi-year event calendar grouped by month."""
+    from io import StringIO
+    from rich.console import Console
+
+    output = StringIO()
+    console = Console(file=output, force_terminal=not no_color, no_color=no_color, width=65)
+
+    last_year = year + years - 1
+    span = str(year) if years == 1 else f"{year}-{last_year}"
+    console.print(f"[bold]EVENT CALENDAR {span}[/bold]")
+    if not events:
+        console.print("  No events in this period")
+        return output.getvalue()
+
+    month = None
+    for event in events:
+        if (event["date"].year, event["date"].month) != month:
+            month = (event["date"].year, event["date"].month)
+            console.print()
+            console.print(f"[bold]{event['date'].strftime('%B %Y')}[/bold]")
+        console.print(f"  {event['date'].strftime('%b %d %H:%M')}  {event['title']}")
+        if event["description"]:
+            console.print(f"                {event['description']}")
+    console.print()
+
+    return output.getvalue()
+
+
+@main.command()
+@click.argument("year", type=int, required=False)
+@click.option("--years", type=click.IntRange(1, 50), default=1, help="Whole years to cover (1-50)")
+@click.option("--type", "event_type", type=click.Choice(list(EVENT_TYPES)), default=None, help="Filter by event type")
+@click.option("--workers", type=click.IntRange(1), default=1, help="Processes to compute missing events with")
+@click.option("--json", "json_output", is_flag=True, help="Output as JSON")
+@click.option("--no-color", is_flag=True, help="Disable colored output")
+def calendar(
+    year: Optional[int],
+    years: int,
+    event_type: Optional[str],
+    workers: int,
+    json_output: bool,
+    no_color: bool,
+) -> None:
+    """Show every astronomical event in YEAR (default this year), month by month.
+
+    Events are geocentric, so no location is needed. Dates are UTC. The
+    events are read from the event store, which is extended as needed, so
+    only the first calendar for a span computes anything.
+    """
+    if year is None:
+        year = datetime.now(timezone.utc).year
+
+    all_events = get_event_calendar(year, years, workers=workers)
+    if event_type:
+        all_events = [e for e in all_events if e["type"] in EVENT_TYPES[event_type]]
+
+    if json_output:
+        click.echo(_events_json(all_events))
+    else:
+        click.echo(render_calendar(all_events, year, years, no_color=no_color))
+
+
 if __name__ == "__main__":
     main()
@@ -0,0 +1,70 @@
+"""Per-report observing context shared by all sources."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from functools import cached_property
+
+from skyfield.api import wgs84
+
+from skycli.almanac_tables import AlmanacTable, get_table
+from skycli.ephemeris import get_body, get_ephemeris
+from skycli.rise_set import SearchGrid
+
+
+@dataclass(frozen=True, eq=False)
+class NightContext:
+    """Observer and times for one report.
+
+    Built once per report and handed to every source, so the topocentric
+    setup, the Time objects and the observer's position are computed once
+    instead of once per source. Sources build their own when called without
+    one.
+    """
+
+    lat: float
+    lon: float
+    date: datetime
+
+    @cached_property
+    def almanac(self) -> AlmanacTable | None:
+        """The location's almanac table for the report year, if one has been built."""
+        return get_table(self.lat, self.lon, self.date.year)
+
+    @cached_property
+    def location(self):
+        """The observer's geographic position."""
+        return wgs84.latlon(self.lat, self.lon)
+
+    @cached_property
+    def observer(self):
+        """Earth + location, the vector to observe from."""
+        return get_body("Earth") + self.location
+
+    @cached_property
+    def t(self):
+        """The report instant, to the minute."""
+        _, ts = get_ephemeris()
+        date = self.date
+        return ts.utc(date.year, date.month, date.day, date.hour, date.minute)
+
+    @cached_property
+    def t0(self):
+        """Start of the report's UTC day."""
+        _, ts = get_ephemeris()
+        return ts.utc(self.date.year, self.date.month, self.date.day)
+
+    @cached_property
+    def t1(self):
+        """End of the report's UTC day."""
+        _, ts = get_ephemeris()
+        return ts.utc(self.date.year, self.date.month, self.date.day + 1)
+
+    @cached_property
+    def position(self):
+        """The observer's position at the report instant."""
+        return self.observer.at(self.t)
+
+    @cached_property
+    def day_grid(self) -> SearchGrid:
+        """Observer samples over the UTC day, for rise/set and twilight searches."""
+        return SearchGrid(self.observer, self.location, self.t0, self.t1)
@@ -3,3 +3,6 @@
 from pathlib import Path
 
 DATA_DIR = Path(__file__).parent
+
+# Data generated at run time (almanac tables and the like)
+CACHE_DIR = Path.home() / ".cache" / "astrosky"
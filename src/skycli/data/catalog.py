@@ -0,0 +1,235 @@
+"""Columnar deep sky catalogs.
+
+The bundled JSON catalogs are compiled into NumPy arrays for the numeric
+columns plus interned string tables for the text columns. A compiled catalog
+is loaded lazily once per process and shared by every caller.
+
+Run ``python -m skycli.data.catalog`` to pre-compile the bundled catalogs
+into ``.npz`` files next to their JSON sources; without that step, or when a
+compiled file is stale or from another format version, the JSON is compiled
+in memory on first use. Other catalogs (NGC, IC, Caldwell...) can be
+plugged in with :func:`register_catalog`.
+"""
+
+import json
+import sys
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+
+import numpy as np
+
+from skycli.data import DATA_DIR
+
+# Bump when the compiled ``.npz`` layout or ordering changes
+CATALOG_VERSION = 1
+
+NUMERIC_FIELDS = ("ra", "dec", "mag", "size")
+STRING_FIELDS = ("id", "name", "constellation", "type", "equipment", "tip")
+
+# Bundled catalogs by name
+CATALOGS = {
+    "messier": "messier.json",
+}
+
+# Spatial index cells: declination bands split into right ascension sectors
+CELL_DEC_DEGREES = 5.0
+CELL_RA_DEGREES = 10.0
+# Slack added to the cell altitude bound, covering precession since J2000 and
+# aberration, which move apparent positions away from catalog positions
+CELL_MARGIN_DEGREES = 1.0
+
+_N_BANDS = int(180 / CELL_DEC_DEGREES)
+_N_SECTORS = int(360 / CELL_RA_DEGREES)
+
+_catalogs: dict[str, "Catalog"] = {}
+
+
+@dataclass(frozen=True, eq=False)
+class Catalog:
+    """A deep sky catalog stored column by column.
+
+    Objects are kept in magnitude order, brightest first, so a search for the
+    brightest visible objects can stop as soon as it has enough. Numeric
+    columns are float64 arrays. Each string column is stored as a
+    table of distinct values plus an integer code per object, so repeated
+    values such as types and constellations are held once.
+    """
+
+    ra: np.ndarray  # degrees
+    dec: np.ndarray  # degrees
+    mag: np.ndarray
+    size: np.ndarray  # arcminutes
+    tables: dict[str, tuple[str, ...]]
+    codes: dict[str, np.ndarray]
+
+    def __post_init__(self) -> None:
+        if np.any(np.diff(self.mag) < 0):
+            raise ValueError("Catalog objects must be in magnitude order, brightest first")
+
+    def __len__(self) -> int:
+        return len(self.ra)
+
+    @cached_property
+    def _cells(self) -> np.ndarray:
+        """Index of the sky cell each object falls in."""
+        band = np.clip(((self.dec + 90.0) // CELL_DEC_DEGREES).astype(np.intp), 0, _N_BANDS - 1)
+        sector = ((self.ra % 360.0) // CELL_RA_DEGREES).astype(np.intp) % _N_SECTORS
+        return band * _N_SECTORS + sector
+
+    def candidates(self, lat: float, lst_hours: float, min_altitude: float) -> np.ndarray:
+        """Get the objects that may be at or above ``min_altitude`` right now.
+
+        The sky is split into fixed RA/Dec cells. For each cell the highest
+        altitude anything inside it can have is bounded from its hour angle
+        and declination range, and only objects in cells whose bound clears
+        ``min_altitude`` are returned. Cells on the far side of the sky or
+        in declination bands that never rise high enough at ``lat`` are
+        dropped without looking at their objects' positions.
+
+        Args:
+            lat: Observer latitude in degrees
+            lst_hours: Local apparent sidereal time in hours
+            min_altitude: Altitude cutoff in degrees
+
+        Returns:
+            Indices of the candidate objects, in catalog (magnitude) order
+        """
+        max_alt = _cell_max_altitude(lat, lst_hours)
+        reachable = max_alt >= min_altitude - CELL_MARGIN_DEGREES
+        return np.flatnonzero(reachable[self._cells])
+
+    def text(self, field: str, index: int) -> str:
+        """Get the value of a string column for one object."""
+        return self.tables[field][self.codes[field][index]]
+
+    def record(self, index: int) -> dict:
+        """Get one object as a plain dict, in the JSON catalog's shape."""
+        record = {field: self.text(field, index) for field in STRING_FIELDS}
+        for field in NUMERIC_FIELDS:
+            record[field] = float(getattr(self, field)[index])
+        return record
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "Catalog":
+        """Compile a list of catalog dicts into columnar form.
+
+        Records are sorted by magnitude; ties keep their input order.
+        """
+        records = sorted(records, key=lambda record: record["mag"])
+        tables = {}
+        codes = {}
+        for field in STRING_FIELDS:
+            values = [record[field] for record in records]
+            table = tuple(sys.intern(value) for value in dict.fromkeys(values))
+            lookup = {value: code for code, value in enumerate(table)}
+            tables[field] = table
+            codes[field] = np.array([lookup[value] for value in values], dtype=np.uint32)
+        return cls(
+            **{
+                field: np.array([record[field] for record in records], dtype=np.float64)
+                for field in NUMERIC_FIELDS
+            },
+            tables=tables,
+            codes=codes,
+        )
+
+    def save(self, path: Path) -> None:
+        """Write the catalog to an ``.npz`` file."""
+        arrays = {field: getattr(self, field) for field in NUMERIC_FIELDS}
+        for field in STRING_FIELDS:
+            arrays[f"{field}_table"] = np.array(self.tables[field], dtype=str)
+            arrays[f"{field}_codes"] = self.codes[field]
+        with open(path, "wb") as f:
+            np.savez(f, version=CATALOG_VERSION, **arrays)
+
+    @classmethod
+    def load(cls, path: Path) -> "Catalog":
+        """Read a catalog written by :meth:`save`."""
+        with np.load(path) as data:
+            if "version" not in data or int(data["version"]) != CATALOG_VERSION:
+                raise ValueError(f"Catalog {path} is from another version")
+            return cls(
+                **{field: data[field] for field in NUMERIC_FIELDS},
+                tables={
+                    field: tuple(sys.intern(str(value)) for value in data[f"{field}_table"])
+                    for field in STRING_FIELDS
+                },
+                codes={field: data[f"{field}_codes"] for field in STRING_FIELDS},
+            )
+
+
+def _cell_max_altitude(lat: float, lst_hours: float) -> np.ndarray:
+    """Upper bound on the altitude of anything in each sky cell, in degrees.
+
+    For a fixed declination altitude falls off with |hour angle|, and for a
+    fixed hour angle it peaks where ``tan(dec) = tan(lat) / cos(H)``. So the
+    highest point of a cell lies at its smallest |H|, at that peak
+    declination clipped to the cell's band.
+    """
+    dec_lo = np.radians(np.arange(_N_BANDS) * CELL_DEC_DEGREES - 90.0)[:, None]
+    dec_hi = dec_lo + np.radians(CELL_DEC_DEGREES)
+    ra_lo = np.arange(_N_SECTORS) * CELL_RA_DEGREES
+
+    # Smallest |hour angle| over each sector, in radians
+    ha_lo = (lst_hours * 15.0 - ra_lo - CELL_RA_DEGREES + 180.0) % 360.0 - 180.0
+    ha_hi = ha_lo + CELL_RA_DEGREES
+    ha_min = np.where((ha_lo <= 0) & (ha_hi >= 0), 0.0, np.minimum(np.abs(ha_lo), np.abs(ha_hi)))
+    ha_min = np.radians(np.minimum(ha_min, 180.0))[None, :]
+
+    phi = np.radians(lat)
+    dec_peak = np.arctan2(np.sin(phi), np.cos(phi) * np.cos(ha_min))
+    dec = np.clip(dec_peak, dec_lo, dec_hi)
+    sin_alt = np.sin(phi) * np.sin(dec) + np.cos(phi) * np.cos(dec) * np.cos(ha_min)
+    return np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0))).ravel()
+
+
+def _compiled_path(source: Path) -> Path:
+    return source.with_suffix(".npz")
+
+
+def compile_catalog(name: str) -> Path:
+    """Compile a bundled JSON catalog into its ``.npz`` file."""
+    source = DATA_DIR / CATALOGS[name]
+    with open(source) as f:
+        catalog = Catalog.from_records(json.load(f))
+    compiled = _compiled_path(source)
+    catalog.save(compiled)
+    return compiled
+
+
+def register_catalog(name: str, catalog: Catalog) -> None:
+    """Make a catalog available to :func:`get_catalog` under ``name``.
+
+    Catalogs built with :meth:`Catalog.from_records` are already in the
+    magnitude order searches rely on; others are checked on construction.
+    """
+    _catalogs[name] = catalog
+
+
+def get_catalog(name: str = "messier") -> Catalog:
+    """Get a registered or bundled catalog, loading it on first use.
+
+    Uses the pre-compiled ``.npz`` file when it is at least as new as the
+    JSON source and from the current format version, otherwise compiles the
+    JSON in memory.
+    """
+    catalog = _catalogs.get(name)
+    if catalog is None:
+        source = DATA_DIR / CATALOGS[name]
+        compiled = _compiled_path(source)
+        if compiled.exists() and compiled.stat().st_mtime >= source.stat().st_mtime:
+            try:
+                catalog = Catalog.load(compiled)
+            except (OSError, ValueError, KeyError):
+                catalog = None
+        if catalog is None:
+            with open(source) as f:
+                catalog = Catalog.from_records(json.load(f))
+        _catalogs[name] = catalog
+    return catalog
+
+
+if __name__ == "__main__":
+    for catalog_name in CATALOGS:
+        print(f"Compiled {catalog_name} -> {compile_catalog(catalog_name)}")
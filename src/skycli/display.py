@@ -72,7 +72,10 @@ def render_report(data: dict[str, Any], no_color: bool = False) -> str:
         for m in data["meteors"]:
             peak_marker = " (Peak!)" if m["is_peak"] else ""
             console.print(f"  {m['name']}{peak_marker} · Peak {m['peak_date']} · ~{m['zhr']}/hour")
-            console.print(f"    Look toward {m['radiant_constellation']} after midnight")
+            if m.get("best_time"):
+                console.print(f"    Look toward {m['radiant_constellation']}, best around {_format_time(m['best_time'])}Z (~{m['best_rate']:.0f}/hour)")
+            else:
+                console.print(f"    Look toward {m['radiant_constellation']} after midnight")
         console.print()
 
     # Deep sky section
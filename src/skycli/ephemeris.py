@@ -0,0 +1,157 @@
+"""Shared Skyfield ephemeris and timescale.
+
+Every Skyfield-based source gets its kernel and timescale from here, so a
+process parses the SPK file once and keeps a single copy of it. jplephem
+memory-maps the segment data, which lets forked API workers share the
+kernel's pages instead of each holding a private copy.
+
+Run ``python -m skycli.ephemeris [YEARS]`` to cut an excerpt of the kernel
+covering YEARS either side of today (20 by default) for only the bodies used
+here. The excerpt keeps the kernel's own Chebyshev coefficients, so positions
+are unchanged, in about a quarter of the file size. It is preferred over the
+full kernel while it covers the current date, and used regardless when the
+full kernel isn't on disk (as in the API image), so nothing is downloaded at
+run time. :func:`ephemeris_span` tells callers which dates the loaded kernel
+can answer.
+"""
+
+import logging
+from datetime import datetime
+from pathlib import Path
+
+from jplephem.excerpter import write_excerpt
+from jplephem.spk import SPK
+from skyfield.api import load
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Timescale
+
+logger = logging.getLogger(__name__)
+
+EPHEMERIS_FILE = "de421.bsp"
+EXCERPT_FILE = "de421-excerpt.bsp"
+EXCERPT_YEARS = 20
+# The excerpt is only used while it extends at least this far past today
+EXCERPT_MARGIN_DAYS = 366
+
+# Segment targets kept in the excerpt: the planet barycenters, the Sun, Earth
+# and Moon, and the Mercury, Venus and Mars bodies. Pluto is dropped.
+EXCERPT_TARGETS = (1, 2, 3, 4, 5, 6, 7, 8, 10, 199, 299, 301, 399, 499)
+
+# Kernel segment names for each planet. DE421 only carries barycenters for
+# the outer planets, which are within a few arcseconds of the planet itself.
+PLANET_KEYS = {
+    "Mercury": "Mercury",
+    "Venus": "Venus",
+    "Mars": "Mars",
+    "Jupiter": "Jupiter barycenter",
+    "Saturn": "Saturn barycenter",
+    "Uranus": "Uranus barycenter",
+    "Neptune": "Neptune barycenter",
+}
+
+_ephemeris: SpiceKernel | None = None
+_timescale: Timescale | None = None
+_bodies: dict = {}
+
+
+def _covers_now(kernel: SpiceKernel, ts: Timescale) -> bool:
+    """Whether every segment of a kernel spans today plus the margin either side."""
+    now = ts.now().tdb
+    return all(
+        segment.start_jd <= now - EXCERPT_MARGIN_DAYS and segment.end_jd >= now + EXCERPT_MARGIN_DAYS
+        for segment in kernel.spk.segments
+    )
+
+
+def get_ephemeris() -> tuple[SpiceKernel, Timescale]:
+    """Get or load the ephemeris data and timescale.
+
+    Loads the excerpt when there is one covering the current date, otherwise
+    the full kernel. Without the full kernel on disk the excerpt is kept
+    anyway, rather than downloading the kernel.
+    """
+    global _ephemeris, _timescale
+    if _ephemeris is None:
+        _timescale = load.timescale()
+        if Path(EXCERPT_FILE).exists():
+            excerpt = load(EXCERPT_FILE)
+            if _covers_now(excerpt, _timescale):
+                _ephemeris = excerpt
+            elif not Path(EPHEMERIS_FILE).exists():
+                logger.warning(f"{EXCERPT_FILE} ends within {EXCERPT_MARGIN_DAYS} days of today; regenerate it")
+                _ephemeris = excerpt
+            else:
+                excerpt.close()
+        if _ephemeris is None:
+            _ephemeris = load(EPHEMERIS_FILE)
+    return _ephemeris, _timescale
+
+
+def ephemeris_span() -> tuple[datetime, datetime]:
+    """First and last UTC dates every segment of the loaded kernel covers."""
+    eph, ts = get_ephemeris()
+    segments = eph.spk.segments
+    start = ts.tdb_jd(max(segment.start_jd for segment in segments))
+    end = ts.tdb_jd(min(segment.end_jd for segment in segments))
+    return start.utc_datetime(), end.utc_datetime()
+
+
+def excerpt_ephemeris(
+    years: float = EXCERPT_YEARS, source: str = EPHEMERIS_FILE, target: str = EXCERPT_FILE
+) -> Path:
+    """Write an excerpt of the kernel covering ``years`` either side of today.
+
+    Only the segments in :data:`EXCERPT_TARGETS` are copied, and only the
+    Chebyshev records overlapping the window. The window is clipped to the
+    dates the source kernel covers.
+    """
+    ts = load.timescale()
+    now = ts.now().tdb
+    half_window = years * 365.25
+
+    spk = SPK.open(source)
+    try:
+        kept = [
+            (summary, segment)
+            for summary, segment in zip(spk.daf.summaries(), spk.segments)
+            if segment.target in EXCERPT_TARGETS
+        ]
+        start = max(now - half_window, *(segment.start_jd for _, segment in kept))
+        end = min(now + half_window, *(segment.end_jd for _, segment in kept))
+        with open(target, "w+b") as target_file:
+            write_excerpt(spk, target_file, start, end, [summary for summary, _ in kept])
+    finally:
+        spk.close()
+    return Path(target)
+
+
+def get_body(name: str):
+    """Get a body handle from the kernel, e.g. ``"Earth"`` or ``"Jupiter"``.
+
+    Planet names are mapped to the segment the kernel actually carries, so
+    ``get_body("Jupiter")`` returns the Jupiter barycenter. Handles are built
+    once and reused, which saves re-resolving the segment chain per request.
+    """
+    body = _bodies.get(name)
+    if body is None:
+        eph, _ = get_ephemeris()
+        body = eph[PLANET_KEYS.get(name, name)]
+        _bodies[name] = body
+    return body
+
+
+def warm_up() -> None:
+    """Load the kernel and build the commonly used body handles eagerly.
+
+    Called from the API's startup hook so the first request doesn't pay for
+    parsing the kernel.
+    """
+    for name in ("Earth", "Sun", "Moon", *PLANET_KEYS):
+        get_body(name)
+
+
+if __name__ == "__main__":
+    import sys
+
+    window = float(sys.argv[1]) if len(sys.argv) > 1 else EXCERPT_YEARS
+    print(f"Wrote {excerpt_ephemeris(window)}")
@@ -0,0 +1,242 @@
+"""On-disk store of precomputed astronomical events.
+
+Moon phases, conjunctions, oppositions, seasons, eclipses, elongations,
+perihelia and meteor shower peaks don't depend on the observer, so the same
+events serve every location. They are computed once over a multi-year span
+(see :func:`skycli.sources.events.update_event_store`) and kept in an SQLite
+table indexed by date, so a date range is an index range scan. Calendars for
+other years widen the span (:func:`skycli.sources.events.get_event_calendar`).
+
+The store records the span it covers. Queries outside it return None and the
+caller computes the events directly; the covered span can be widened later
+with more events, e.g. as time moves forward. Writes take SQLite's write lock
+up front (``BEGIN IMMEDIATE``), so processes sharing the file, such as the
+API's workers, extend it one at a time.
+
+Run ``python -m skycli.event_store [YEARS] [--rebuild]`` to create or extend
+the store in the user cache directory, or to regenerate it from scratch. The
+events are computed on a process pool using every core.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from skycli.data import CACHE_DIR
+
+EVENT_STORE_FILE = "events.sqlite3"
+EVENT_STORE_YEARS = 5
+# How long a write waits for another process's write to finish. Extending
+# the store holds the lock while the new events are computed.
+WRITE_TIMEOUT_SECONDS = 600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    date REAL NOT NULL,
+    type TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL,
+    bodies TEXT NOT NULL,
+    UNIQUE (date, type, title)
+);
+CREATE INDEX IF NOT EXISTS events_date ON events (date);
+CREATE TABLE IF NOT EXISTS coverage (
+    start REAL NOT NULL,
+    end REAL NOT NULL
+);
+"""
+
+_stores: dict[tuple[Path, int], "EventStore"] = {}
+
+
+def store_path() -> Path:
+    """Where the event store lives."""
+    return CACHE_DIR / EVENT_STORE_FILE
+
+
+class EventStore:
+    """Events covering a contiguous span of time, in an SQLite file.
+
+    A connection is opened per call, so one instance can be shared between
+    threads. Writes run in ``BEGIN IMMEDIATE`` transactions, which serializes
+    them across threads and processes alike.
+
+    Args:
+        path: SQLite file; created with an empty span if missing
+        version: Version of the code computing the events. A store written
+            by another version is emptied, so stale events aren't served.
+    """
+
+    def __init__(self, path: Path, version: int):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Only a new or outdated store needs the write lock, so opening one
+        # doesn't wait for another process extending it
+        with self._connect() as conn:
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+        if current != version:
+            self._reset(version)
+
+    def _reset(self, version: int) -> None:
+        """Create the tables and empty them for ``version``, unless another process just did."""
+        with self._write() as conn:
+            if conn.execute("PRAGMA user_version").fetchone()[0] == version:
+                return
+            for statement in _SCHEMA.split(";"):
+                if statement.strip():
+                    conn.execute(statement)
+            conn.execute("DELETE FROM events")
+            conn.execute("DELETE FROM coverage")
+            conn.execute(f"PRAGMA user_version = {int(version)}")
+
+    @contextmanager
+    def _connect(self):
+        """A connection that commits on success and is always closed."""
+        conn = sqlite3.connect(self.path)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _write(self):
+        """A connection holding the write lock until it commits or rolls back."""
+        conn = sqlite3.connect(self.path, timeout=WRITE_TIMEOUT_SECONDS, isolation_level=None)
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def coverage(self) -> tuple[datetime, datetime] | None:
+        """The span the store holds every event for, in UTC, or None if empty."""
+        with self._connect() as conn:
+            row = conn.execute("SELECT start, end FROM coverage").fetchone()
+        if row is None:
+            return None
+        return datetime.fromtimestamp(row[0], timezone.utc), datetime.fromtimestamp(row[1], timezone.utc)
+
+    def covers(self, start: datetime, end: datetime) -> bool:
+        """Whether every event between start and end is in the store."""
+        span = self.coverage()
+        return span is not None and span[0] <= start and end <= span[1]
+
+    def query(self, start: datetime, end: datetime) -> list[dict] | None:
+        """Get the events from start to end inclusive, ordered by date.
+
+        Returns:
+            Event dicts with UTC dates, or None if the span isn't covered
+        """
+        if not self.covers(start, end):
+            return None
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT date, type, title, description, bodies FROM events "
+                "WHERE date >= ? AND date <= ? ORDER BY date",
+                (start.timestamp(), end.timestamp()),
+            ).fetchall()
+        return [
+            {
+                "type": event_type,
+                "date": datetime.fromtimestamp(date, timezone.utc),
+                "title": title,
+                "description": description,
+                "bodies": json.loads(bodies),
+            }
+            for date, event_type, title, description, bodies in rows
+        ]
+
+    def add(self, events: list[dict], start: datetime, end: datetime) -> None:
+        """Store every event from start to end and widen the covered span.
+
+        The new span must touch or overlap the covered one so coverage stays
+        contiguous. Events already stored are ignored.
+        """
+        with self._write() as conn:
+            self._insert(conn, events, start, end)
+
+    def extend(self, start: datetime, end: datetime, compute: Callable[[datetime, datetime], list[dict]]) -> None:
+        """Widen the covered span to include start to end, computing only what's missing.
+
+        ``compute(start, end)`` returns every event in a missing part. It runs
+        with the write lock held, so a process extending the store at the same
+        time waits and then finds the span already covered.
+        """
+        with self._write() as conn:
+            row = conn.execute("SELECT start, end FROM coverage").fetchone()
+            if row is None:
+                missing = [(start, end)]
+            else:
+                span_start, span_end = (datetime.fromtimestamp(value, timezone.utc) for value in row)
+                missing = []
+                if start < span_start:
+                    missing.append((start, span_start))
+                if span_end < end:
+                    missing.append((span_end, end))
+            for part_start, part_end in missing:
+                self._insert(conn, compute(part_start, part_end), part_start, part_end)
+
+    @staticmethod
+    def _insert(conn: sqlite3.Connection, events: list[dict], start: datetime, end: datetime) -> None:
+        row = conn.execute("SELECT start, end FROM coverage").fetchone()
+        new_start, new_end = start.timestamp(), end.timestamp()
+        if row is not None:
+            if new_start > row[1] or new_end < row[0]:
+                raise ValueError("Events must extend the covered span without a gap")
+            new_start, new_end = min(new_start, row[0]), max(new_end, row[1])
+        conn.executemany(
+            "INSERT OR IGNORE INTO events (date, type, title, description, bodies) VALUES (?, ?, ?, ?, ?)",
+            [
+                (event["date"].timestamp(), event["type"], event["title"], event["description"],
+                 json.dumps(event["bodies"]))
+                for event in events
+            ],
+        )
+        conn.execute("DELETE FROM coverage")
+        conn.execute("INSERT INTO coverage (start, end) VALUES (?, ?)", (new_start, new_end))
+
+    def clear(self) -> None:
+        """Remove every event and the covered span."""
+        with self._write() as conn:
+            conn.execute("DELETE FROM events")
+            conn.execute("DELETE FROM coverage")
+
+
+def get_event_store(version: int, create: bool = False) -> EventStore | None:
+    """Get the store in the cache directory, or None if it hasn't been generated.
+
+    The store is opened once per process and shared by every caller after
+    that. ``create`` makes an empty one if there is none yet.
+    """
+    path = store_path()
+    key = (path, version)
+    if not path.exists():
+        _stores.pop(key, None)
+        if not create:
+            return None
+    store = _stores.get(key)
+    if store is None:
+        store = _stores[key] = EventStore(path, version)
+    return store
+
+
+if __name__ == "__main__":
+    import os
+    import sys
+
+    from skycli.sources.events import update_event_store
+
+    args = [arg for arg in sys.argv[1:] if arg != "--rebuild"]
+    years = int(args[0]) if args else EVENT_STORE_YEARS
+    store = update_event_store(years, rebuild="--rebuild" in sys.argv, workers=os.cpu_count() or 1)
+    span_start, span_end = store.coverage()
+    print(f"Event store {store.path} covers {span_start:%Y-%m-%d} to {span_end:%Y-%m-%d}")
@@ -1,12 +1,14 @@
 """Report orchestration - collects data from all sources."""
 
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 
+from skycli.context import NightContext
+from skycli.result_cache import ResultCache
 from skycli.sources.sun_moon import get_sun_times, get_moon_info
 from skycli.sources.planets import get_visible_planets
 from skycli.sources.iss import get_iss_passes
-from skycli.sources.meteors import get_active_showers
+from skycli.sources.meteors import get_showers_tonight
 from skycli.sources.deep_sky import get_visible_dso
 from skycli.sources.events import get_upcoming_events
 from skycli.sources.weather import get_observing_conditions
@@ -22,6 +24,10 @@ SECTION_MAP = {
     "weather": "weather",
 }
 
+# Sections answered from almanac tables where a location has one. Tables are
+# keyed on exact coordinates, so these bypass the cache's snapping then.
+TABLE_SECTIONS = ("sun", "moon")
+
 
 def _should_include(section: str, only: list[str] | None, exclude: list[str] | None) -> bool:
     """Determine if a section should be included based on filters."""
@@ -32,6 +38,28 @@ def _should_include(section: str, only: list[str] | None, exclude: list[str] | N
     return True
 
 
+def _section(
+    name: str,
+    fetch: Callable[..., Any],
+    lat: float,
+    lon: float,
+    date: datetime,
+    context: NightContext,
+    cache: ResultCache | None,
+) -> Any:
+    """Get a Skyfield-based section, through the cache when it covers it.
+
+    Locations with an almanac table read their sun and moon sections from
+    it directly, which is cheaper than a cache lookup and exact. The table
+    is looked up once per report, through the shared context.
+    """
+    if cache is None or name not in cache:
+        return fetch(lat, lon, date, context=context)
+    if name in TABLE_SECTIONS and context.almanac is not None:
+        return fetch(lat, lon, date, context=context)
+    return cache.get_or_compute(name, lat, lon, date, fetch)
+
+
 def build_report(
     lat: float,
     lon: float,
@@ -39,14 +67,22 @@ def build_report(
     at_time: str | None = None,
     only: list[str] | None = None,
     exclude: list[str] | None = None,
+    cache: ResultCache | None = None,
 ) -> dict[str, Any]:
-    """Build a complete sky report for the given location and time."""
+    """Build a complete sky report for the given location and time.
+
+    With a ``cache``, the sections it has a policy for are computed for the
+    snapped location and time and shared between nearby requests.
+    """
+
+    # Observer and times shared by every Skyfield-based section
+    context = NightContext(lat, lon, date)
 
     # Always get sun times (needed for context)
-    sun_times = get_sun_times(lat, lon, date)
+    sun_times = _section("sun", get_sun_times, lat, lon, date, context, cache)
 
     # Always get moon info (needed for header)
-    moon_info = get_moon_info(lat, lon, date)
+    moon_info = _section("moon", get_moon_info, lat, lon, date, context, cache)
 
     # Build report structure
     report: dict[str, Any] = {
@@ -68,7 +104,7 @@ def build_report(
 
     # Planets
     if _should_include("planets", only, exclude):
-        report["planets"] = get_visible_planets(lat, lon, date)
+        report["planets"] = _section("planets", get_visible_planets, lat, lon, date, context, cache)
 
     # ISS passes
     if _should_include("iss", only, exclude):
@@ -76,11 +112,11 @@ def build_report(
 
     # Meteor showers
     if _should_include("meteors", only, exclude):
-        report["meteors"] = get_active_showers(date)
+        report["meteors"] = _section("meteors", get_showers_tonight, lat, lon, date, context, cache)
 
     # Deep sky objects
     if _should_include("deepsky", only, exclude):
-        report["deep_sky"] = get_visible_dso(lat, lon, date)
+        report["deep_sky"] = _section("deep_sky", get_visible_dso, lat, lon, date, context, cache)
 
     # Astronomical events (next 2 days for tonight report)
     if _should_include("events", only, exclude):
@@ -0,0 +1,138 @@
+"""Location-quantized cache of report sections.
+
+Many requests come from nearly the same place at nearly the same time, and
+for sections like the moon, planets, deep sky objects or sun times a few
+kilometres or minutes make no visible difference. Each cached section snaps
+the coordinates to the centre of a grid cell and the time to the start of a
+time bucket, computes the section once for that snapped input, and serves the
+result to every request falling in the same cell and bucket until it expires.
+
+Every caller gets its own copy of a cached result, so a report that edits
+its sections can't change what later requests are served.
+"""
+
+import copy
+import math
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+
+@dataclass(frozen=True)
+class SectionPolicy:
+    """How one section is quantized and kept.
+
+    Attributes:
+        grid_degrees: Size of the lat/lon grid cells
+        bucket_seconds: Length of the time buckets, counted from the Unix epoch
+        ttl_seconds: How long a result is served after being computed
+        max_entries: Least recently used results beyond this are evicted
+    """
+
+    grid_degrees: float
+    bucket_seconds: int
+    ttl_seconds: float
+    max_entries: int = 1024
+
+
+# Sun times only depend on the UTC date. Moon rise/set do too, and its phase
+# changes by well under a percent an hour. Planet and deep sky altitudes move
+# about a degree in five minutes.
+DEFAULT_POLICIES = {
+    "sun": SectionPolicy(grid_degrees=0.05, bucket_seconds=86400, ttl_seconds=86400),
+    "moon": SectionPolicy(grid_degrees=0.05, bucket_seconds=3600, ttl_seconds=3600),
+    "planets": SectionPolicy(grid_degrees=0.05, bucket_seconds=300, ttl_seconds=300),
+    "deep_sky": SectionPolicy(grid_degrees=0.05, bucket_seconds=300, ttl_seconds=300),
+    "meteors": SectionPolicy(grid_degrees=0.05, bucket_seconds=300, ttl_seconds=300),
+}
+
+CacheKey = tuple[int, int, int]
+
+
+class ResultCache:
+    """Per-section LRU caches of results keyed by grid cell and time bucket.
+
+    Safe to share between threads. Two threads missing on the same key at
+    once may both compute it; the later result wins.
+
+    Args:
+        policies: Policy for each cached section; other sections aren't cached
+        clock: Monotonic time source in seconds, for expiry
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, SectionPolicy] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, OrderedDict[CacheKey, tuple[float, Any]]] = {
+            section: OrderedDict() for section in self.policies
+        }
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, section: str) -> bool:
+        return section in self.policies
+
+    def snap(self, section: str, lat: float, lon: float, date: datetime) -> tuple[CacheKey, float, float, datetime]:
+        """Quantize a request for one section.
+
+        Returns:
+            ``(key, lat, lon, date)``: the cache key plus the cell centre and
+            bucket start the section is computed for
+        """
+        policy = self.policies[section]
+        grid = policy.grid_degrees
+        row = math.floor(lat / grid)
+        col = math.floor(lon / grid)
+        bucket = math.floor(date.timestamp() / policy.bucket_seconds)
+
+        snapped_lat = min(max((row + 0.5) * grid, -90.0), 90.0)
+        snapped_lon = (col + 0.5) * grid
+        snapped_date = datetime.fromtimestamp(bucket * policy.bucket_seconds, timezone.utc)
+        return (row, col, bucket), snapped_lat, snapped_lon, snapped_date
+
+    def get_or_compute(
+        self, section: str, lat: float, lon: float, date: datetime, compute: Callable[[float, float, datetime], Any]
+    ) -> Any:
+        """Get a section's result, computing it at the snapped location and time on a miss.
+
+        Args:
+            section: Section name, one of :attr:`policies`
+            lat: Observer latitude in degrees
+            lon: Observer longitude in degrees
+            date: Requested time, timezone aware
+            compute: Called as ``compute(lat, lon, date)`` with the snapped values
+        """
+        policy = self.policies[section]
+        key, snapped_lat, snapped_lon, snapped_date = self.snap(section, lat, lon, date)
+        entries = self._entries[section]
+
+        with self._lock:
+            entry = entries.get(key)
+            if entry is not None and entry[0] > self._clock():
+                entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        value = compute(snapped_lat, snapped_lon, snapped_date)
+
+        with self._lock:
+            entries[key] = (self._clock() + policy.ttl_seconds, copy.deepcopy(value))
+            entries.move_to_end(key)
+            while len(entries) > policy.max_entries:
+                entries.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            for entries in self._entries.values():
+                entries.clear()
@@ -0,0 +1,171 @@
+"""Rise, set and twilight times from shared altitude searches.
+
+Skyfield's ``almanac`` functions with ``find_discrete`` run an independent
+root search per body and per question. Here altitudes are sampled on one
+time grid, reusing the observer's position and horizon rotation across
+bodies, and every crossing found on the grid is refined together with a
+vectorized false-position (Illinois) iteration.
+"""
+
+from datetime import datetime
+
+import numpy as np
+from skyfield.functions import mxv, to_spherical
+
+# Altitude of the horizon for rise/set, allowing for standard refraction.
+# Matches the default of Skyfield's almanac.risings_and_settings.
+HORIZON_DEGREES = -34.0 / 60.0
+
+GRID_STEP_DAYS = 1.0 / 48       # 30 minute samples
+TOLERANCE_SECONDS = 0.1         # Refinement stops once every root moves less than this
+MAX_ITERATIONS = 20
+
+_SECONDS_PER_DAY = 86400.0
+
+
+def _altitudes(position, rotation, body) -> np.ndarray:
+    """Apparent altitude in degrees of ``body`` seen from ``position``.
+
+    Gravitational deflection is skipped: it is under an arcsecond away from
+    the Sun's limb, a fraction of a second in rise/set time, and costs an
+    ephemeris lookup per deflecting body per sample.
+    """
+    apparent_au = position.observe(body).apparent(deflectors=()).xyz.au
+    _, alt, _ = to_spherical(mxv(rotation, apparent_au))
+    return np.degrees(alt)
+
+
+class SearchGrid:
+    """Observer samples over a search window, shared by every body searched in it.
+
+    Holds the sample times plus the observer's position and horizon rotation
+    at each of them, so searching another body only costs observing it.
+
+    Args:
+        observer: Earth + location vector sum, e.g. ``earth + wgs84.latlon(...)``
+        location: The observer's geographic position
+        t0: Start of the search window
+        t1: End of the search window
+        step_days: Sample spacing, at most; the window is split evenly
+    """
+
+    def __init__(self, observer, location, t0, t1, step_days: float = GRID_STEP_DAYS):
+        steps = max(int(np.ceil((t1.tt - t0.tt) / step_days)), 1)
+        self.observer = observer
+        self.location = location
+        self.times = t0.ts.tt_jd(np.linspace(t0.tt, t1.tt, steps + 1))
+        self.position = observer.at(self.times)
+        self.rotation = location.rotation_at(self.times)
+
+    def altitudes(self, body) -> np.ndarray:
+        """Apparent altitude of ``body`` in degrees at every sample."""
+        return _altitudes(self.position, self.rotation, body)
+
+
+def _refine(grid: SearchGrid, body, altitudes: np.ndarray, levels: np.ndarray):
+    """Locate every crossing of the given altitude levels on a sampled grid.
+
+    Brackets around each sign change are refined together by false position,
+    with the Illinois tweak so a stuck endpoint can't stall it. Each
+    iteration is one vectorized altitude evaluation covering every bracket.
+
+    Args:
+        altitudes: Body altitude in degrees at each grid time
+        levels: Altitude levels in degrees
+
+    Returns:
+        ``(times, level_indices, rising)`` arrays, ordered by time
+    """
+    observer = grid.observer
+    location = grid.location
+    times = grid.times
+    f = altitudes[None, :] - levels[:, None]
+    above = f > 0
+    level_indices, crossings = np.nonzero(above[:, :-1] != above[:, 1:])
+    if len(crossings) == 0:
+        return np.array([]), level_indices, np.array([], dtype=bool)
+
+    offsets = levels[level_indices]
+    a = times.tt[crossings]
+    b = times.tt[crossings + 1]
+    fa = f[level_indices, crossings]
+    fb = f[level_indices, crossings + 1]
+    rising = above[level_indices, crossings + 1]
+    side = np.zeros(len(a), dtype=int)
+    root = (a * fb - b * fa) / (fb - fa)
+
+    ts = times.ts
+    for _ in range(MAX_ITERATIONS):
+        t = ts.tt_jd(root)
+        fr = _altitudes(observer.at(t), location.rotation_at(t), body) - offsets
+        same_as_a = np.sign(fr) == np.sign(fa)
+
+        a = np.where(same_as_a, root, a)
+        fa = np.where(same_as_a, fr, fa)
+        b = np.where(same_as_a, b, root)
+        fb = np.where(same_as_a, fb, fr)
+        # Halve the retained endpoint's value when the same side moves twice
+        fb = np.where(same_as_a & (side == 1), fb / 2, fb)
+        fa = np.where(~same_as_a & (side == -1), fa / 2, fa)
+        side = np.where(same_as_a, 1, -1)
+
+        new_root = np.where(fr == 0, root, (a * fb - b * fa) / (fb - fa))
+        converged = np.all(np.abs(new_root - root) * _SECONDS_PER_DAY < TOLERANCE_SECONDS)
+        root = new_root
+        if converged:
+            break
+
+    order = np.argsort(root, kind="stable")
+    return root[order], level_indices[order], rising[order]
+
+
+def find_altitude_crossings(grid: SearchGrid, body, levels_degrees) -> list[tuple[datetime, int, bool]]:
+    """Find when one body crosses each of several altitude levels.
+
+    All levels share one sampling of the body's altitude and one refinement,
+    e.g. sunrise/sunset and the civil, nautical and astronomical twilight
+    boundaries in a single search.
+
+    Args:
+        grid: Observer samples over the search window
+        body: Body handle
+        levels_degrees: Altitude levels in degrees
+
+    Returns:
+        Time-ordered ``(utc_datetime, level_index, rising)`` tuples, where
+        ``level_index`` indexes ``levels_degrees``
+    """
+    roots, level_indices, rising = _refine(
+        grid, body, grid.altitudes(body), np.asarray(levels_degrees, dtype=float)
+    )
+    if len(roots) == 0:
+        return []
+    times = grid.times.ts.tt_jd(roots).utc_datetime()
+    return [(dt, int(level), bool(up)) for dt, level, up in zip(times, level_indices, rising)]
+
+
+def find_risings_and_settings(
+    grid: SearchGrid, bodies: dict, horizon_degrees: float = HORIZON_DEGREES
+) -> dict[str, list[tuple[datetime, bool]]]:
+    """Find when each body crosses the horizon within the grid's window.
+
+    Args:
+        grid: Observer samples over the search window
+        bodies: Body handles by name
+        horizon_degrees: Altitude treated as the horizon
+
+    Returns:
+        For each body name, a time-ordered list of ``(utc_datetime, is_rise)``
+    """
+    levels = np.array([horizon_degrees])
+
+    results = {}
+    for name, body in bodies.items():
+        roots, _, rising = _refine(grid, body, grid.altitudes(body), levels)
+        if len(roots) == 0:
+            results[name] = []
+            continue
+        times = grid.times.ts.tt_jd(roots).utc_datetime()
+        results[name] = [(dt, bool(up)) for dt, up in zip(times, rising)]
+
+    return results
@@ -1,16 +1,35 @@
 """Deep sky object visibility calculations."""
 
-import json
+import heapq
 from datetime import datetime
+from functools import partial
 from typing import TypedDict
 
-from skyfield.api import Star, load, wgs84
+import numpy as np
+from skyfield.api import Star
 
-from skycli.data import DATA_DIR
+from skycli.context import NightContext
+from skycli.data.catalog import get_catalog
 
 # Deep sky object visibility constants
 MIN_ALTITUDE_DEGREES = 20.0  # Minimum altitude for DSO visibility
 DEFAULT_DSO_LIMIT = 5        # Default number of objects to return
+FIRST_BATCH_FACTOR = 4       # First early-exit batch covers limit * this many candidates
+
+# Worst-case angular error of precision="fast" against the full Skyfield
+# pipeline. The closed-form path skips aberration (up to ~20.5") and light
+# deflection; precession and nutation are still applied.
+FAST_MAX_ERROR_ARCSEC = 30.0
+
+# Result orderings: key function and whether larger values come first
+SORT_KEYS = {
+    "mag": (lambda o: o["mag"], False),
+    "altitude": (lambda o: o["altitude"], True),
+    "size": (lambda o: o["size"], True),
+}
+
+# Ways of computing altitudes: Skyfield's full pipeline or the closed form
+PRECISIONS = ("full", "fast")
 
 
 class DSOInfo(TypedDict):
@@ -27,26 +46,44 @@ class DSOInfo(TypedDict):
     azimuth: float
 
 
-_ephemeris = None
-_timescale = None
+def _altaz(position, objects, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Altitude and azimuth in degrees for a batch of catalog objects.
 
+    One array-valued Star covers the whole batch, so a single
+    observe/apparent/altaz pass positions them all at once.
+    """
+    # RA is in degrees, need to convert to hours for Skyfield
+    dsos = Star(ra_hours=objects.ra[indices] / 15.0, dec_degrees=objects.dec[indices])
+    alt, az, _ = position.observe(dsos).apparent().altaz()
+    return alt.degrees, az.degrees
 
-def _get_ephemeris():
-    """Get or load the ephemeris data."""
-    global _ephemeris, _timescale
-    if _ephemeris is None:
-        _ephemeris = load("de421.bsp")
-        _timescale = load.timescale()
-    return _ephemeris, _timescale
 
+def _fast_altaz(t, lat: float, lon: float, objects, indices: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Altitude and azimuth in degrees from sidereal time and a rotation.
 
-def _load_catalog() -> list[dict]:
-    """Load deep sky object catalog."""
-    with open(DATA_DIR / "messier.json") as f:
-        return json.load(f)
+    Catalog positions are rotated to the true equator and equinox of date,
+    then to the horizon frame using the local apparent sidereal time. Pure
+    NumPy, accurate to FAST_MAX_ERROR_ARCSEC.
+    """
+    ra = np.radians(objects.ra[indices])
+    dec = np.radians(objects.dec[indices])
+    unit = np.array([np.cos(dec) * np.cos(ra), np.cos(dec) * np.sin(ra), np.sin(dec)])
+    x, y, z = t.M @ unit
 
+    dec = np.arcsin(np.clip(z, -1.0, 1.0))
+    hour_angle = np.radians((t.gast + lon / 15.0) * 15.0) - np.arctan2(y, x)
+    phi = np.radians(lat)
 
-def get_visible_dso(lat: float, lon: float, date: datetime, limit: int = DEFAULT_DSO_LIMIT, min_altitude: float = MIN_ALTITUDE_DEGREES) -> list[DSOInfo]:
+    sin_alt = np.sin(phi) * np.sin(dec) + np.cos(phi) * np.cos(dec) * np.cos(hour_angle)
+    altitude = np.degrees(np.arcsin(np.clip(sin_alt, -1.0, 1.0)))
+    azimuth = np.degrees(np.arctan2(
+        -np.cos(dec) * np.sin(hour_angle),
+        np.sin(dec) * np.cos(phi) - np.cos(dec) * np.cos(hour_angle) * np.sin(phi),
+    )) % 360.0
+    return altitude, azimuth
+
+
+def get_visible_dso(lat: float, lon: float, date: datetime, limit: int = DEFAULT_DSO_LIMIT, min_altitude: float = MIN_ALTITUDE_DEGREES, catalog: str = "messier", sort_by: str = "mag", precision: str = "full", context: NightContext | None = None) -> list[DSOInfo]:
     """Get deep sky objects visible at the given location and time.
 
     Args:
@@ -55,47 +92,78 @@ def get_visible_dso(lat: float, lon: float, date: datetime, limit: int = DEFAULT
         date: Date and time for observation
         limit: Maximum number of objects to return (default 5)
         min_altitude: Minimum altitude in degrees for visibility (default 20.0)
+        catalog: Name of the catalog to search (default "messier")
+        sort_by: "mag" (brightest first), "altitude" (highest first) or
+            "size" (largest first)
+        precision: "full" runs Skyfield's observe/apparent/altaz pipeline;
+            "fast" uses a closed-form sidereal-time rotation accurate to
+            FAST_MAX_ERROR_ARCSEC (30"), plenty for an altitude cutoff
+        context: Shared per-report observer and times (built if omitted)
 
     Returns:
-        List of visible deep sky objects, sorted by brightness (magnitude)
+        List of visible deep sky objects, sorted by ``sort_by``
     """
-    eph, ts = _get_ephemeris()
+    if sort_by not in SORT_KEYS:
+        raise ValueError(f"Unknown sort_by {sort_by!r}. Valid: {', '.join(SORT_KEYS)}")
+    if precision not in PRECISIONS:
+        raise ValueError(f"Unknown precision {precision!r}. Valid: {', '.join(PRECISIONS)}")
+    key, reverse = SORT_KEYS[sort_by]
+    context = context or NightContext(lat, lon, date)
+    t = context.t
+
+    objects = get_catalog(catalog)
+    if precision == "fast":
+        altaz = partial(_fast_altaz, t, lat, lon, objects)
+    else:
+        altaz = partial(_altaz, context.position, objects)
+
+    # Drop objects in parts of the sky that can't be high enough right now
+    # before doing any astrometry
+    lst_hours = (t.gast + lon / 15.0) % 24.0
+    candidates = objects.candidates(lat, lst_hours, min_altitude)
+
+    # (catalog index, altitude, azimuth) for each object above the cutoff
+    found = []
+    if sort_by == "mag":
+        # Candidates are already brightest first, so the first `limit` that
+        # clear the cutoff are the answer. Work through them in growing
+        # batches and stop as soon as enough have turned up.
+        start = 0
+        batch = max(limit * FIRST_BATCH_FACTOR, 1)
+        while start < len(candidates) and len(found) < limit:
+            indices = candidates[start:start + batch]
+            altitudes, azimuths = altaz(indices)
+            for i in np.flatnonzero(altitudes >= min_altitude):
+                found.append((indices[i], altitudes[i], azimuths[i]))
+            start += batch
+            batch *= 2
+        found = found[:limit]
+    elif len(candidates):
+        altitudes, azimuths = altaz(candidates)
+        found = [
+            (candidates[i], altitudes[i], azimuths[i])
+            for i in np.flatnonzero(altitudes >= min_altitude)
+        ]
 
-    location = wgs84.latlon(lat, lon)
-    observer = eph["Earth"] + location
-    t = ts.utc(date.year, date.month, date.day, date.hour, date.minute)
-
-    catalog = _load_catalog()
     visible = []
-
-    for obj in catalog:
-        # Create a star object at the DSO's coordinates
-        # RA is in degrees, need to convert to hours for Skyfield
-        ra_hours = obj["ra"] / 15.0
-        dso = Star(ra_hours=ra_hours, dec_degrees=obj["dec"])
-
-        # Calculate altitude and azimuth
-        astrometric = observer.at(t).observe(dso)
-        apparent = astrometric.apparent()
-        alt, az, _ = apparent.altaz()
-
-        altitude = alt.degrees
-        azimuth = az.degrees
-
-        if altitude >= min_altitude:
-            visible.append(DSOInfo(
-                id=obj["id"],
-                name=obj["name"],
-                constellation=obj["constellation"],
-                mag=obj["mag"],
-                size=obj["size"],
-                type=obj["type"],
-                equipment=obj["equipment"],
-                tip=obj["tip"],
-                altitude=round(altitude, 0),
-                azimuth=round(azimuth, 0),
-            ))
-
-    # Sort by magnitude (brightest first), then limit
-    visible.sort(key=lambda o: o["mag"])
-    return visible[:limit]
+    for index, altitude, azimuth in found:
+        obj = objects.record(index)
+        visible.append(DSOInfo(
+            id=obj["id"],
+            name=obj["name"],
+            constellation=obj["constellation"],
+            mag=obj["mag"],
+            size=obj["size"],
+            type=obj["type"],
+            equipment=obj["equipment"],
+            tip=obj["tip"],
+            altitude=round(float(altitude), 0),
+            azimuth=round(float(azimuth), 0),
+        ))
+
+    if sort_by != "mag":
+        # Heap-based top-k; ties keep magnitude order
+        select = heapq.nlargest if reverse else heapq.nsmallest
+        visible = select(limit, visible, key=key)
+
+    return visible
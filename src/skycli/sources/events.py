@@ -1,10 +1,18 @@
 """Astronomical event calculations using Astronomy Engine."""
 
+import heapq
 import logging
-from datetime import datetime, timedelta
-from typing import TypedDict
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Iterator, TypedDict, TypeVar
 
 import astronomy
+import numpy as np
+
+from skycli.event_store import EVENT_STORE_YEARS, EventStore, get_event_store
+from skycli.sources.meteors import next_shower_peak
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +20,9 @@ logger = logging.getLogger(__name__)
 class AstroEvent(TypedDict):
     """Information about an astronomical event."""
 
-    type: str  # "conjunction", "opposition", "moon_phase", "equinox", "solstice"
+    # "conjunction", "opposition", "moon_phase", "equinox", "solstice",
+    # "eclipse", "elongation", "perihelion", "meteor"
+    type: str
     date: datetime
     title: str
     description: str
@@ -35,6 +45,14 @@ FULL_MOON_NAMES = {
     12: "Cold Moon",
 }
 
+# Title and description for the quarters other than Full Moon, which is
+# named by month
+MOON_QUARTERS = {
+    0: ("New Moon", "Best time for deep sky observing"),
+    1: ("First Quarter Moon", "Half lit, setting around midnight"),
+    3: ("Last Quarter Moon", "Half lit, rising around midnight"),
+}
+
 PLANETS = [
     astronomy.Body.Mercury,
     astronomy.Body.Venus,
@@ -63,167 +81,339 @@ OUTER_PLANETS = [
     astronomy.Body.Neptune,
 ]
 
+INNER_PLANETS = [astronomy.Body.Mercury, astronomy.Body.Venus]
+
+# Bodies whose perihelion passages are reported: Earth, then the planets
+PERIHELION_BODIES = [astronomy.Body.Earth, *PLANETS]
+
 CONJUNCTION_THRESHOLD = 5.0  # degrees
 
+# Conjunctions are found by scanning separations at this step, then refining
+# each promising local minimum to the instant of closest approach
+CONJUNCTION_SCAN_STEP_DAYS = 0.5
+CONJUNCTION_TOLERANCE_SECONDS = 1.0
+# Upper bounds on how fast a pair's separation changes, in degrees per day.
+# A sampled minimum can be at most rate * step above the true minimum.
+MOON_PAIR_RATE = 16.0
+PLANET_PAIR_RATE = 4.0
+
+_GOLDEN = (np.sqrt(5.0) - 1.0) / 2.0
+
+# Bump when the finders change, so stored events are recomputed
+EVENTS_VERSION = 6
+# Open-ended conjunction streams search this many days at a time
+CONJUNCTION_CHUNK_DAYS = 14
+
+# Years of equinoxes and solstices kept in memory
+SEASONS_CACHE_SIZE = 64
+
+# Bodies checked for conjunctions: the planets, then the Moon
+CONJUNCTION_BODIES = [*PLANETS, astronomy.Body.Moon]
+_MOON_INDEX = len(PLANETS)
+
+# Index pairs into CONJUNCTION_BODIES, planet-Moon pairs first, then
+# planet-planet pairs without duplicates
+CONJUNCTION_PAIRS = [(i, _MOON_INDEX) for i in range(len(PLANETS))] + [
+    (i, j) for i in range(len(PLANETS)) for j in range(i + 1, len(PLANETS))
+]
 
-def _find_moon_phases(start: datetime, days: int) -> list[AstroEvent]:
-    """Find Full Moon and New Moon events in the window."""
-    events = []
-    end = start + timedelta(days=days)
 
+# Memoized searches, shared by every request in the process. Each periodic
+# search (a planet's next opposition, the next eclipse, ...) keeps its next
+# occurrence as of now, keyed by search and body, so the entries are bounded
+# by the number of searches. An entry answers any search starting between
+# where it was first searched from and the occurrence, and is dropped once
+# the occurrence has passed. Seasons are kept by year, least recently used
+# first out.
+_upcoming: dict[tuple[str, str], tuple[float, float, object]] = {}
+_seasons: OrderedDict[int, astronomy.SeasonInfo] = OrderedDict()
+_memo_lock = threading.Lock()
+
+_Found = TypeVar("_Found")
+
+
+def _next_occurrence(
+    key: tuple[str, str],
+    after: astronomy.Time,
+    search: Callable[[astronomy.Time], _Found],
+    when: Callable[[_Found], astronomy.Time],
+) -> _Found:
+    """Run ``search(after)``, or reuse the upcoming occurrence it would find.
+
+    Args:
+        key: Names the search and body, e.g. ``("opposition", "Mars")``
+        after: Time to search from
+        search: Finds the first occurrence after a time
+        when: Time of a search result
+    """
+    now = astronomy.Time.Now().ut
+    with _memo_lock:
+        entry = _upcoming.get(key)
+        if entry is not None and entry[1] < now:
+            del _upcoming[key]
+        elif entry is not None and entry[0] <= after.ut < entry[1]:
+            return entry[2]
+
+    found = search(after)
+    found_ut = when(found).ut
+    # Only the occurrence that is next as of now is kept
+    if after.ut <= now <= found_ut:
+        with _memo_lock:
+            entry = _upcoming.get(key)
+            if entry is not None and entry[1] == found_ut:
+                _upcoming[key] = (min(entry[0], after.ut), found_ut, entry[2])
+            else:
+                _upcoming[key] = (after.ut, found_ut, found)
+    return found
+
+
+def _seasons_of(year: int) -> astronomy.SeasonInfo:
+    """Equinoxes and solstices of one year, memoized."""
+    with _memo_lock:
+        if year in _seasons:
+            _seasons.move_to_end(year)
+            return _seasons[year]
+    seasons = astronomy.Seasons(year)
+    with _memo_lock:
+        _seasons[year] = seasons
+        if len(_seasons) > SEASONS_CACHE_SIZE:
+            _seasons.popitem(last=False)
+    return seasons
+
+
+def _moon_phase_event(quarter: int, event_date: datetime) -> AstroEvent:
+    """Describe one lunar quarter (0 new, 1 first quarter, 2 full, 3 last quarter)."""
+    if quarter == 2:
+        name = FULL_MOON_NAMES.get(event_date.month, "Full Moon")
+        title, description = f"Full Moon ({name})", "Moon fully illuminated"
+    else:
+        title, description = MOON_QUARTERS[quarter]
+    return AstroEvent(
+        type="moon_phase",
+        date=event_date,
+        title=title,
+        description=description,
+        bodies=["Moon"],
+    )
+
+
+def _iter_moon_phases(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield every New Moon, First Quarter, Full Moon and Last Quarter from start on.
+
+    Walks the quarters in order: after the first search, each next quarter
+    is a short search starting from the previous one.
+    """
     start_time = astronomy.Time.Make(
         start.year, start.month, start.day, start.hour, start.minute, 0
     )
 
-    # Search for Full Moon (phase 180°)
-    full_moon = astronomy.SearchMoonPhase(180, start_time, days)
-    if full_moon is not None:
-        # full_moon.Utc() returns a datetime object
-        event_date = full_moon.Utc().replace(tzinfo=start.tzinfo)
-        if event_date <= end:
-            name = FULL_MOON_NAMES.get(event_date.month, "Full Moon")
-            events.append(
-                AstroEvent(
-                    type="moon_phase",
-                    date=event_date,
-                    title=f"Full Moon ({name})",
-                    description="Moon fully illuminated",
-                    bodies=["Moon"],
-                )
-            )
+    quarter = astronomy.SearchMoonQuarter(start_time)
+    while True:
+        event_date = quarter.time.Utc().replace(tzinfo=start.tzinfo)
+        if end is not None and event_date > end:
+            return
+        yield _moon_phase_event(quarter.quarter, event_date)
+        quarter = astronomy.NextMoonQuarter(quarter)
 
-    # Search for New Moon (phase 0°)
-    new_moon = astronomy.SearchMoonPhase(0, start_time, days)
-    if new_moon is not None:
-        # new_moon.Utc() returns a datetime object
-        event_date = new_moon.Utc().replace(tzinfo=start.tzinfo)
-        if event_date <= end:
-            events.append(
-                AstroEvent(
-                    type="moon_phase",
-                    date=event_date,
-                    title="New Moon",
-                    description="Best time for deep sky observing",
-                    bodies=["Moon"],
-                )
-            )
 
-    return events
+def _find_moon_phases(start: datetime, days: int) -> list[AstroEvent]:
+    """Find every lunar quarter in the window."""
+    return list(_iter_moon_phases(start, start + timedelta(days=days)))
+
+
+def _body_directions(times: list[astronomy.Time]) -> np.ndarray:
+    """Geocentric unit vectors of every conjunction body at every sample.
+
+    Each body's vector is computed once per sample, however many pairs it
+    appears in.
+
+    Returns:
+        Array of shape ``(len(times), len(CONJUNCTION_BODIES), 3)``
+    """
+    vectors = np.empty((len(times), len(CONJUNCTION_BODIES), 3))
+    for i, time in enumerate(times):
+        for j, body in enumerate(CONJUNCTION_BODIES):
+            vector = astronomy.GeoVector(body, time, True)
+            vectors[i, j] = (vector.x, vector.y, vector.z)
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True)
+
+
+def _separations(directions: np.ndarray) -> np.ndarray:
+    """Pairwise angles in degrees between the bodies at each sample.
+
+    Returns:
+        Array of shape ``(samples, bodies, bodies)``
+    """
+    cosines = np.einsum("tid,tjd->tij", directions, directions)
+    return np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+
+
+def _body_name(index: int) -> str:
+    return "Moon" if index == _MOON_INDEX else PLANET_NAMES[CONJUNCTION_BODIES[index]]
+
+
+def _separation(i: int, j: int, time: astronomy.Time) -> float:
+    """Angle in degrees between two conjunction bodies at one instant."""
+    return astronomy.AngleBetween(
+        astronomy.GeoVector(CONJUNCTION_BODIES[i], time, True),
+        astronomy.GeoVector(CONJUNCTION_BODIES[j], time, True),
+    )
 
 
-def _angle_between(
-    body1: astronomy.Body, body2: astronomy.Body, time: astronomy.Time
-) -> float:
-    """Calculate angular separation between two bodies."""
-    vec1 = astronomy.GeoVector(body1, time, True)
-    vec2 = astronomy.GeoVector(body2, time, True)
-    return astronomy.AngleBetween(vec1, vec2)
+def _closest_approach(i: int, j: int, lo: float, hi: float) -> tuple[astronomy.Time, float]:
+    """Golden-section search for a pair's minimum separation between two UT times.
+
+    Args:
+        i, j: Indices into CONJUNCTION_BODIES
+        lo, hi: Bracket in UT days, containing a single minimum
+
+    Returns:
+        ``(time, separation_degrees)`` at the minimum
+    """
+    tolerance = CONJUNCTION_TOLERANCE_SECONDS / 86400.0
+    x1 = hi - _GOLDEN * (hi - lo)
+    x2 = lo + _GOLDEN * (hi - lo)
+    f1 = _separation(i, j, astronomy.Time(x1))
+    f2 = _separation(i, j, astronomy.Time(x2))
+    while hi - lo > tolerance:
+        if f1 < f2:
+            hi, x2, f2 = x2, x1, f1
+            x1 = hi - _GOLDEN * (hi - lo)
+            f1 = _separation(i, j, astronomy.Time(x1))
+        else:
+            lo, x1, f1 = x1, x2, f2
+            x2 = lo + _GOLDEN * (hi - lo)
+            f2 = _separation(i, j, astronomy.Time(x2))
+    time = astronomy.Time((lo + hi) / 2)
+    return time, _separation(i, j, time)
 
 
 def _find_conjunctions(start: datetime, days: int) -> list[AstroEvent]:
-    """Find conjunctions between planets and Moon."""
-    events = []
+    """Find conjunctions between planets and Moon.
+
+    A coarse scan samples every pair's separation every half day, using one
+    vector per body per sample and one angle matrix. Local minima that could
+    dip under the threshold between samples are then refined by
+    golden-section search, and each close approach is reported once, at its
+    instant of minimum separation.
+    """
+    if days <= 0:
+        return []
     start_time = astronomy.Time.Make(
         start.year, start.month, start.day, start.hour, start.minute, 0
     )
+    end_ut = start_time.ut + days
 
-    # Check each day for close approaches
-    for day_offset in range(days):
-        check_date = start + timedelta(days=day_offset)
-        check_time = astronomy.Time.Make(
-            check_date.year, check_date.month, check_date.day, 12, 0, 0
-        )
+    # One sample either side of the window so minima near its edges are bracketed
+    steps = int(np.ceil(days / CONJUNCTION_SCAN_STEP_DAYS))
+    offsets = np.arange(-1, steps + 2) * CONJUNCTION_SCAN_STEP_DAYS
+    sample_times = [start_time.AddDays(float(offset)) for offset in offsets]
+    separations = _separations(_body_directions(sample_times))
 
-        # Planet-Moon conjunctions
-        for planet in PLANETS:
-            angle = _angle_between(planet, astronomy.Body.Moon, check_time)
-            if angle <= CONJUNCTION_THRESHOLD:
-                event_date = check_time.Utc().replace(tzinfo=start.tzinfo)
-                planet_name = PLANET_NAMES[planet]
-                events.append(
-                    AstroEvent(
-                        type="conjunction",
-                        date=event_date,
-                        title=f"{planet_name}-Moon Conjunction",
-                        description=f"{planet_name} {angle:.1f}° from Moon",
-                        bodies=[planet_name, "Moon"],
-                    )
+    events = []
+    for i, j in CONJUNCTION_PAIRS:
+        rate = MOON_PAIR_RATE if j == _MOON_INDEX else PLANET_PAIR_RATE
+        series = separations[:, i, j]
+        interior = np.arange(1, len(series) - 1)
+        is_minimum = (series[interior] <= series[interior - 1]) & (series[interior] < series[interior + 1])
+        promising = series[interior] - rate * CONJUNCTION_SCAN_STEP_DAYS <= CONJUNCTION_THRESHOLD
+
+        for k in interior[is_minimum & promising]:
+            time, angle = _closest_approach(i, j, sample_times[k - 1].ut, sample_times[k + 1].ut)
+            if angle > CONJUNCTION_THRESHOLD or not start_time.ut <= time.ut <= end_ut:
+                continue
+            name1 = _body_name(i)
+            name2 = _body_name(j)
+            events.append(
+                AstroEvent(
+                    type="conjunction",
+                    date=time.Utc().replace(tzinfo=start.tzinfo),
+                    title=f"{name1}-{name2} Conjunction",
+                    description=f"{name1} {angle:.1f}° from {name2}",
+                    bodies=[name1, name2],
                 )
+            )
 
-        # Planet-Planet conjunctions (avoid duplicates)
-        for i, planet1 in enumerate(PLANETS):
-            for planet2 in PLANETS[i + 1 :]:
-                angle = _angle_between(planet1, planet2, check_time)
-                if angle <= CONJUNCTION_THRESHOLD:
-                    event_date = check_time.Utc().replace(tzinfo=start.tzinfo)
-                    name1 = PLANET_NAMES[planet1]
-                    name2 = PLANET_NAMES[planet2]
-                    events.append(
-                        AstroEvent(
-                            type="conjunction",
-                            date=event_date,
-                            title=f"{name1}-{name2} Conjunction",
-                            description=f"{name1} {angle:.1f}° from {name2}",
-                            bodies=[name1, name2],
-                        )
-                    )
-
-    # Deduplicate events on same day for same bodies
-    seen = set()
-    unique_events = []
-    for event in events:
-        key = (event["date"].date(), tuple(sorted(event["bodies"])))
-        if key not in seen:
-            seen.add(key)
-            unique_events.append(event)
-
-    return unique_events
+    return sorted(events, key=lambda event: event["date"])
 
 
-def _find_oppositions(start: datetime, days: int) -> list[AstroEvent]:
-    """Find planetary oppositions (outer planets only)."""
-    events = []
+def _iter_conjunctions(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield conjunctions from start on, searching one chunk of days at a time."""
+    chunk_start = start
+    while end is None or chunk_start <= end:
+        chunk_end = chunk_start + timedelta(days=CONJUNCTION_CHUNK_DAYS)
+        last = end is not None and chunk_end >= end
+        days = int(np.ceil((end - chunk_start) / timedelta(days=1))) if last else CONJUNCTION_CHUNK_DAYS
+        for event in _find_conjunctions(chunk_start, days):
+            if event["date"] < chunk_start:
+                continue
+            if (last and event["date"] <= end) or (not last and event["date"] < chunk_end):
+                yield event
+        if last:
+            return
+        chunk_start = chunk_end
+
+
+def _iter_oppositions(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield planetary oppositions (outer planets only) from start on.
+
+    Keeps each planet's next opposition in a heap; after yielding one, that
+    planet's following opposition is searched from just past it.
+    """
     start_time = astronomy.Time.Make(
         start.year, start.month, start.day, start.hour, start.minute, 0
     )
 
-    for planet in OUTER_PLANETS:
+    def next_opposition(planet: astronomy.Body, after: astronomy.Time) -> astronomy.Time | None:
         try:
-            opposition = astronomy.SearchRelativeLongitude(planet, 180, start_time)
-            if opposition is not None:
-                # opposition.Utc() returns a datetime object
-                event_date = opposition.Utc().replace(tzinfo=start.tzinfo)
-
-                # Check if within our window
-                end_date = start + timedelta(days=days)
-                if start <= event_date <= end_date:
-                    planet_name = PLANET_NAMES[planet]
-                    events.append(
-                        AstroEvent(
-                            type="opposition",
-                            date=event_date,
-                            title=f"{planet_name} at Opposition",
-                            description=f"{planet_name} opposite the Sun - best viewing",
-                            bodies=[planet_name],
-                        )
-                    )
+            return _next_occurrence(
+                ("opposition", PLANET_NAMES[planet]),
+                after,
+                # Relative longitude 0: the Earth passes between the Sun and the planet
+                lambda time: astronomy.SearchRelativeLongitude(planet, 0, time),
+                lambda opposition: opposition,
+            )
         except Exception as e:
             logger.warning(f"Error calculating opposition for {PLANET_NAMES[planet]}: {e}")
-            continue
-
-    return events
+            return None
+
+    upcoming = []
+    for order, planet in enumerate(OUTER_PLANETS):
+        opposition = next_opposition(planet, start_time)
+        if opposition is not None:
+            heapq.heappush(upcoming, (opposition.ut, order, opposition))
+
+    while upcoming:
+        _, order, opposition = heapq.heappop(upcoming)
+        # opposition.Utc() returns a datetime object
+        event_date = opposition.Utc().replace(tzinfo=start.tzinfo)
+        if end is not None and event_date > end:
+            return
+        planet = OUTER_PLANETS[order]
+        if start <= event_date:
+            planet_name = PLANET_NAMES[planet]
+            yield AstroEvent(
+                type="opposition",
+                date=event_date,
+                title=f"{planet_name} at Opposition",
+                description=f"{planet_name} opposite the Sun - best viewing",
+                bodies=[planet_name],
+            )
+        following = next_opposition(planet, opposition.AddDays(1))
+        if following is not None:
+            heapq.heappush(upcoming, (following.ut, order, following))
 
 
-def _find_seasonal_events(start: datetime, days: int) -> list[AstroEvent]:
-    """Find equinoxes and solstices in the window."""
-    events = []
-    end = start + timedelta(days=days)
+def _find_oppositions(start: datetime, days: int) -> list[AstroEvent]:
+    """Find planetary oppositions (outer planets only) in the window."""
+    return list(_iter_oppositions(start, start + timedelta(days=days)))
 
-    # Get seasons for the year(s) we're interested in
-    years_to_check = {start.year, end.year}
 
-    for year in years_to_check:
-        seasons = astronomy.Seasons(year)
+def _iter_seasonal_events(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield equinoxes and solstices from start on, a year at a time."""
+    year = start.year
+    while end is None or year <= end.year:
+        seasons = _seasons_of(year)
 
         seasonal_events = [
             (
@@ -255,25 +445,356 @@ def _find_seasonal_events(start: datetime, days: int) -> list[AstroEvent]:
         for time, event_type, title, description in seasonal_events:
             event_date = time.Utc().replace(tzinfo=start.tzinfo)
 
-            if start <= event_date <= end:
-                events.append(
-                    AstroEvent(
-                        type=event_type,
-                        date=event_date,
-                        title=title,
-                        description=description,
-                        bodies=["Sun"],
-                    )
+            if end is not None and event_date > end:
+                return
+            if start <= event_date:
+                yield AstroEvent(
+                    type=event_type,
+                    date=event_date,
+                    title=title,
+                    description=description,
+                    bodies=["Sun"],
+                )
+        year += 1
+
+
+def _find_seasonal_events(start: datetime, days: int) -> list[AstroEvent]:
+    """Find equinoxes and solstices in the window."""
+    return list(_iter_seasonal_events(start, start + timedelta(days=days)))
+
+
+def _lunar_eclipse_event(eclipse: astronomy.LunarEclipseInfo, event_date: datetime) -> AstroEvent:
+    kind = eclipse.kind.name
+    if eclipse.kind == astronomy.EclipseKind.Total:
+        description = f"Moon fully in Earth's shadow for {2 * eclipse.sd_total:.0f} minutes"
+    elif eclipse.kind == astronomy.EclipseKind.Partial:
+        description = f"{eclipse.obscuration:.0%} of the Moon in Earth's shadow"
+    else:
+        description = "Moon dims slightly in Earth's penumbra"
+    return AstroEvent(
+        type="eclipse",
+        date=event_date,
+        title=f"{kind} Lunar Eclipse",
+        description=description,
+        bodies=["Moon"],
+    )
+
+
+def _solar_eclipse_event(eclipse: astronomy.GlobalSolarEclipseInfo, event_date: datetime) -> AstroEvent:
+    kind = eclipse.kind.name
+    if eclipse.kind == astronomy.EclipseKind.Partial:
+        description = "Partial eclipse seen from high latitudes"
+    else:
+        description = f"Greatest eclipse at {eclipse.latitude:.1f}°, {eclipse.longitude:.1f}°"
+    return AstroEvent(
+        type="eclipse",
+        date=event_date,
+        title=f"{kind} Solar Eclipse",
+        description=description,
+        bodies=["Sun", "Moon"],
+    )
+
+
+def _iter_eclipses(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield lunar and solar eclipses from start on, at their peaks.
+
+    Solar eclipses are global: the time and place of greatest eclipse
+    anywhere on Earth.
+    """
+    start_time = astronomy.Time.Make(
+        start.year, start.month, start.day, start.hour, start.minute, 0
+    )
+
+    def lunar() -> Iterator[AstroEvent]:
+        eclipse = _next_occurrence(
+            ("eclipse", "lunar"), start_time, astronomy.SearchLunarEclipse, lambda eclipse: eclipse.peak
+        )
+        while True:
+            yield _lunar_eclipse_event(eclipse, eclipse.peak.Utc().replace(tzinfo=start.tzinfo))
+            eclipse = astronomy.NextLunarEclipse(eclipse.peak)
+
+    def solar() -> Iterator[AstroEvent]:
+        eclipse = _next_occurrence(
+            ("eclipse", "solar"), start_time, astronomy.SearchGlobalSolarEclipse, lambda eclipse: eclipse.peak
+        )
+        while True:
+            yield _solar_eclipse_event(eclipse, eclipse.peak.Utc().replace(tzinfo=start.tzinfo))
+            eclipse = astronomy.NextGlobalSolarEclipse(eclipse.peak)
+
+    for event in heapq.merge(lunar(), solar(), key=lambda event: event["date"]):
+        if end is not None and event["date"] > end:
+            return
+        if start <= event["date"]:
+            yield event
+
+
+def _iter_elongations(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield greatest elongations of Mercury and Venus from start on."""
+    start_time = astronomy.Time.Make(
+        start.year, start.month, start.day, start.hour, start.minute, 0
+    )
+
+    def elongations(planet: astronomy.Body) -> Iterator[AstroEvent]:
+        planet_name = PLANET_NAMES[planet]
+        elongation = _next_occurrence(
+            ("elongation", planet_name),
+            start_time,
+            lambda time: astronomy.SearchMaxElongation(planet, time),
+            lambda elongation: elongation.time,
+        )
+        while True:
+            side = "Eastern" if elongation.visibility == astronomy.Visibility.Evening else "Western"
+            sky = elongation.visibility.name.lower()
+            yield AstroEvent(
+                type="elongation",
+                date=elongation.time.Utc().replace(tzinfo=start.tzinfo),
+                title=f"{planet_name} at Greatest {side} Elongation",
+                description=f"{planet_name} {elongation.elongation:.1f}° from the Sun in the {sky} sky",
+                bodies=[planet_name],
+            )
+            elongation = _next_occurrence(
+                ("elongation", planet_name),
+                elongation.time.AddDays(1),
+                lambda time: astronomy.SearchMaxElongation(planet, time),
+                lambda elongation: elongation.time,
+            )
+
+    streams = [elongations(planet) for planet in INNER_PLANETS]
+    for event in heapq.merge(*streams, key=lambda event: event["date"]):
+        if end is not None and event["date"] > end:
+            return
+        if start <= event["date"]:
+            yield event
+
+
+def _iter_perihelia(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield perihelion passages of Earth and the planets from start on."""
+    start_time = astronomy.Time.Make(
+        start.year, start.month, start.day, start.hour, start.minute, 0
+    )
+
+    def perihelia(body: astronomy.Body) -> Iterator[AstroEvent]:
+        name = body.name
+        apsis = _next_occurrence(
+            ("apsis", name), start_time, lambda time: astronomy.SearchPlanetApsis(body, time), lambda apsis: apsis.time
+        )
+        while True:
+            if apsis.kind == astronomy.ApsisKind.Pericenter:
+                yield AstroEvent(
+                    type="perihelion",
+                    date=apsis.time.Utc().replace(tzinfo=start.tzinfo),
+                    title=f"{name} at Perihelion",
+                    description=f"{name} closest to the Sun, {apsis.dist_au:.3f} AU",
+                    bodies=[name],
+                )
+            apsis = astronomy.NextPlanetApsis(body, apsis)
+
+    streams = [perihelia(body) for body in PERIHELION_BODIES]
+    for event in heapq.merge(*streams, key=lambda event: event["date"]):
+        if end is not None and event["date"] > end:
+            return
+        if start <= event["date"]:
+            yield event
+
+
+def _iter_meteor_peaks(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Yield meteor shower peaks from start on, dated midnight UTC of the peak day.
+
+    Showers peaking on the same day are yielded together, most active first.
+    """
+    date = start
+    while True:
+        found = next_shower_peak(date)
+        if found is None:
+            return
+        peak, showers = found
+        if end is not None and peak > end:
+            return
+        if start <= peak:
+            for shower in showers:
+                yield AstroEvent(
+                    type="meteor",
+                    date=peak,
+                    title=f"{shower['name']} Peak",
+                    description=f"Up to {shower['zhr']} meteors per hour from {shower['radiant_constellation']}",
+                    bodies=[],
                 )
+        date = peak + timedelta(days=1)
+
+
+def _computed_events(start: datetime, end: datetime | None) -> Iterator[AstroEvent]:
+    """Merge every category's stream into one, in date order."""
+    streams = [
+        _iter_moon_phases(start, end),
+        _iter_conjunctions(start, end),
+        _iter_oppositions(start, end),
+        _iter_seasonal_events(start, end),
+        _iter_eclipses(start, end),
+        _iter_elongations(start, end),
+        _iter_perihelia(start, end),
+        _iter_meteor_peaks(start, end),
+    ]
+    return heapq.merge(*streams, key=lambda event: event["date"])
+
+
+# Category streams by name, for running them in worker processes
+_STREAMS = {
+    "moon_phase": _iter_moon_phases,
+    "conjunction": _iter_conjunctions,
+    "opposition": _iter_oppositions,
+    "seasonal": _iter_seasonal_events,
+    "eclipse": _iter_eclipses,
+    "elongation": _iter_elongations,
+    "perihelion": _iter_perihelia,
+    "meteor": _iter_meteor_peaks,
+}
 
-    return events
+
+def _collect_stream(category: str, start: datetime, end: datetime) -> list[AstroEvent]:
+    """Run one category over a window; the unit of work sent to a worker process."""
+    return list(_STREAMS[category](start, end))
+
+
+def _parallel_events(start: datetime, end: datetime, workers: int) -> list[AstroEvent]:
+    """Compute every category concurrently on a process pool, in date order.
+
+    The conjunction scan dominates, so it is also split into date chunks,
+    about two per worker, each covering ``[chunk_start, chunk_end)`` except
+    the last, which includes ``end``.
+    """
+    days = (end - start) / timedelta(days=1)
+    chunk_days = max(CONJUNCTION_CHUNK_DAYS, int(np.ceil(days / (2 * workers))))
+    chunks = []
+    chunk_start = start
+    while chunk_start < end:
+        chunk_end = min(chunk_start + timedelta(days=chunk_days), end)
+        chunks.append((chunk_start, chunk_end))
+        chunk_start = chunk_end
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        conjunctions = [
+            pool.submit(_collect_stream, "conjunction", chunk_start, chunk_end)
+            for chunk_start, chunk_end in chunks
+        ]
+        others = [
+            pool.submit(_collect_stream, category, start, end)
+            for category in _STREAMS
+            if category != "conjunction"
+        ]
+        streams = [future.result() for future in others]
+        for (_, chunk_end), future in zip(chunks, conjunctions):
+            last = chunk_end == end
+            streams.append([event for event in future.result() if last or event["date"] < chunk_end])
+
+    return list(heapq.merge(*streams, key=lambda event: event["date"]))
+
+
+def _compute_events(start: datetime, end: datetime, workers: int = 1) -> list[AstroEvent]:
+    """Compute the events from start to end (UTC), on a process pool with more than one worker."""
+    if workers > 1:
+        return _parallel_events(start, end, workers)
+    return list(_computed_events(start, end))
+
+
+def fill_event_store(store: EventStore, start: datetime, end: datetime, workers: int = 1) -> None:
+    """Widen the store's span to include start to end (UTC), computing only what's missing.
+
+    The events are computed under the store's write lock, so processes
+    filling the same span at once compute it once between them.
+    """
+    store.extend(start, end, lambda part_start, part_end: _compute_events(part_start, part_end, workers))
+
+
+def update_event_store(
+    years: int = EVENT_STORE_YEARS, rebuild: bool = False, workers: int = 1
+) -> EventStore:
+    """Create or extend the event store to cover this year and ``years`` more.
+
+    An existing store is extended from where it ends, so only the new span is
+    computed. ``rebuild`` discards it and starts over. ``workers`` sets the
+    number of processes computing the events.
+    """
+    store = get_event_store(EVENTS_VERSION, create=True)
+    if rebuild:
+        store.clear()
+    now = datetime.now(timezone.utc)
+    span = store.coverage()
+    start = datetime(now.year, 1, 1, tzinfo=timezone.utc) if span is None else span[0]
+    fill_event_store(store, start, datetime(now.year + years, 1, 1, tzinfo=timezone.utc), workers)
+    return store
+
+
+def get_event_calendar(year: int, years: int = 1, workers: int = 1) -> list[AstroEvent]:
+    """Get every event from the start of ``year`` through ``years`` whole years.
+
+    Served from the event store. A calendar touching or overlapping the
+    stored span widens it by the part it's missing, so that part is only
+    computed once. One further away is computed on its own and not stored,
+    so the work is bounded by the calendar's length rather than by its
+    distance from the store. Dates are UTC.
+    """
+    start = datetime(year, 1, 1, tzinfo=timezone.utc)
+    end = datetime(year + years, 1, 1, tzinfo=timezone.utc)
+    store = get_event_store(EVENTS_VERSION, create=True)
+    span = store.coverage()
+    if span is not None and (end < span[0] or span[1] < start):
+        events = _compute_events(start, end, workers)
+    else:
+        fill_event_store(store, start, end, workers)
+        events = [AstroEvent(**event) for event in store.query(start, end)]
+    return [event for event in events if event["date"] < end]
+
+
+def _stored_window(start: datetime, end: datetime) -> bool:
+    """Whether the window starts inside the event store's span, so it's read from there."""
+    store = get_event_store(EVENTS_VERSION)
+    span = store.coverage() if store is not None else None
+    return span is not None and span[0] <= start.replace(tzinfo=timezone.utc) <= span[1]
+
+
+def iter_events(start: datetime, end: datetime | None = None) -> Iterator[AstroEvent]:
+    """Yield astronomical events from start to end (inclusive) in date order.
+
+    Lazy: each category is searched only as far as the events consumed so
+    far, so a caller wanting just the next event stops after one step of
+    each search. Without ``end`` the stream never ends.
+
+    Events the event store covers are read from it. A window starting inside
+    the stored span but running past its end continues past it by searching,
+    and one starting outside the span is searched directly; the store itself is only extended by :func:`update_event_store` and
+    :func:`get_event_calendar`, so a query never pays for more than its own
+    window.
+
+    Like the finders, treats ``start``'s clock time as UTC and labels event
+    dates with ``start``'s tzinfo.
+    """
+    store = get_event_store(EVENTS_VERSION)
+    span = store.coverage() if store is not None else None
+    window_start = start.replace(tzinfo=timezone.utc)
+    if span is None or not span[0] <= window_start <= span[1]:
+        yield from _computed_events(start, end)
+        return
+
+    window_end = None if end is None else end.replace(tzinfo=timezone.utc)
+    stored_end = span[1] if window_end is None else min(window_end, span[1])
+    for event in store.query(window_start, stored_end):
+        yield AstroEvent(**{**event, "date": event["date"].replace(tzinfo=start.tzinfo)})
+    if window_end is None or window_end > stored_end:
+        tail_start = stored_end.replace(tzinfo=start.tzinfo)
+        for event in _computed_events(tail_start, end):
+            if event["date"] > tail_start:
+                yield event
 
 
 def get_upcoming_events(
-    lat: float, lon: float, start: datetime, days: int = 7
+    lat: float, lon: float, start: datetime, days: int = 7, workers: int = 1
 ) -> list[AstroEvent]:
     """Get astronomical events within the specified window.
 
+    Collects :func:`iter_events` over the window. With more than one worker,
+    a window the event store can't answer is computed on a process pool
+    instead, which pays off for windows of months or more.
+
     Returns empty list on any error (graceful degradation).
 
     Args:
@@ -281,17 +802,16 @@ def get_upcoming_events(
         lon: Longitude in degrees (not currently used but kept for API consistency)
         start: Start date for event search
         days: Number of days to search forward (default 7)
+        workers: Processes to compute the events with (default 1, in process)
 
     Returns:
         List of astronomical events sorted by date, or empty list on error
     """
     try:
-        events = []
-        events.extend(_find_moon_phases(start, days))
-        events.extend(_find_conjunctions(start, days))
-        events.extend(_find_oppositions(start, days))
-        events.extend(_find_seasonal_events(start, days))
-        return sorted(events, key=lambda e: e["date"])
+        end = start + timedelta(days=days)
+        if workers > 1 and not _stored_window(start, end):
+            return _parallel_events(start, end, workers)
+        return list(iter_events(start, end))
     except Exception as e:
         logger.error(f"Unexpected error calculating astronomical events: {e}")
         return []
@@ -1,11 +1,25 @@
-"""ISS pass predictions using N2YO API."""
+"""ISS pass predictions.
+
+Passes are predicted locally with SGP4 (Skyfield's ``EarthSatellite``) from
+the ISS's two-line elements, kept in a TLE file in the user cache directory.
+Refresh the file with ``python -m skycli.sources.iss``, which downloads the
+current elements from CelesTrak. The N2YO API is only asked when there is no
+TLE file, or when it is too old for the requested date, and an
+``N2YO_API_KEY`` is set.
+"""
 
 import logging
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
 from typing import TypedDict
 
 import httpx
+import numpy as np
+from skyfield.api import EarthSatellite, wgs84
+
+from skycli.data import CACHE_DIR
+from skycli.ephemeris import get_body, get_ephemeris
 
 logger = logging.getLogger(__name__)
 
@@ -23,12 +37,29 @@ class ISSPass(TypedDict):
 
 N2YO_API_URL = "https://api.n2yo.com/rest/v1/satellite/visualpasses"
 ISS_NORAD_ID = 25544
+CELESTRAK_TLE_URL = f"https://celestrak.org/NORAD/elements/gp.php?CATNR={ISS_NORAD_ID}&FORMAT=tle"
+TLE_FILE = "iss.tle"
+# SGP4 errors grow by kilometres a day; elements further than this from the
+# requested date aren't used
+TLE_MAX_AGE_DAYS = 14
+# The API downloads fresh elements this often
+TLE_REFRESH_HOURS = 24
 
 # Configuration constants
 MIN_VISIBILITY_SECONDS = 60  # Minimum pass duration to show
 BRIGHTNESS_THRESHOLD_BRIGHT = -3.0  # Magnitude threshold for "Bright!" rating
 BRIGHTNESS_THRESHOLD_MODERATE = -1.5  # Magnitude threshold for "Moderate" rating
 
+# Local predictions, matching N2YO's visual passes: the ISS above this
+# altitude, lit by the Sun, while the observer's sky is dark
+MIN_PASS_ALTITUDE = 10.0  # degrees
+DARK_SUN_ALTITUDE = -6.0  # degrees, end of civil twilight
+PASS_STEP_SECONDS = 10
+# Magnitude at 1000 km range and 90° phase angle
+ISS_STANDARD_MAGNITUDE = -1.8
+
+_satellite: tuple[float, EarthSatellite] | None = None  # (file mtime, satellite)
+
 
 def _azimuth_to_direction(azimuth: float) -> str:
     """Convert azimuth angle to cardinal direction."""
@@ -47,22 +78,167 @@ def _magnitude_to_brightness(mag: float) -> str:
         return "Faint"
 
 
+def tle_path() -> Path:
+    """Where the ISS TLE file lives."""
+    return CACHE_DIR / TLE_FILE
+
+
+def update_tle() -> Path:
+    """Download the ISS's current elements from CelesTrak into the TLE file."""
+    response = httpx.get(CELESTRAK_TLE_URL, timeout=10.0)
+    response.raise_for_status()
+    lines = [line.strip() for line in response.text.splitlines() if line.strip()]
+    if len(lines) < 2 or not lines[-2].startswith("1 ") or not lines[-1].startswith("2 "):
+        raise ValueError(f"Unexpected TLE response: {response.text[:200]!r}")
+
+    path = tle_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_suffix(".tmp")
+    temporary.write_text("\n".join(lines[-3:]) + "\n")
+    temporary.replace(path)
+    return path
+
+
+def ensure_tle() -> None:
+    """Download the elements if the TLE file is missing or older than TLE_REFRESH_HOURS.
+
+    Failures are logged; predictions carry on with the file there is.
+    """
+    path = tle_path()
+    try:
+        if not path.exists() or datetime.now().timestamp() - path.stat().st_mtime > TLE_REFRESH_HOURS * 3600:
+            update_tle()
+    except Exception as e:
+        logger.warning(f"Could not refresh ISS elements: {e}")
+
+
+def _load_satellite() -> EarthSatellite | None:
+    """The ISS from the TLE file, reloaded when the file changes; None without one."""
+    global _satellite
+    path = tle_path()
+    try:
+        mtime = path.stat().st_mtime
+    except FileNotFoundError:
+        return None
+    if _satellite is None or _satellite[0] != mtime:
+        lines = [line.strip() for line in path.read_text().splitlines() if line.strip()]
+        _, ts = get_ephemeris()
+        name = lines[-3] if len(lines) >= 3 else "ISS"
+        _satellite = (mtime, EarthSatellite(lines[-2], lines[-1], name, ts))
+    return _satellite[1]
+
+
+def _magnitude(range_km: np.ndarray, phase_angle: np.ndarray) -> np.ndarray:
+    """Visual magnitude from range and Sun-ISS-observer phase angle (radians).
+
+    Scales the standard magnitude by distance and a diffuse sphere's phase
+    function, which is 1/π of full brightness at 90°.
+    """
+    phase = (np.sin(phase_angle) + (np.pi - phase_angle) * np.cos(phase_angle)) / np.pi
+    return ISS_STANDARD_MAGNITUDE + 5 * np.log10(range_km / 1000.0) - 2.5 * np.log10(np.pi * np.clip(phase, 1e-6, None))
+
+
+def _predict_passes(
+    satellite: EarthSatellite, lat: float, lon: float, date: datetime, days: int, min_visibility: int
+) -> list[ISSPass]:
+    """Find visible passes with SGP4.
+
+    Horizon passes come from Skyfield's event search. Each pass is then
+    sampled every few seconds, as one array, for the ISS's altitude,
+    sunlight and range and the Sun's altitude at the observer; the visible
+    part is where the ISS is up and lit while the observer's sky is dark.
+    """
+    eph, ts = get_ephemeris()
+    location = wgs84.latlon(lat, lon)
+    observer = get_body("Earth") + location
+    t0 = ts.from_datetime(date)
+    t1 = ts.from_datetime(date + timedelta(days=days))
+    times, kinds = satellite.find_events(location, t0, t1, altitude_degrees=MIN_PASS_ALTITUDE)
+
+    # Pair each rise with the next set; a pass under way at t0 starts there
+    windows = []
+    rise = t0
+    for time, kind in zip(times, kinds):
+        if kind == 0:
+            rise = time
+        elif kind == 2 and rise is not None:
+            windows.append((rise, time))
+            rise = None
+
+    sun = get_body("Sun")
+    passes = []
+    for rise, set_ in windows:
+        steps = max(int((set_.tt - rise.tt) * 86400 / PASS_STEP_SECONDS), 1)
+        samples = ts.tt_jd(np.linspace(rise.tt, set_.tt, steps + 1))
+        topocentric = (satellite - location).at(samples)
+        alt, az, distance = topocentric.altaz()
+        sun_position = observer.at(samples).observe(sun).apparent()
+        sun_alt = sun_position.altaz()[0].degrees
+        sunlit = satellite.at(samples).is_sunlit(eph)
+        visible = sunlit & (sun_alt < DARK_SUN_ALTITUDE) & (alt.degrees >= MIN_PASS_ALTITUDE)
+        if not visible.any():
+            continue
+        first = int(np.argmax(visible))
+        last = len(visible) - 1 - int(np.argmax(visible[::-1]))
+        start_time = samples[first].utc_datetime()
+        duration = (samples[last].utc_datetime() - start_time).total_seconds()
+        if duration < min_visibility:
+            continue
+
+        # Phase angle at the ISS between the Sun and the observer
+        to_observer = -topocentric.position.km
+        to_sun = sun_position.position.km - topocentric.position.km
+        cosine = np.sum(to_observer * to_sun, axis=0) / (
+            np.linalg.norm(to_observer, axis=0) * np.linalg.norm(to_sun, axis=0)
+        )
+        magnitudes = _magnitude(distance.km, np.arccos(np.clip(cosine, -1.0, 1.0)))
+        mag = float(magnitudes[first:last + 1][visible[first:last + 1]].min())
+
+        passes.append(ISSPass(
+            start_time=start_time.replace(microsecond=0),
+            duration_minutes=int(duration // 60),
+            max_altitude=round(float(alt.degrees[first:last + 1].max()), 1),
+            start_direction=_azimuth_to_direction(az.degrees[first]),
+            end_direction=_azimuth_to_direction(az.degrees[last]),
+            brightness=_magnitude_to_brightness(mag),
+            magnitude=round(mag, 1),
+        ))
+    return passes
+
+
 def get_iss_passes(lat: float, lon: float, date: datetime, days: int = 2, min_visibility: int = MIN_VISIBILITY_SECONDS) -> list[ISSPass]:
     """Get predicted ISS passes for the location.
 
-    Requires N2YO_API_KEY environment variable.
+    Predicted locally from the TLE file when there is one within
+    TLE_MAX_AGE_DAYS of ``date``; otherwise fetched from N2YO, which requires
+    the N2YO_API_KEY environment variable.
     Returns empty list on error (graceful degradation).
 
     Args:
         lat: Latitude in degrees
         lon: Longitude in degrees
-        date: Date for predictions (not directly used, kept for API consistency)
+        date: Start of the predictions
         days: Number of days to predict (default 2)
         min_visibility: Minimum pass duration in seconds (default 60)
 
     Returns:
-        List of ISS passes, or empty list if API unavailable
+        List of ISS passes, or empty list if no prediction is available
     """
+    try:
+        satellite = _load_satellite()
+        if satellite is not None:
+            age = abs((date - satellite.epoch.utc_datetime()).total_seconds()) / 86400
+            if age <= TLE_MAX_AGE_DAYS:
+                return _predict_passes(satellite, lat, lon, date, days, min_visibility)
+            logger.info(f"ISS elements are {age:.0f} days from {date:%Y-%m-%d}, not using them")
+    except Exception as e:
+        logger.error(f"Error predicting ISS passes locally: {e}")
+
+    return _fetch_n2yo_passes(lat, lon, days, min_visibility)
+
+
+def _fetch_n2yo_passes(lat: float, lon: float, days: int, min_visibility: int) -> list[ISSPass]:
+    """Get ISS passes from the N2YO API, or an empty list without a key or on error."""
     api_key = os.environ.get("N2YO_API_KEY", "")
 
     if not api_key:
@@ -101,3 +277,7 @@ def get_iss_passes(lat: float, lon: float, date: datetime, days: int = 2, min_vi
         ))
 
     return passes
+
+
+if __name__ == "__main__":
+    print(f"Saved ISS elements to {update_tle()}")
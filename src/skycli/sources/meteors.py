@@ -1,10 +1,50 @@
-"""Meteor shower data and activity detection."""
+"""Meteor shower data and activity detection.
 
+The shower list is compiled once per process into a day-of-year index: for
+each of the 366 calendar days, the showers active that day and whether each
+is at its peak. Finding the active showers is then a single lookup, and the
+peaks, kept in calendar order, answer "next peak after a date" with a
+binary search.
+
+:func:`get_meteor_timeline` turns the static ZHRs into the rates expected
+hour by hour at a location, from the radiant's altitude, twilight and
+moonlight, for every active shower and hour in one array computation.
+"""
+
+import bisect
 import json
-from datetime import datetime
-from typing import TypedDict
+from dataclasses import dataclass
+from datetime import date as calendar_date
+from datetime import datetime, timedelta
+from typing import NotRequired, TypedDict
+
+import numpy as np
 
+from skycli.backends import get_backend
+from skycli.context import NightContext
 from skycli.data import DATA_DIR
+from skycli.ephemeris import get_body
+from skycli.rise_set import SearchGrid
+
+DAYS_IN_INDEX = 366
+# Days are indexed by their position in a leap year, so Feb 29 has a slot
+# and every other month and day has the same index in every year
+_INDEX_YEAR = 2000
+
+_index: "ShowerIndex | None" = None
+
+# Rate timeline: hourly samples from the report time on
+TIMELINE_HOURS = 24
+# Ratio between the numbers of meteors of successive magnitudes; a typical
+# value, the showers' own range from about 2 to 3
+POPULATION_INDEX = 2.2
+# ZHR is defined for a limiting magnitude of 6.5
+REFERENCE_LIMITING_MAGNITUDE = 6.5
+# Limiting magnitude lost to a full Moon at the zenith, scaled down with
+# its illumination and the sine of its altitude
+MOON_MAGNITUDE_LOSS = 2.5
+# Meteors are counted once the Sun is this far below the horizon
+DARK_SUN_ALTITUDE = -12.0
 
 
 class ShowerInfo(TypedDict):
@@ -14,6 +54,24 @@ class ShowerInfo(TypedDict):
     peak_date: str  # "Dec 22"
     radiant_constellation: str
     is_peak: bool
+    # Set by get_showers_tonight: the hour with the highest expected rate,
+    # or None if the radiant isn't up in the dark
+    best_time: NotRequired[datetime | None]
+    best_rate: NotRequired[float]
+
+
+class MeteorRate(TypedDict):
+    """Expected meteors per hour from one shower at one time."""
+    time: datetime
+    rate: float
+
+
+class ShowerTimeline(TypedDict):
+    """Hour-by-hour expected rates of one shower at a location."""
+    name: str
+    rates: list[MeteorRate]
+    best_time: datetime | None  # None if the rate is zero throughout
+    best_rate: float
 
 
 def _load_showers() -> list[dict]:
@@ -53,22 +111,187 @@ def _format_peak_date(month: int, day: int) -> str:
     return f"{months[month - 1]} {day}"
 
 
-def get_active_showers(date: datetime) -> list[ShowerInfo]:
-    """Get meteor showers active on the given date."""
-    showers = _load_showers()
-    active = []
-
-    for shower in showers:
-        if _is_date_in_range(date, shower["active_start"], shower["active_end"]):
-            is_peak = (date.month == shower["peak_month"] and abs(date.day - shower["peak_day"]) <= 1)
-            active.append(ShowerInfo(
-                name=shower["name"],
-                zhr=shower["zhr"],
-                peak_date=_format_peak_date(shower["peak_month"], shower["peak_day"]),
-                radiant_constellation=shower["radiant_constellation"],
-                is_peak=is_peak,
+def day_of_year(date: datetime) -> int:
+    """Index of a date's month and day in the shower index (0 for Jan 1, 59 for Feb 29)."""
+    return calendar_date(_INDEX_YEAR, date.month, date.day).timetuple().tm_yday - 1
+
+
+@dataclass(frozen=True, eq=False)
+class ShowerIndex:
+    """Meteor shower activity by day of year.
+
+    Showers are kept in ZHR order, most active first, and referred to by
+    their position in that order.
+    """
+
+    showers: tuple[dict, ...]
+    # For each day of the year, ``(shower, is_peak)`` for every active shower
+    days: tuple[tuple[tuple[int, bool], ...], ...]
+    # Day of year of each shower's peak, ascending, and the shower peaking
+    # then; showers peaking on the same day are in ZHR order
+    peak_days: tuple[int, ...]
+    peak_showers: tuple[int, ...]
+
+    def info(self, shower: int, is_peak: bool) -> ShowerInfo:
+        """Describe one shower."""
+        record = self.showers[shower]
+        return ShowerInfo(
+            name=record["name"],
+            zhr=record["zhr"],
+            peak_date=_format_peak_date(record["peak_month"], record["peak_day"]),
+            radiant_constellation=record["radiant_constellation"],
+            is_peak=is_peak,
+        )
+
+    def next_peak(self, date: datetime) -> tuple[datetime, tuple[int, ...]] | None:
+        """Get the first shower peak day on or after the date's day.
+
+        Returns:
+            ``(peak day at midnight, showers peaking that day)``, wrapping into
+            the following year after the last peak, or None without showers
+        """
+        if not self.peak_days:
+            return None
+        position = bisect.bisect_left(self.peak_days, day_of_year(date))
+        year = date.year
+        if position == len(self.peak_days):
+            position, year = 0, year + 1
+        stop = bisect.bisect_right(self.peak_days, self.peak_days[position])
+        showers = self.peak_showers[position:stop]
+        record = self.showers[showers[0]]
+        return date.replace(
+            year=year, month=record["peak_month"], day=record["peak_day"], hour=0, minute=0, second=0, microsecond=0
+        ), showers
+
+    @classmethod
+    def from_records(cls, records: list[dict]) -> "ShowerIndex":
+        """Compile shower records, in the JSON file's shape, into an index."""
+        # Stable, so showers with equal ZHR keep their file order
+        showers = tuple(sorted(records, key=lambda record: record["zhr"], reverse=True))
+        first = datetime(_INDEX_YEAR, 1, 1)
+        days = []
+        for offset in range(DAYS_IN_INDEX):
+            date = first + timedelta(days=offset)
+            days.append(tuple(
+                (shower, date.month == record["peak_month"] and abs(date.day - record["peak_day"]) <= 1)
+                for shower, record in enumerate(showers)
+                if _is_date_in_range(date, record["active_start"], record["active_end"])
             ))
+        peaks = sorted(
+            (day_of_year(datetime(_INDEX_YEAR, record["peak_month"], record["peak_day"])), shower)
+            for shower, record in enumerate(showers)
+        )
+        return cls(
+            showers=showers,
+            days=tuple(days),
+            peak_days=tuple(day for day, _ in peaks),
+            peak_showers=tuple(shower for _, shower in peaks),
+        )
+
+
+def get_shower_index() -> ShowerIndex:
+    """Get the index of the bundled showers, compiled on first use."""
+    global _index
+    if _index is None:
+        _index = ShowerIndex.from_records(_load_showers())
+    return _index
+
+
+def get_active_showers(date: datetime) -> list[ShowerInfo]:
+    """Get meteor showers active on the given date, most active first."""
+    index = get_shower_index()
+    return [index.info(shower, is_peak) for shower, is_peak in index.days[day_of_year(date)]]
+
+
+def next_shower_peak(date: datetime) -> tuple[datetime, list[ShowerInfo]] | None:
+    """Get the next meteor shower peak day on or after the date's day.
+
+    Returns:
+        ``(peak day at midnight, showers peaking that day)`` in the date's
+        timezone, most active first, or None without showers
+    """
+    index = get_shower_index()
+    found = index.next_peak(date)
+    if found is None:
+        return None
+    peak, showers = found
+    return peak, [index.info(shower, True) for shower in showers]
+
+
+def get_meteor_timeline(
+    lat: float, lon: float, date: datetime, context: NightContext | None = None
+) -> list[ShowerTimeline]:
+    """Get the expected hourly rates of the active showers over the next day.
+
+    Uses the standard correction of ZHR to an observed rate: the ZHR times
+    the sine of the radiant's altitude, divided by the population index
+    raised to how far the limiting magnitude falls below the reference 6.5.
+    Moonlight lowers the limiting magnitude more the fuller and higher the
+    Moon is; in daylight and bright twilight the rate is zero. The Sun and Moon are sampled once on an hourly grid, and the rates
+    of every shower at every hour are computed together.
+
+    Args:
+        lat: Latitude in degrees
+        lon: Longitude in degrees
+        date: Start of the timeline
+        context: Observer and times to reuse, built if not given
+
+    Returns:
+        One timeline per active shower, most active first
+    """
+    index = get_shower_index()
+    active = index.days[day_of_year(date)]
+    if not active:
+        return []
+    context = context or NightContext(lat, lon, date)
+
+    t0 = context.t
+    t1 = t0.ts.tt_jd(t0.tt + TIMELINE_HOURS / 24)
+    grid = SearchGrid(context.observer, context.location, t0, t1, step_days=1 / 24)
+    sun_altitude = grid.altitudes(get_body("Sun"))
+    moon_altitude = np.radians(grid.altitudes(get_body("Moon")))
+    phase = np.radians(get_backend("moon_phase").moon_phase(context))
+    illumination = (1 - np.cos(phase)) / 2
+    limiting_magnitude = REFERENCE_LIMITING_MAGNITUDE - MOON_MAGNITUDE_LOSS * illumination * np.clip(
+        np.sin(moon_altitude), 0.0, None
+    )
+
+    # Radiant altitude for every shower (rows) at every hour (columns)
+    records = [index.showers[shower] for shower, _ in active]
+    ra = np.radians([record["radiant_ra"] for record in records])[:, np.newaxis]
+    dec = np.radians([record["radiant_dec"] for record in records])[:, np.newaxis]
+    zhr = np.array([record["zhr"] for record in records], dtype=float)[:, np.newaxis]
+    local_sidereal = np.radians(grid.times.gast * 15.0 + lon)
+    phi = np.radians(lat)
+    sin_radiant = np.sin(phi) * np.sin(dec) + np.cos(phi) * np.cos(dec) * np.cos(local_sidereal - ra)
+
+    rates = zhr * np.clip(sin_radiant, 0.0, None) / POPULATION_INDEX ** (
+        REFERENCE_LIMITING_MAGNITUDE - limiting_magnitude
+    )
+    rates[:, sun_altitude > DARK_SUN_ALTITUDE] = 0.0
+
+    # Sample times as exact hours from the report minute, which is where the grid starts
+    start = context.date.replace(second=0, microsecond=0)
+    times = [start + timedelta(hours=hour) for hour in range(len(grid.times))]
+    best = np.argmax(rates, axis=1)
+    timelines = []
+    for record, row, best_index in zip(records, rates, best):
+        best_rate = round(float(row[best_index]), 1)
+        timelines.append(ShowerTimeline(
+            name=record["name"],
+            rates=[MeteorRate(time=time, rate=round(float(rate), 1)) for time, rate in zip(times, row)],
+            best_time=times[best_index] if best_rate > 0 else None,
+            best_rate=best_rate,
+        ))
+    return timelines
+
 
-    # Sort by ZHR (most active first)
-    active.sort(key=lambda s: s["zhr"], reverse=True)
-    return active
+def get_showers_tonight(
+    lat: float, lon: float, date: datetime, context: NightContext | None = None
+) -> list[ShowerInfo]:
+    """Get the active showers with the best hour to watch each from a location."""
+    showers = get_active_showers(date)
+    for shower, timeline in zip(showers, get_meteor_timeline(lat, lon, date, context)):
+        shower["best_time"] = timeline["best_time"]
+        shower["best_rate"] = timeline["best_rate"]
+    return showers
@@ -1,10 +1,10 @@
-"""Planet visibility calculations using Skyfield."""
+"""Planet visibility calculations."""
 
 from datetime import datetime, timezone
 from typing import TypedDict
 
-from skyfield import almanac
-from skyfield.api import load, wgs84
+from skycli.backends import get_backend
+from skycli.context import NightContext
 
 
 class PlanetInfo(TypedDict):
@@ -31,19 +31,6 @@ PLANET_DESCRIPTIONS = {
     "Neptune": "Very faint, needs telescope",
 }
 
-# Load ephemeris data (cached)
-_ephemeris = None
-_timescale = None
-
-
-def _get_ephemeris():
-    """Get or load the ephemeris data."""
-    global _ephemeris, _timescale
-    if _ephemeris is None:
-        _ephemeris = load("de421.bsp")
-        _timescale = load.timescale()
-    return _ephemeris, _timescale
-
 
 def _azimuth_to_direction(azimuth: float) -> str:
     """Convert azimuth angle to cardinal/intercardinal direction."""
@@ -53,49 +40,29 @@ def _azimuth_to_direction(azimuth: float) -> str:
     return directions[index]
 
 
-def get_visible_planets(lat: float, lon: float, date: datetime) -> list[PlanetInfo]:
+def get_visible_planets(lat: float, lon: float, date: datetime, context: NightContext | None = None) -> list[PlanetInfo]:
     """Get list of planets visible at the given location and time."""
-    eph, ts = _get_ephemeris()
+    context = context or NightContext(lat, lon, date)
 
-    location = wgs84.latlon(lat, lon)
-    observer = eph["Earth"] + location
+    # Every planet's position in one call to the selected backend
+    positions = get_backend("position").altaz(context, PLANETS)
 
-    t = ts.utc(date.year, date.month, date.day, date.hour, date.minute)
-    t0 = ts.utc(date.year, date.month, date.day)
-    t1 = ts.utc(date.year, date.month, date.day + 1)
+    # Rise/set searches only for the planets that are above the horizon,
+    # all from one shared search
+    above = [
+        (planet_name, altitude, azimuth)
+        for planet_name, (altitude, azimuth) in positions.items()
+        if altitude > 0
+    ]
+    crossings = get_backend("rise_set").rise_set(context, [planet_name for planet_name, _, _ in above])
 
     visible = []
 
-    for planet_name in PLANETS:
-        # Handle barycenter vs planet distinction
-        if planet_name in ["Jupiter", "Saturn", "Uranus", "Neptune"]:
-            planet_key = f"{planet_name} barycenter"
-        else:
-            planet_key = planet_name
-
-        planet = eph[planet_key]
-
-        # Get current position
-        astrometric = observer.at(t).observe(planet)
-        apparent = astrometric.apparent()
-        alt, az, _ = apparent.altaz()
-
-        altitude = alt.degrees
-        azimuth = az.degrees
-
-        # Skip if below horizon
-        if altitude <= 0:
-            continue
-
-        # Find rise and set times
-        f = almanac.risings_and_settings(eph, planet, location)
-        times, events = almanac.find_discrete(t0, t1, f)
-
+    for planet_name, altitude, azimuth in above:
         rise_time = None
         set_time = None
-        for time, event in zip(times, events):
-            dt = time.utc_datetime()
-            if event == 1:
+        for dt, is_rise in crossings[planet_name]:
+            if is_rise:
                 rise_time = dt
             else:
                 set_time = dt
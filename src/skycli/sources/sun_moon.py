@@ -1,10 +1,17 @@
 """Sun and moon calculations using Skyfield."""
 
+from collections import defaultdict
+from datetime import date as date_type
 from datetime import datetime, timedelta, timezone
 from typing import TypedDict
 
-from skyfield import almanac
-from skyfield.api import N, W, load, wgs84
+from skyfield.api import wgs84
+
+from skycli.almanac_tables import AlmanacTable, get_table, store_table, table_key
+from skycli.backends import get_backend
+from skycli.context import NightContext
+from skycli.ephemeris import get_body, get_ephemeris
+from skycli.rise_set import SearchGrid, find_altitude_crossings, find_risings_and_settings
 
 # Moon phase angle thresholds (in degrees)
 PHASE_NEW_MOON_MAX = 22.5
@@ -23,13 +30,42 @@ DARKNESS_FAIR_MAX = 75       # < 75% illumination = Fair
 # >= 75% illumination = Poor
 
 
+# Sun altitude boundaries (degrees), lowest first: astronomical, nautical and
+# civil twilight, and sunrise/sunset (upper limb on the horizon with
+# refraction, as Skyfield's almanac uses)
+TWILIGHT_ASTRONOMICAL = -18.0
+TWILIGHT_NAUTICAL = -12.0
+TWILIGHT_CIVIL = -6.0
+SUNRISE_ALTITUDE = -0.8333
+SOLAR_LEVELS = (TWILIGHT_ASTRONOMICAL, TWILIGHT_NAUTICAL, TWILIGHT_CIVIL, SUNRISE_ALTITUDE)
+
+# SunTimes field for each twilight boundary crossing, by (altitude, rising)
+_TWILIGHT_FIELDS = {
+    (TWILIGHT_ASTRONOMICAL, False): "astronomical_twilight_start",
+    (TWILIGHT_ASTRONOMICAL, True): "astronomical_twilight_end",
+    (TWILIGHT_NAUTICAL, False): "nautical_twilight_start",
+    (TWILIGHT_NAUTICAL, True): "nautical_twilight_end",
+    (TWILIGHT_CIVIL, False): "civil_twilight_start",
+    (TWILIGHT_CIVIL, True): "civil_twilight_end",
+}
+
+
 class SunTimes(TypedDict):
-    """Sun timing information."""
+    """Sun timing information.
+
+    Each ``*_twilight_start`` is the evening moment the sky gets darker than
+    that twilight's lower limit; each ``*_twilight_end`` is the morning moment
+    it gets lighter again.
+    """
 
     sunrise: datetime
     sunset: datetime
     astronomical_twilight_start: datetime  # Evening
     astronomical_twilight_end: datetime  # Morning
+    nautical_twilight_start: datetime | None  # Evening, Sun below -12°
+    nautical_twilight_end: datetime | None  # Morning
+    civil_twilight_start: datetime | None  # Evening, Sun below -6°
+    civil_twilight_end: datetime | None  # Morning
 
 
 class MoonInfo(TypedDict):
@@ -42,74 +78,113 @@ class MoonInfo(TypedDict):
     moonset: datetime | None
 
 
-# Load ephemeris data (cached after first download)
-_ephemeris = None
-_timescale = None
-
-
-def _get_ephemeris():
-    """Get or load the ephemeris data."""
-    global _ephemeris, _timescale
-    if _ephemeris is None:
-        _ephemeris = load("de421.bsp")
-        _timescale = load.timescale()
-    return _ephemeris, _timescale
-
-
-def get_sun_times(lat: float, lon: float, date: datetime) -> SunTimes:
-    """Calculate sunrise, sunset, and twilight times for a location and date."""
-    eph, ts = _get_ephemeris()
-
-    # Create location
+def _sun_events(crossings: list[tuple[datetime, int, bool]]) -> dict[str, datetime | None]:
+    """Pick one UTC day's sun times out of its ``SOLAR_LEVELS`` crossings.
+
+    Keeps the latest sunrise/sunset in the day and the first crossing of
+    each twilight boundary. Rising crossings are mornings, falling ones
+    evenings.
+    """
+    events: dict[str, datetime | None] = dict.fromkeys(("sunrise", "sunset", *_TWILIGHT_FIELDS.values()))
+    for dt, level, rising in crossings:
+        altitude = SOLAR_LEVELS[level]
+        if altitude == SUNRISE_ALTITUDE:
+            events["sunrise" if rising else "sunset"] = dt
+        else:
+            field = _TWILIGHT_FIELDS[(altitude, rising)]
+            if events[field] is None:
+                events[field] = dt
+    return events
+
+
+def _moon_events(crossings: list[tuple[datetime, bool]]) -> dict[str, datetime | None]:
+    """Pick one UTC day's moonrise and moonset (the latest of each)."""
+    events: dict[str, datetime | None] = {"moonrise": None, "moonset": None}
+    for dt, is_rise in crossings:
+        events["moonrise" if is_rise else "moonset"] = dt
+    return events
+
+
+def _table_day(context: NightContext) -> dict[str, datetime | None] | None:
+    """The report day's events from a prebuilt almanac table, if there is one."""
+    table = context.almanac
+    return table.day(context.date) if table is not None else None
+
+
+def build_almanac_table(lat: float, lon: float, year: int) -> AlmanacTable:
+    """Compute a year of sun and moon events for a location.
+
+    One search grid spans the whole year; the Sun's four altitude levels and
+    the Moon's horizon are each found in a single batched search over it,
+    then split by UTC day with the same rules :func:`get_sun_times` and
+    :func:`get_moon_info` use for a single day.
+    """
+    lat, lon, year = table_key(lat, lon, year)
+    _, ts = get_ephemeris()
     location = wgs84.latlon(lat, lon)
-
-    # Time range: the full day
-    t0 = ts.utc(date.year, date.month, date.day)
-    t1 = ts.utc(date.year, date.month, date.day + 1)
-
-    # Find sunrise and sunset
-    f = almanac.sunrise_sunset(eph, location)
-    times, events = almanac.find_discrete(t0, t1, f)
-
-    sunrise = None
-    sunset = None
-    for t, event in zip(times, events):
-        dt = t.utc_datetime()
-        if event == 1:  # Sunrise
-            sunrise = dt
-        else:  # Sunset
-            sunset = dt
-
-    # Find astronomical twilight
-    f_twilight = almanac.dark_twilight_day(eph, location)
-    twilight_times, twilight_events = almanac.find_discrete(t0, t1, f_twilight)
-
-    astro_start = None  # Evening astronomical twilight starts
-    astro_end = None  # Morning astronomical twilight ends
-
-    for t, event in zip(twilight_times, twilight_events):
-        dt = t.utc_datetime()
-        # Event 0 = dark (night), 1 = astronomical twilight, 2 = nautical, 3 = civil, 4 = day
-        if event == 0 and astro_start is None and dt.hour > 12:
-            astro_start = dt
-        elif event == 1 and astro_end is None and dt.hour < 12:
-            astro_end = dt
+    grid = SearchGrid(get_body("Earth") + location, location, ts.utc(year, 1, 1), ts.utc(year + 1, 1, 1))
+
+    sun_by_day = defaultdict(list)
+    for crossing in find_altitude_crossings(grid, get_body("Sun"), SOLAR_LEVELS):
+        sun_by_day[crossing[0].date()].append(crossing)
+    moon_by_day = defaultdict(list)
+    for crossing in find_risings_and_settings(grid, {"Moon": get_body("Moon")})["Moon"]:
+        moon_by_day[crossing[0].date()].append(crossing)
+
+    first_day = date_type(year, 1, 1)
+    n_days = (date_type(year + 1, 1, 1) - first_day).days
+    days = []
+    for offset in range(n_days):
+        day = first_day + timedelta(days=offset)
+        days.append({**_sun_events(sun_by_day[day]), **_moon_events(moon_by_day[day])})
+    return AlmanacTable.from_days(lat, lon, year, days)
+
+
+def ensure_almanac_table(lat: float, lon: float, year: int) -> AlmanacTable:
+    """Get the almanac table for a location and year, building and saving it if needed."""
+    table = get_table(lat, lon, year)
+    if table is None:
+        table = build_almanac_table(lat, lon, year)
+        store_table(table)
+    return table
+
+
+def get_sun_times(lat: float, lon: float, date: datetime, context: NightContext | None = None) -> SunTimes:
+    """Calculate sunrise, sunset, and twilight times for a location and date.
+
+    Uses the location's almanac table when one has been built. Otherwise
+    everything comes from one search of the Sun's altitude over the UTC day
+    against all four boundaries (sunrise/sunset, civil, nautical and
+    astronomical twilight), on the backend selected for ``twilight``.
+    """
+    context = context or NightContext(lat, lon, date)
+
+    events = _table_day(context)
+    if events is None:
+        events = _sun_events(get_backend("twilight").sun_crossings(context, SOLAR_LEVELS))
 
     return SunTimes(
-        sunrise=sunrise or date.replace(hour=6, minute=0),
-        sunset=sunset or date.replace(hour=18, minute=0),
-        astronomical_twilight_start=astro_start or date.replace(hour=21, minute=0),
-        astronomical_twilight_end=astro_end or date.replace(hour=5, minute=0),
+        sunrise=events["sunrise"] or date.replace(hour=6, minute=0),
+        sunset=events["sunset"] or date.replace(hour=18, minute=0),
+        astronomical_twilight_start=events["astronomical_twilight_start"] or date.replace(hour=21, minute=0),
+        astronomical_twilight_end=events["astronomical_twilight_end"] or date.replace(hour=5, minute=0),
+        nautical_twilight_start=events["nautical_twilight_start"],
+        nautical_twilight_end=events["nautical_twilight_end"],
+        civil_twilight_start=events["civil_twilight_start"],
+        civil_twilight_end=events["civil_twilight_end"],
     )
 
 
-def get_moon_info(lat: float, lon: float, date: datetime) -> MoonInfo:
-    """Calculate moon phase and timing for a location and date."""
-    eph, ts = _get_ephemeris()
+def get_moon_info(lat: float, lon: float, date: datetime, context: NightContext | None = None) -> MoonInfo:
+    """Calculate moon phase and timing for a location and date.
+
+    Moonrise and moonset come from the location's almanac table when one has
+    been built, otherwise from the backend selected for ``rise_set``.
+    """
+    context = context or NightContext(lat, lon, date)
 
     # Get moon phase
-    t = ts.utc(date.year, date.month, date.day, date.hour, date.minute)
-    phase_angle = almanac.moon_phase(eph, t).degrees
+    phase_angle = get_backend("moon_phase").moon_phase(context)
 
     # Calculate illumination (approximate)
     # 0° = new moon, 180° = full moon
@@ -134,21 +209,9 @@ def get_moon_info(lat: float, lon: float, date: datetime) -> MoonInfo:
         phase_name = "Waning Crescent"
 
     # Find moonrise and moonset
-    location = wgs84.latlon(lat, lon)
-    t0 = ts.utc(date.year, date.month, date.day)
-    t1 = ts.utc(date.year, date.month, date.day + 1)
-
-    f = almanac.risings_and_settings(eph, eph["Moon"], location)
-    times, events = almanac.find_discrete(t0, t1, f)
-
-    moonrise = None
-    moonset = None
-    for time, event in zip(times, events):
-        dt = time.utc_datetime()
-        if event == 1:  # Rise
-            moonrise = dt
-        else:  # Set
-            moonset = dt
+    events = _table_day(context)
+    if events is None:
+        events = _moon_events(get_backend("rise_set").rise_set(context, ["Moon"])["Moon"])
 
     # Determine darkness quality based on moon illumination percentage
     if illumination < DARKNESS_EXCELLENT_MAX:
@@ -164,6 +227,6 @@ def get_moon_info(lat: float, lon: float, date: datetime) -> MoonInfo:
         phase_name=phase_name,
         illumination=round(illumination, 1),
         darkness_quality=darkness_quality,
-        moonrise=moonrise,
-        moonset=moonset,
+        moonrise=events["moonrise"],
+        moonset=events["moonset"],
     )
@@ -0,0 +1,14 @@
+"""Shared test setup."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _cache_dir(tmp_path_factory):
+    """Keep generated almanac tables, events and TLEs out of the user's real cache directory."""
+    cache_dir = tmp_path_factory.mktemp("cache")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("skycli.almanac_tables.CACHE_DIR", cache_dir)
+        mp.setattr("skycli.event_store.CACHE_DIR", cache_dir)
+        mp.setattr("skycli.sources.iss.CACHE_DIR", cache_dir)
+        yield
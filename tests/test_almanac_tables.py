@@ -0,0 +1,116 @@
+"""Tests for the year-long almanac tables."""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from skycli import almanac_tables
+from skycli.almanac_tables import AlmanacTable, get_table, store_table, table_path
+from skycli.sources.sun_moon import build_almanac_table, get_moon_info, get_sun_times
+
+LONDON = (51.5, -0.1278)
+
+
+@pytest.fixture(scope="module")
+def london_2025():
+    """Build the London table once; it's a full year's search."""
+    return build_almanac_table(*LONDON, 2025)
+
+
+def test_table_has_a_row_per_day(london_2025):
+    """2025 has 365 days, each with a column per event."""
+    assert london_2025.times.shape == (365, len(almanac_tables.COLUMNS))
+
+
+@pytest.mark.parametrize("month,day", [(1, 1), (3, 10), (6, 21), (9, 23), (12, 31)])
+def test_table_matches_daily_search(london_2025, month, day):
+    """A table row agrees with searching that day on its own."""
+    date = datetime(2025, month, day, 22, tzinfo=timezone.utc)
+    row = london_2025.day(date)
+
+    sun = get_sun_times(*LONDON, date)
+    moon = get_moon_info(*LONDON, date)
+    expected = {**sun, "moonrise": moon["moonrise"], "moonset": moon["moonset"]}
+
+    for name in almanac_tables.COLUMNS:
+        if name in ("astronomical_twilight_start", "astronomical_twilight_end") and row[name] is None:
+            continue  # get_sun_times substitutes a fixed fallback time
+        if row[name] is None:
+            assert expected[name] is None, name
+        else:
+            assert abs((row[name] - expected[name]).total_seconds()) < 1, name
+
+
+def test_store_and_get_table(london_2025, tmp_path, monkeypatch):
+    """Stored tables are found again from disk by rounded coordinates."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    monkeypatch.setattr(almanac_tables, "_missing", OrderedDict())
+
+    assert get_table(*LONDON, 2025) is None
+    path = store_table(london_2025)
+    assert path == table_path(*LONDON, 2025)
+
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    loaded = get_table(51.50001, -0.12781, 2025)
+    assert loaded is not None
+    assert loaded.year == 2025
+    assert (loaded.lat, loaded.lon) == LONDON
+    assert loaded.times.tobytes() == london_2025.times.tobytes()
+
+
+def test_sun_times_use_table_without_searching(london_2025, tmp_path, monkeypatch, mocker):
+    """With a table available, sun and moon times skip the root search."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    store_table(london_2025)
+    search = mocker.patch("skycli.backends.find_altitude_crossings")
+    moon_search = mocker.patch("skycli.backends.find_risings_and_settings")
+
+    date = datetime(2025, 3, 10, 22, tzinfo=timezone.utc)
+    sun = get_sun_times(*LONDON, date)
+    moon = get_moon_info(*LONDON, date)
+
+    search.assert_not_called()
+    moon_search.assert_not_called()
+    assert sun["sunrise"] == london_2025.day(date)["sunrise"]
+    assert moon["moonrise"] == london_2025.day(date)["moonrise"]
+
+
+def test_outdated_table_is_ignored(tmp_path, monkeypatch):
+    """Tables written by an older version are treated as missing."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    table = AlmanacTable(lat=10.0, lon=20.0, year=2025, times=np.zeros((365, 10)))
+    store_table(table)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    monkeypatch.setattr(almanac_tables, "TABLE_VERSION", almanac_tables.TABLE_VERSION + 1)
+
+    assert get_table(10.0, 20.0, 2025) is None
+
+
+def test_missing_tables_are_remembered(tmp_path, monkeypatch, mocker):
+    """Only the first lookup of a location without a table touches the disk."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    monkeypatch.setattr(almanac_tables, "_missing", OrderedDict())
+    load = mocker.spy(AlmanacTable, "load")
+
+    assert get_table(*LONDON, 2025) is None
+    assert get_table(*LONDON, 2025) is None
+    assert load.call_count == 1
+
+
+def test_missing_tables_are_bounded(tmp_path, monkeypatch):
+    """Only the most recently looked up locations are remembered as missing."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    monkeypatch.setattr(almanac_tables, "_missing", OrderedDict())
+    monkeypatch.setattr(almanac_tables, "MISSING_CACHE_SIZE", 2)
+
+    for lon in (1.0, 2.0, 1.0, 3.0):
+        get_table(50.0, lon, 2025)
+
+    assert list(almanac_tables._missing) == [(50.0, 1.0, 2025), (50.0, 3.0, 2025)]
@@ -243,3 +243,44 @@ def test_report_endpoint_location_returned():
     location = data["location"]
     assert location["lat"] == NYC_LAT
     assert location["lon"] == NYC_LON
+
+
+def test_calendar_endpoint_returns_year_of_events(tmp_path, monkeypatch):
+    """Calendar endpoint lists the year's events, eclipses included."""
+    monkeypatch.setattr("skycli.event_store.CACHE_DIR", tmp_path)
+    response = client.get("/api/calendar?year=2025")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["year"], data["years"]) == (2025, 1)
+    eclipses = [event["title"] for event in data["events"] if event["type"] == "eclipse"]
+    assert eclipses == [
+        "Total Lunar Eclipse",
+        "Partial Solar Eclipse",
+        "Total Lunar Eclipse",
+        "Partial Solar Eclipse",
+    ]
+    assert all(event["date"].startswith("2025-") for event in data["events"])
+
+
+def test_calendar_endpoint_validates_years():
+    """Calendar endpoint rejects spans over ten years."""
+    response = client.get("/api/calendar?year=2025&years=11")
+    assert response.status_code == 422
+
+
+def test_report_endpoint_rejects_dates_outside_ephemeris(mocker):
+    """Dates the loaded kernel can't answer are a 422, not a 500."""
+    mocker.patch(
+        "app.routers.report.ephemeris_span",
+        return_value=(datetime(2006, 10, 16, tzinfo=timezone.utc), datetime(2046, 10, 16, tzinfo=timezone.utc)),
+    )
+    build = mocker.patch("app.routers.report.build_report")
+
+    response = client.get(f"/api/report?lat={NYC_LAT}&lon={NYC_LON}&date=2000-01-15")
+    assert response.status_code == 422
+    assert "2006-10-17" in response.json()["detail"]
+
+    response = client.get(f"/api/report?lat={NYC_LAT}&lon={NYC_LON}&date=2046-10-15")
+    assert response.status_code == 422
+    build.assert_not_called()
@@ -0,0 +1,91 @@
+"""Tests for the Skyfield and Astronomy Engine backends."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from skycli import backends
+from skycli.backends import BACKENDS, get_backend, set_backend
+from skycli.context import NightContext
+from skycli.sources.planets import PLANETS, get_visible_planets
+from skycli.sources.sun_moon import SOLAR_LEVELS, get_sun_times
+
+NYC = (40.7128, -74.0060)
+DATE = datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def contexts():
+    return NightContext(*NYC, DATE), NightContext(*NYC, DATE)
+
+
+def test_positions_agree(contexts):
+    """Both backends place every body within an arcminute of each other."""
+    skyfield = BACKENDS["skyfield"].altaz(contexts[0], ["Moon", *PLANETS])
+    other = BACKENDS["astronomy"].altaz(contexts[1], ["Moon", *PLANETS])
+
+    for name, (alt, az) in skyfield.items():
+        assert abs(other[name][0] - alt) < 1 / 60, name
+        assert abs((other[name][1] - az + 180) % 360 - 180) < 1 / 60, name
+
+
+def test_rise_set_agree(contexts):
+    """Both backends find the same horizon crossings to within half a minute."""
+    skyfield = BACKENDS["skyfield"].rise_set(contexts[0], ["Moon", "Mars", "Jupiter"])
+    other = BACKENDS["astronomy"].rise_set(contexts[1], ["Moon", "Mars", "Jupiter"])
+
+    for name, crossings in skyfield.items():
+        assert [is_rise for _, is_rise in crossings] == [is_rise for _, is_rise in other[name]], name
+        for (dt, _), (other_dt, _) in zip(crossings, other[name]):
+            assert abs((dt - other_dt).total_seconds()) < 30, name
+
+
+def test_twilight_agree(contexts):
+    """Both backends find the same Sun altitude crossings to within a few seconds."""
+    skyfield = BACKENDS["skyfield"].sun_crossings(contexts[0], SOLAR_LEVELS)
+    other = BACKENDS["astronomy"].sun_crossings(contexts[1], SOLAR_LEVELS)
+
+    assert [(level, rising) for _, level, rising in skyfield] == [(level, rising) for _, level, rising in other]
+    for (dt, _, _), (other_dt, _, _) in zip(skyfield, other):
+        assert abs((dt - other_dt).total_seconds()) < 5
+
+
+def test_moon_phase_agree(contexts):
+    """Both backends give the same phase angle to within 0.05°."""
+    skyfield = BACKENDS["skyfield"].moon_phase(contexts[0])
+    other = BACKENDS["astronomy"].moon_phase(contexts[1])
+    assert abs(skyfield - other) < 0.05
+
+
+def test_backend_selected_per_operation(monkeypatch):
+    """Each operation uses its own backend, and sources follow the selection."""
+    expected = get_visible_planets(*NYC, DATE)
+    monkeypatch.setattr(backends, "_selected", dict(backends._selected))
+    set_backend("position", "astronomy")
+
+    assert get_backend("position").name == "astronomy"
+    assert get_backend("rise_set").name == "skyfield"
+    planets = get_visible_planets(*NYC, DATE)
+    assert [planet["name"] for planet in planets] == [planet["name"] for planet in expected]
+    for planet, reference in zip(planets, expected):
+        assert abs(planet["altitude"] - reference["altitude"]) <= 1
+
+
+def test_sun_times_on_astronomy_engine(monkeypatch):
+    """get_sun_times gives the same answer on either backend."""
+    expected = get_sun_times(*NYC, DATE)
+    monkeypatch.setattr(backends, "_selected", dict(backends._selected))
+    set_backend("twilight", "astronomy")
+
+    result = get_sun_times(*NYC, DATE)
+
+    for field, value in expected.items():
+        assert abs((result[field] - value).total_seconds()) < 5, field
+
+
+def test_set_backend_rejects_unknown_names():
+    """Unknown operations and backends are reported."""
+    with pytest.raises(ValueError, match="Unknown operation"):
+        set_backend("eclipses", "astronomy")
+    with pytest.raises(ValueError, match="Unknown backend"):
+        set_backend("position", "pyephem")
@@ -0,0 +1,109 @@
+"""Tests for the columnar deep sky catalog."""
+
+import json
+
+import numpy as np
+import pytest
+from skyfield.api import Star, wgs84
+
+from skycli.data import DATA_DIR
+from skycli.data import catalog as catalog_module
+from skycli.data.catalog import Catalog, get_catalog
+from skycli.ephemeris import get_body, get_ephemeris
+
+
+def _messier_records() -> list[dict]:
+    with open(DATA_DIR / "messier.json") as f:
+        return json.load(f)
+
+
+def test_catalog_round_trips_json_records():
+    """Every compiled record matches its JSON source exactly."""
+    records = _messier_records()
+    catalog = Catalog.from_records(records)
+    assert len(catalog) == len(records)
+    compiled = [catalog.record(i) for i in range(len(catalog))]
+    assert sorted(compiled, key=lambda r: r["id"]) == sorted(records, key=lambda r: r["id"])
+
+
+def test_catalog_is_in_magnitude_order():
+    """Objects are stored brightest first, ties in source order."""
+    records = _messier_records()
+    catalog = Catalog.from_records(records)
+    assert list(catalog.mag) == sorted(catalog.mag)
+    assert [catalog.text("id", i) for i in range(len(catalog))] == [
+        r["id"] for r in sorted(records, key=lambda r: r["mag"])
+    ]
+
+
+def test_string_tables_store_repeated_values_once():
+    """Repeated strings like object types share one table entry."""
+    catalog = Catalog.from_records(_messier_records())
+    assert len(catalog.tables["type"]) == len(set(catalog.tables["type"]))
+    assert len(catalog.tables["type"]) < len(catalog)
+
+
+def test_save_and_load(tmp_path):
+    """A saved catalog loads back with identical contents."""
+    catalog = Catalog.from_records(_messier_records())
+    path = tmp_path / "messier.npz"
+    catalog.save(path)
+    loaded = Catalog.load(path)
+    assert [loaded.record(i) for i in range(len(loaded))] == [catalog.record(i) for i in range(len(catalog))]
+
+
+def test_catalogs_must_be_in_magnitude_order():
+    """A catalog whose objects aren't brightest first is rejected."""
+    catalog = Catalog.from_records(_messier_records())
+    with pytest.raises(ValueError):
+        Catalog(
+            ra=catalog.ra, dec=catalog.dec, mag=catalog.mag[::-1], size=catalog.size,
+            tables=catalog.tables, codes=catalog.codes,
+        )
+
+
+def test_stale_format_is_recompiled(tmp_path, monkeypatch):
+    """A compiled file from another format version falls back to the JSON."""
+    (tmp_path / "messier.json").write_text(json.dumps(_messier_records()))
+    catalog = Catalog.from_records(_messier_records())
+    np.savez(tmp_path / "messier.npz", **{field: getattr(catalog, field)[::-1] for field in ("ra", "dec", "mag", "size")})
+    monkeypatch.setattr(catalog_module, "DATA_DIR", tmp_path)
+    monkeypatch.setattr(catalog_module, "_catalogs", {})
+
+    loaded = get_catalog()
+
+    assert list(loaded.mag) == sorted(loaded.mag)
+    assert len(loaded) == len(catalog)
+
+
+def test_get_catalog_is_shared():
+    """The bundled catalog is loaded once per process."""
+    assert get_catalog() is get_catalog("messier")
+
+
+def test_candidates_never_drop_visible_objects():
+    """Every object above the cutoff survives the sky-cell filter."""
+    rng = np.random.default_rng(7)
+    size = 2000
+    records = [
+        {
+            "id": f"X{i}", "name": f"X{i}", "constellation": "Syn",
+            "ra": float(rng.uniform(0, 360)), "dec": float(np.degrees(np.arcsin(rng.uniform(-1, 1)))),
+            "mag": 10.0, "size": 1.0, "type": "Galaxy", "equipment": "large-scope", "tip": "-",
+        }
+        for i in range(size)
+    ]
+    catalog = Catalog.from_records(records)
+    _, ts = get_ephemeris()
+    stars = Star(ra_hours=catalog.ra / 15.0, dec_degrees=catalog.dec)
+
+    for lat, lon in [(40.7, -74.0), (-33.9, 151.2), (78.2, 15.6), (0.0, 0.0)]:
+        observer = get_body("Earth") + wgs84.latlon(lat, lon)
+        for hour in (0, 7, 13, 19):
+            t = ts.utc(2025, 3, 1, hour)
+            alt, _, _ = observer.at(t).observe(stars).apparent().altaz()
+            visible = set(np.flatnonzero(alt.degrees >= 20.0))
+            lst_hours = (t.gast + lon / 15.0) % 24.0
+            candidates = set(catalog.candidates(lat, lst_hours, 20.0))
+            assert visible <= candidates
+            assert len(candidates) < size
@@ -1,5 +1,7 @@
 """Tests for CLI argument parsing."""
 
+from datetime import datetime, timezone
+
 import time_machine
 from click.testing import CliRunner
 
@@ -218,3 +220,26 @@ def test_events_command_with_days():
     runner = CliRunner()
     result = runner.invoke(main, ["events", "--lat", "40.7", "--lon", "-74.0", "--days", "14"])
     assert result.exit_code == 0
+
+
+def test_calendar_command_groups_by_month(mocker):
+    """calendar lists the year's events under month headings."""
+    calendar = mocker.patch(
+        "skycli.cli.get_event_calendar",
+        return_value=[
+            {"type": "eclipse", "date": datetime(2025, 3, 14, 6, 58, tzinfo=timezone.utc),
+             "title": "Total Lunar Eclipse", "description": "", "bodies": ["Moon"]},
+            {"type": "perihelion", "date": datetime(2025, 1, 4, 13, 22, tzinfo=timezone.utc),
+             "title": "Earth at Perihelion", "description": "", "bodies": ["Earth"]},
+        ],
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(main, ["calendar", "2025", "--type", "eclipse", "--no-color"])
+
+    assert result.exit_code == 0
+    calendar.assert_called_once_with(2025, 1, workers=1)
+    assert "EVENT CALENDAR 2025" in result.output
+    assert "March 2025" in result.output
+    assert "Total Lunar Eclipse" in result.output
+    assert "Perihelion" not in result.output
@@ -5,7 +5,13 @@ import re
 from datetime import datetime, timezone
 from pathlib import Path
 
-from skycli.sources.deep_sky import get_visible_dso
+import numpy as np
+import pytest
+from skyfield.api import wgs84
+
+from skycli.data.catalog import Catalog, get_catalog, register_catalog
+from skycli.ephemeris import get_body, get_ephemeris
+from skycli.sources.deep_sky import FAST_MAX_ERROR_ARCSEC, _altaz, _fast_altaz, get_visible_dso
 
 
 NYC_LAT = 40.7128
@@ -99,3 +105,81 @@ def test_messier_catalog_completeness():
 
         # Tip is non-empty
         assert len(obj["tip"].strip()) > 0, f"Empty tip in {obj['id']}"
+
+
+def test_results_sorted_by_magnitude_and_above_cutoff():
+    """Results are the brightest objects above min_altitude, brightest first."""
+    result = get_visible_dso(NYC_LAT, NYC_LON, datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc), limit=200, min_altitude=30.0)
+    assert len(result) > 5
+    mags = [obj["mag"] for obj in result]
+    assert mags == sorted(mags)
+    assert all(obj["altitude"] >= 30.0 for obj in result)
+
+
+def test_registered_catalog_is_searchable():
+    """get_visible_dso can search a plugged-in catalog by name."""
+    # Orion Nebula coordinates, high in the south on a January night in NYC
+    register_catalog("test-single", Catalog.from_records([{
+        "id": "T1", "name": "Test Object", "constellation": "Ori", "ra": 83.82, "dec": -5.39,
+        "mag": 4.0, "size": 1.0, "type": "Nebula", "equipment": "naked-eye", "tip": "Test",
+    }]))
+    result = get_visible_dso(NYC_LAT, NYC_LON, datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc), catalog="test-single")
+    assert [obj["id"] for obj in result] == ["T1"]
+
+
+def test_sort_by_altitude_returns_highest_objects():
+    """sort_by="altitude" picks the highest visible objects, highest first."""
+    date = datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc)
+    everything = get_visible_dso(NYC_LAT, NYC_LON, date, limit=200)
+    result = get_visible_dso(NYC_LAT, NYC_LON, date, limit=5, sort_by="altitude")
+
+    altitudes = [obj["altitude"] for obj in result]
+    assert altitudes == sorted(altitudes, reverse=True)
+    assert altitudes[0] == max(obj["altitude"] for obj in everything)
+    assert len(result) == 5
+
+
+def test_default_limit_matches_full_search():
+    """The early-exit search returns the head of the full brightness ranking."""
+    date = datetime(2025, 6, 15, 4, 0, tzinfo=timezone.utc)
+    everything = get_visible_dso(NYC_LAT, NYC_LON, date, limit=200)
+    assert get_visible_dso(NYC_LAT, NYC_LON, date) == everything[:5]
+
+
+def _angular_separation_arcsec(alt1, az1, alt2, az2):
+    """Great-circle distance between two alt/az positions, in arcseconds."""
+    alt1, az1, alt2, az2 = map(np.radians, (alt1, az1, alt2, az2))
+    cos_sep = np.sin(alt1) * np.sin(alt2) + np.cos(alt1) * np.cos(alt2) * np.cos(az1 - az2)
+    return np.degrees(np.arccos(np.clip(cos_sep, -1.0, 1.0))) * 3600
+
+
+def test_fast_precision_matches_skyfield_within_error_bound():
+    """The closed-form path agrees with Skyfield across the catalog, locations and dates."""
+    _, ts = get_ephemeris()
+    objects = get_catalog()
+    indices = np.arange(len(objects))
+
+    for lat, lon in [(-78.0, 166.7), (-33.9, 151.2), (0.0, 0.0), (NYC_LAT, NYC_LON), (64.1, -21.9), (89.0, 0.0)]:
+        observer = get_body("Earth") + wgs84.latlon(lat, lon)
+        for year, month, hour in [(1995, 1, 0), (2025, 4, 6), (2025, 10, 18), (2045, 7, 12)]:
+            t = ts.utc(year, month, 15, hour)
+            alt, az = _altaz(observer.at(t), objects, indices)
+            fast_alt, fast_az = _fast_altaz(t, lat, lon, objects, indices)
+
+            assert np.max(np.abs(fast_alt - alt)) * 3600 < FAST_MAX_ERROR_ARCSEC
+            assert np.max(_angular_separation_arcsec(alt, az, fast_alt, fast_az)) < FAST_MAX_ERROR_ARCSEC
+
+
+def test_fast_precision_returns_same_objects():
+    """precision="fast" picks the same objects as the full pipeline."""
+    date = datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc)
+    full = get_visible_dso(NYC_LAT, NYC_LON, date, limit=10)
+    fast = get_visible_dso(NYC_LAT, NYC_LON, date, limit=10, precision="fast")
+    assert [obj["id"] for obj in fast] == [obj["id"] for obj in full]
+
+
+@pytest.mark.parametrize("option", [{"precision": "exact"}, {"sort_by": "name"}])
+def test_unknown_options_are_rejected(option):
+    """Misspelled precision or sort_by values raise instead of falling back."""
+    with pytest.raises(ValueError):
+        get_visible_dso(NYC_LAT, NYC_LON, datetime(2025, 1, 15, 22, 0, tzinfo=timezone.utc), **option)
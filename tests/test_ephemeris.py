@@ -0,0 +1,90 @@
+"""Tests for the shared ephemeris loader."""
+
+import numpy as np
+from skyfield.api import load
+
+from skycli import ephemeris
+from skycli.ephemeris import get_body, get_ephemeris, warm_up
+
+
+def test_get_ephemeris_returns_same_instances():
+    """Kernel and timescale are loaded once and shared."""
+    eph1, ts1 = get_ephemeris()
+    eph2, ts2 = get_ephemeris()
+    assert eph1 is eph2
+    assert ts1 is ts2
+
+
+def test_get_body_maps_outer_planets_to_barycenters():
+    """Outer planets resolve to the barycenter segments DE421 carries."""
+    eph, _ = get_ephemeris()
+    assert get_body("Jupiter").target == eph["Jupiter barycenter"].target
+    assert get_body("Mars").target == eph["Mars"].target
+
+
+def test_get_body_caches_handles():
+    """Repeated lookups return the same handle."""
+    assert get_body("Earth") is get_body("Earth")
+
+
+def test_warm_up_builds_planet_handles():
+    """warm_up pre-builds handles for Earth, Sun, Moon and every planet."""
+    warm_up()
+    for name in ("Earth", "Sun", "Moon", *ephemeris.PLANET_KEYS):
+        assert name in ephemeris._bodies
+
+
+def test_excerpt_matches_full_kernel(tmp_path):
+    """Positions from the excerpt agree with the full kernel inside its window."""
+    path = ephemeris.excerpt_ephemeris(years=2, target=str(tmp_path / "excerpt.bsp"))
+    full, ts = get_ephemeris()
+    excerpt = load(str(path))
+
+    now = ts.now().tt
+    times = ts.tt_jd(now + np.linspace(-700, 700, 57))
+    for name in ("Sun", "Moon", "Earth", *ephemeris.PLANET_KEYS):
+        key = ephemeris.PLANET_KEYS.get(name, name)
+        difference_km = excerpt[key].at(times).position.km - full[key].at(times).position.km
+        assert np.max(np.abs(difference_km)) < 1e-6, name
+
+    assert {segment.target for segment in excerpt.spk.segments} == set(ephemeris.EXCERPT_TARGETS)
+    excerpt.close()
+
+
+def test_get_ephemeris_prefers_excerpt(tmp_path, monkeypatch):
+    """An excerpt covering today is loaded instead of the full kernel."""
+    path = ephemeris.excerpt_ephemeris(years=2, target=str(tmp_path / "excerpt.bsp"))
+    monkeypatch.setattr(ephemeris, "EXCERPT_FILE", str(path))
+    monkeypatch.setattr(ephemeris, "_ephemeris", None)
+    monkeypatch.setattr(ephemeris, "_bodies", {})
+
+    eph, _ = get_ephemeris()
+
+    assert eph.path == str(path)
+
+
+def test_get_ephemeris_skips_short_excerpt(tmp_path, monkeypatch):
+    """An excerpt not reaching the margin past today falls back to the full kernel."""
+    path = ephemeris.excerpt_ephemeris(years=0.5, target=str(tmp_path / "excerpt.bsp"))
+    monkeypatch.setattr(ephemeris, "EXCERPT_FILE", str(path))
+    monkeypatch.setattr(ephemeris, "_ephemeris", None)
+    monkeypatch.setattr(ephemeris, "_bodies", {})
+
+    eph, _ = get_ephemeris()
+
+    assert eph.filename == ephemeris.EPHEMERIS_FILE
+
+
+def test_short_excerpt_kept_without_full_kernel(tmp_path, monkeypatch):
+    """Without the full kernel on disk the excerpt is used rather than downloading one."""
+    path = ephemeris.excerpt_ephemeris(years=0.5, target=str(tmp_path / "excerpt.bsp"))
+    monkeypatch.setattr(ephemeris, "EXCERPT_FILE", str(path))
+    monkeypatch.setattr(ephemeris, "EPHEMERIS_FILE", str(tmp_path / "missing.bsp"))
+    monkeypatch.setattr(ephemeris, "_ephemeris", None)
+    monkeypatch.setattr(ephemeris, "_bodies", {})
+
+    eph, _ = get_ephemeris()
+    first, last = ephemeris.ephemeris_span()
+
+    assert eph.path == str(path)
+    assert 150 < (last - first).days < 400
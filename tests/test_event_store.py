@@ -0,0 +1,217 @@
+"""Tests for the precomputed event store."""
+
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from skycli import event_store
+from skycli.event_store import EventStore
+from skycli.sources import events
+from skycli.sources.events import fill_event_store, get_upcoming_events
+
+JAN_1 = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def make_event(date: datetime, title: str = "Full Moon") -> dict:
+    return {"type": "moon_phase", "date": date, "title": title, "description": "", "bodies": ["Moon"]}
+
+
+def test_query_returns_events_in_range(tmp_path):
+    """Stored events come back ordered by date, limited to the range."""
+    store = EventStore(tmp_path / "events.sqlite3", version=1)
+    store.add(
+        [make_event(JAN_1 + timedelta(days=20)), make_event(JAN_1 + timedelta(days=5), "New Moon")],
+        JAN_1,
+        JAN_1 + timedelta(days=30),
+    )
+
+    result = store.query(JAN_1, JAN_1 + timedelta(days=10))
+
+    assert [event["title"] for event in result] == ["New Moon"]
+    assert result[0]["date"] == JAN_1 + timedelta(days=5)
+    assert result[0]["bodies"] == ["Moon"]
+
+
+def test_query_outside_coverage_returns_none(tmp_path):
+    """Ranges the store doesn't fully cover aren't answered."""
+    store = EventStore(tmp_path / "events.sqlite3", version=1)
+    assert store.query(JAN_1, JAN_1 + timedelta(days=1)) is None
+
+    store.add([], JAN_1, JAN_1 + timedelta(days=30))
+    assert store.query(JAN_1, JAN_1 + timedelta(days=31)) is None
+    assert store.query(JAN_1, JAN_1 + timedelta(days=30)) == []
+
+
+def test_add_extends_coverage_without_gaps(tmp_path):
+    """Coverage grows with adjoining spans and rejects gaps."""
+    store = EventStore(tmp_path / "events.sqlite3", version=1)
+    store.add([], JAN_1, JAN_1 + timedelta(days=10))
+    store.add([], JAN_1 + timedelta(days=10), JAN_1 + timedelta(days=20))
+
+    assert store.coverage() == (JAN_1, JAN_1 + timedelta(days=20))
+    with pytest.raises(ValueError):
+        store.add([], JAN_1 + timedelta(days=30), JAN_1 + timedelta(days=40))
+
+
+def test_new_version_empties_store(tmp_path):
+    """Events computed by another version aren't served."""
+    path = tmp_path / "events.sqlite3"
+    EventStore(path, version=1).add([make_event(JAN_1)], JAN_1, JAN_1 + timedelta(days=1))
+
+    store = EventStore(path, version=2)
+
+    assert store.coverage() is None
+
+
+def test_upcoming_events_read_from_store(tmp_path, monkeypatch, mocker):
+    """With a store, get_upcoming_events matches computing the events directly."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    start = datetime(2025, 12, 1, 12, 0, tzinfo=timezone.utc)
+    expected = get_upcoming_events(40.7, -74.0, start, days=7)
+
+    store = EventStore(event_store.store_path(), events.EVENTS_VERSION)
+    fill_event_store(store, datetime(2025, 11, 1, tzinfo=timezone.utc), datetime(2025, 12, 9, tzinfo=timezone.utc))
+    compute = mocker.patch.object(events, "_computed_events")
+
+    result = get_upcoming_events(40.7, -74.0, start, days=7)
+
+    compute.assert_not_called()
+    assert [event["title"] for event in result] == [event["title"] for event in expected]
+    for event, reference in zip(result, expected):
+        assert abs((event["date"] - reference["date"]).total_seconds()) < 0.001
+
+
+def test_query_past_store_computes_the_rest(tmp_path, monkeypatch):
+    """A window running past the stored span searches the rest without extending the store."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    start = datetime(2025, 11, 28, tzinfo=timezone.utc)
+    expected = get_upcoming_events(40.7, -74.0, start, days=7)
+    store = event_store.get_event_store(events.EVENTS_VERSION, create=True)
+    fill_event_store(store, datetime(2025, 11, 1, tzinfo=timezone.utc), datetime(2025, 12, 1, tzinfo=timezone.utc))
+
+    result = get_upcoming_events(40.7, -74.0, start, days=7)
+
+    assert store.coverage()[1] == datetime(2025, 12, 1, tzinfo=timezone.utc)
+    assert [event["title"] for event in result] == [event["title"] for event in expected]
+
+
+def test_query_after_store_is_searched_directly(tmp_path, monkeypatch, mocker):
+    """A window starting past the stored span searches only the window itself."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    store = event_store.get_event_store(events.EVENTS_VERSION, create=True)
+    fill_event_store(store, datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 3, 1, tzinfo=timezone.utc))
+    start, end = datetime(2026, 6, 1, tzinfo=timezone.utc), datetime(2026, 6, 3, tzinfo=timezone.utc)
+    compute = mocker.spy(events, "_computed_events")
+
+    result = list(events.iter_events(start, end))
+
+    compute.assert_called_once_with(start, end)
+    assert all(start <= event["date"] <= end for event in result)
+    assert not events._stored_window(start, end)
+
+
+def test_store_is_opened_once_per_process(tmp_path, monkeypatch):
+    """Every caller shares the process's store instead of reopening the file."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    assert event_store.get_event_store(events.EVENTS_VERSION) is None
+
+    store = event_store.get_event_store(events.EVENTS_VERSION, create=True)
+
+    assert event_store.get_event_store(events.EVENTS_VERSION) is store
+
+
+def test_extend_computes_only_missing_parts(tmp_path):
+    """Extending asks for just the parts outside the covered span."""
+    store = EventStore(tmp_path / "events.sqlite3", version=1)
+    store.add([], JAN_1 + timedelta(days=10), JAN_1 + timedelta(days=20))
+    parts = []
+
+    store.extend(JAN_1, JAN_1 + timedelta(days=30), lambda start, end: parts.append((start, end)) or [])
+
+    assert parts == [(JAN_1, JAN_1 + timedelta(days=10)), (JAN_1 + timedelta(days=20), JAN_1 + timedelta(days=30))]
+    assert store.coverage() == (JAN_1, JAN_1 + timedelta(days=30))
+
+
+def test_concurrent_extends_compute_once(tmp_path):
+    """Writers on separate connections wait for each other, so a span is computed once."""
+    path = tmp_path / "events.sqlite3"
+    stores = [EventStore(path, version=1), EventStore(path, version=1)]
+    parts = []
+
+    def compute(start, end):
+        parts.append((start, end))
+        time.sleep(0.2)
+        return [make_event(start)]
+
+    threads = [
+        threading.Thread(target=store.extend, args=(JAN_1, JAN_1 + timedelta(days=10), compute)) for store in stores
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert parts == [(JAN_1, JAN_1 + timedelta(days=10))]
+    assert len(stores[1].query(JAN_1, JAN_1 + timedelta(days=10))) == 1
+
+
+def test_opening_does_not_wait_for_writers(tmp_path, monkeypatch):
+    """An up-to-date store opens while another connection holds the write lock."""
+    path = tmp_path / "events.sqlite3"
+    EventStore(path, version=1).add([], JAN_1, JAN_1 + timedelta(days=1))
+    monkeypatch.setattr(event_store, "WRITE_TIMEOUT_SECONDS", 0.1)
+    writer = sqlite3.connect(path, isolation_level=None)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        store = EventStore(path, version=1)
+        assert store.coverage() == (JAN_1, JAN_1 + timedelta(days=1))
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+
+
+def test_failed_extend_leaves_store_unchanged(tmp_path):
+    """An error while computing rolls the whole extension back."""
+    store = EventStore(tmp_path / "events.sqlite3", version=1)
+    store.add([], JAN_1, JAN_1 + timedelta(days=10))
+
+    def compute(start, end):
+        raise RuntimeError("search failed")
+
+    with pytest.raises(RuntimeError):
+        store.extend(JAN_1, JAN_1 + timedelta(days=20), compute)
+    assert store.coverage() == (JAN_1, JAN_1 + timedelta(days=10))
+
+
+def test_calendar_widens_store_and_reuses_it(tmp_path, monkeypatch, mocker):
+    """A calendar computes only the years the store lacks, then reads them back."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    first = events.get_event_calendar(2025)
+    compute = mocker.spy(events, "_compute_events")
+
+    calendar = events.get_event_calendar(2024, years=2)
+
+    store = EventStore(event_store.store_path(), events.EVENTS_VERSION)
+    assert [call.args[:2] for call in compute.call_args_list] == [(datetime(2024, 1, 1, tzinfo=timezone.utc), JAN_1)]
+    assert store.coverage() == (datetime(2024, 1, 1, tzinfo=timezone.utc), datetime(2026, 1, 1, tzinfo=timezone.utc))
+    assert [event for event in calendar if event["date"] >= JAN_1] == first
+    assert {event["date"].year for event in calendar} == {2024, 2025}
+
+
+def test_calendar_far_from_store_is_not_stored(tmp_path, monkeypatch, mocker):
+    """A calendar with a gap to the stored span computes only its own years."""
+    monkeypatch.setattr(event_store, "CACHE_DIR", tmp_path)
+    store = event_store.get_event_store(events.EVENTS_VERSION, create=True)
+    fill_event_store(store, datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 2, 1, tzinfo=timezone.utc))
+    fill = mocker.spy(store, "extend")
+    compute = mocker.spy(events, "_computed_events")
+
+    calendar = events.get_event_calendar(1990)
+
+    fill.assert_not_called()
+    compute.assert_called_once_with(datetime(1990, 1, 1, tzinfo=timezone.utc), datetime(1991, 1, 1, tzinfo=timezone.utc))
+    assert store.coverage() == (datetime(2026, 1, 1, tzinfo=timezone.utc), datetime(2026, 2, 1, tzinfo=timezone.utc))
+    assert {event["date"].year for event in calendar} == {1990}
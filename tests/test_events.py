@@ -1,10 +1,24 @@
 """Tests for astronomical events calculations."""
 
 from datetime import datetime, timezone
+from itertools import islice
 
+import astronomy
 import time_machine
 
-from skycli.sources.events import AstroEvent, get_upcoming_events
+from skycli.sources import events
+from skycli.sources.events import (
+    CONJUNCTION_BODIES,
+    CONJUNCTION_PAIRS,
+    AstroEvent,
+    _body_directions,
+    _find_conjunctions,
+    _find_moon_phases,
+    _separation,
+    _separations,
+    get_upcoming_events,
+    iter_events,
+)
 
 
 def test_get_upcoming_events_returns_list():
@@ -101,3 +115,147 @@ def test_graceful_degradation_on_error(monkeypatch):
 
     # Should not raise, should return list (may be partial or empty)
     assert isinstance(events, list)
+
+
+def test_separation_matrix_matches_angle_between():
+    """Pairwise angles from the body vector table match Astronomy Engine's AngleBetween."""
+    time = astronomy.Time.Make(2025, 3, 1, 12, 0, 0)
+    separations = _separations(_body_directions([time]))[0]
+
+    for i, j in CONJUNCTION_PAIRS:
+        expected = astronomy.AngleBetween(
+            astronomy.GeoVector(CONJUNCTION_BODIES[i], time, True),
+            astronomy.GeoVector(CONJUNCTION_BODIES[j], time, True),
+        )
+        assert abs(separations[i, j] - expected) < 1e-6
+
+
+def test_conjunction_reported_at_closest_approach():
+    """Each conjunction is reported once, at the instant of minimum separation."""
+    date = datetime(2025, 1, 10, 0, 0, tzinfo=timezone.utc)
+    events = _find_conjunctions(date, 7)
+
+    mars_moon = [e for e in events if e["bodies"] == ["Mars", "Moon"]]
+    assert len(mars_moon) == 1
+    event_date = mars_moon[0]["date"]
+    assert event_date.date() == datetime(2025, 1, 14).date()
+
+    # Separation grows a minute either side of the reported time
+    i = CONJUNCTION_BODIES.index(astronomy.Body.Mars)
+    j = CONJUNCTION_BODIES.index(astronomy.Body.Moon)
+    t = astronomy.Time.Make(event_date.year, event_date.month, event_date.day,
+                            event_date.hour, event_date.minute, event_date.second + event_date.microsecond / 1e6)
+    minimum = _separation(i, j, t)
+    assert _separation(i, j, t.AddDays(-1 / 1440)) > minimum
+    assert _separation(i, j, t.AddDays(1 / 1440)) > minimum
+
+
+def test_moon_phases_complete_over_long_windows():
+    """A year-long window has every quarter, in order, not just the first full and new moon."""
+    date = datetime(2025, 1, 1, 0, 0, tzinfo=timezone.utc)
+    phases = _find_moon_phases(date, 365)
+
+    full_moons = [e for e in phases if e["title"].startswith("Full Moon")]
+    new_moons = [e for e in phases if e["title"] == "New Moon"]
+    assert len(full_moons) == 12
+    assert len(new_moons) == 12
+    assert len(phases) == 49  # 2025 starts between New Moon and First Quarter
+
+    order = ["First Quarter Moon", "Full Moon", "Last Quarter Moon", "New Moon"]
+    titles = [e["title"].split(" (")[0] for e in phases]
+    assert titles == [order[i % 4] for i in range(len(titles))]
+
+
+def test_iter_events_streams_in_date_order():
+    """iter_events yields the same events as get_upcoming_events, in order, lazily."""
+    date = datetime(2025, 12, 1, 12, 0, tzinfo=timezone.utc)
+    expected = get_upcoming_events(lat=40.7, lon=-74.0, start=date, days=30)
+
+    streamed = list(islice(iter_events(date), len(expected)))
+
+    assert [e["title"] for e in streamed] == [e["title"] for e in expected]
+    assert [e["date"] for e in streamed] == sorted(e["date"] for e in streamed)
+
+
+def test_iter_events_long_window_has_every_opposition():
+    """Windows longer than a synodic period get each planet's later oppositions too."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    end = datetime(2027, 1, 1, tzinfo=timezone.utc)
+    oppositions = [e for e in iter_events(start, end) if e["type"] == "opposition"]
+
+    saturn = [e for e in oppositions if e["bodies"] == ["Saturn"]]
+    assert len(saturn) == 2  # September 2025 and October 2026
+
+
+def test_process_pool_matches_serial_search():
+    """Computing on a process pool gives exactly the events of the serial search."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    serial = get_upcoming_events(lat=40.7, lon=-74.0, start=start, days=120)
+    parallel = get_upcoming_events(lat=40.7, lon=-74.0, start=start, days=120, workers=2)
+
+    assert parallel == serial
+    assert {event["type"] for event in parallel} >= {"moon_phase", "conjunction", "opposition", "equinox"}
+
+
+def test_finds_eclipses_elongations_and_perihelia():
+    """2025's eclipses, Venus's greatest elongations and Earth's perihelion are found."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = get_upcoming_events(lat=40.7, lon=-74.0, start=start, days=365)
+
+    eclipses = [(e["date"].month, e["date"].day, e["title"]) for e in events if e["type"] == "eclipse"]
+    assert eclipses == [
+        (3, 14, "Total Lunar Eclipse"),
+        (3, 29, "Partial Solar Eclipse"),
+        (9, 7, "Total Lunar Eclipse"),
+        (9, 21, "Partial Solar Eclipse"),
+    ]
+
+    venus = [(e["date"].month, e["title"]) for e in events if e["type"] == "elongation" and e["bodies"] == ["Venus"]]
+    assert venus == [(1, "Venus at Greatest Eastern Elongation"), (6, "Venus at Greatest Western Elongation")]
+
+    earth = [e for e in events if e["type"] == "perihelion" and e["bodies"] == ["Earth"]]
+    assert [(e["date"].month, e["date"].day) for e in earth] == [(1, 4)]
+
+
+def test_upcoming_searches_are_memoized(mocker):
+    """Oppositions and seasons are searched once, until the opposition passes."""
+    events._upcoming.clear()
+    events._seasons.clear()
+    start = datetime(2025, 6, 1, tzinfo=timezone.utc)
+    with time_machine.travel(start, tick=False):
+        expected = events._find_oppositions(start, 200) + events._find_seasonal_events(start, 200)
+        search = mocker.spy(astronomy, "SearchRelativeLongitude")
+        seasons = mocker.spy(astronomy, "Seasons")
+
+        later = start.replace(day=2)
+        result = events._find_oppositions(later, 199) + events._find_seasonal_events(later, 199)
+
+    assert result == expected
+    # Each planet's next opposition is reused; only the one after each
+    # opposition in the window is searched
+    assert search.call_count == len([event for event in result if event["type"] == "opposition"])
+    seasons.assert_not_called()
+
+    saturn = events._upcoming[("opposition", "Saturn")][1]
+    with time_machine.travel(datetime(2025, 12, 1, tzinfo=timezone.utc), tick=False):
+        events._find_oppositions(datetime(2025, 12, 1, tzinfo=timezone.utc), 1)
+    assert events._upcoming[("opposition", "Saturn")][1] > saturn
+
+
+def test_oppositions_on_known_dates():
+    """2025's oppositions: Mars in January, Saturn and Neptune in September, Uranus in November."""
+    start = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    events = get_upcoming_events(lat=40.7, lon=-74.0, start=start, days=365)
+
+    oppositions = [(e["bodies"][0], e["date"].month, e["date"].day) for e in events if e["type"] == "opposition"]
+    assert oppositions == [("Mars", 1, 16), ("Saturn", 9, 21), ("Neptune", 9, 23), ("Uranus", 11, 21)]
+
+
+def test_meteor_shower_peaks_are_events():
+    """Shower peaks in the window are listed as meteor events."""
+    start = datetime(2025, 12, 1, tzinfo=timezone.utc)
+    events = get_upcoming_events(lat=40.7, lon=-74.0, start=start, days=31)
+
+    peaks = [(e["date"].day, e["title"]) for e in events if e["type"] == "meteor"]
+    assert peaks == [(14, "Geminids Peak"), (22, "Ursids Peak")]
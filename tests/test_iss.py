@@ -1,7 +1,12 @@
 """Tests for ISS pass predictions."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
+import pytest
+from skyfield.api import wgs84
+
+from skycli.ephemeris import get_body, get_ephemeris
+from skycli.sources import iss
 from skycli.sources.iss import get_iss_passes
 
 
@@ -67,3 +72,79 @@ def test_filters_to_visible_passes_only(mocker):
     # All returned passes should have positive max altitude
     for p in result:
         assert p["max_altitude"] > 0
+
+
+# ISS elements from 2014-01-20, as in Skyfield's documentation
+ISS_TLE = """ISS (ZARYA)
+1 25544U 98067A   14020.93268519  .00009878  00000-0  18200-3 0  5082
+2 25544  51.6498 109.4756 0003572  55.9686 274.8005 15.49815350868473
+"""
+TLE_DATE = datetime(2014, 1, 21, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def tle_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(iss, "CACHE_DIR", tmp_path)
+    path = tmp_path / iss.TLE_FILE
+    path.write_text(ISS_TLE)
+    return path
+
+
+def test_local_passes_from_tle(tle_file, mocker):
+    """With a TLE on disk, passes are predicted locally without calling N2YO."""
+    http = mocker.patch("httpx.get")
+
+    result = get_iss_passes(-33.9, 151.2, TLE_DATE)
+
+    http.assert_not_called()
+    assert result
+    assert result == sorted(result, key=lambda p: p["start_time"])
+    for p in result:
+        assert TLE_DATE <= p["start_time"] <= TLE_DATE + timedelta(days=2)
+        assert iss.MIN_PASS_ALTITUDE <= p["max_altitude"] <= 90
+        assert p["duration_minutes"] >= 1
+        assert p["start_direction"] in ("N", "NE", "E", "SE", "S", "SW", "W", "NW")
+        assert p["brightness"] == iss._magnitude_to_brightness(p["magnitude"])
+        assert -6 < p["magnitude"] < 2
+
+
+def test_local_passes_are_visible(tle_file):
+    """Each pass starts with the ISS up and sunlit while the observer's sky is dark."""
+    eph, ts = get_ephemeris()
+    satellite = iss._load_satellite()
+    location = wgs84.latlon(51.5, 0.0)
+
+    for p in get_iss_passes(51.5, 0.0, TLE_DATE):
+        t = ts.from_datetime(p["start_time"] + timedelta(seconds=iss.PASS_STEP_SECONDS))
+        alt, _, _ = (satellite - location).at(t).altaz()
+        sun_alt, _, _ = (get_body("Earth") + location).at(t).observe(get_body("Sun")).apparent().altaz()
+        assert alt.degrees >= iss.MIN_PASS_ALTITUDE
+        assert satellite.at(t).is_sunlit(eph)
+        assert sun_alt.degrees < iss.DARK_SUN_ALTITUDE
+
+
+def test_stale_tle_falls_back_to_n2yo(tle_file, mocker):
+    """Elements far from the requested date are ignored in favour of N2YO."""
+    mocker.patch.dict("os.environ", {"N2YO_API_KEY": "test_key"})
+    mock_response = mocker.Mock()
+    mock_response.json.return_value = MOCK_API_RESPONSE
+    mock_response.raise_for_status = mocker.Mock()
+    http = mocker.patch("httpx.get", return_value=mock_response)
+
+    result = get_iss_passes(40.7, -74.0, datetime(2025, 1, 16, 18, 0, tzinfo=timezone.utc))
+
+    http.assert_called_once()
+    assert len(result) == 2
+
+
+def test_update_tle_saves_elements(tmp_path, monkeypatch, mocker):
+    """Downloaded elements replace the TLE file and are picked up by the predictor."""
+    monkeypatch.setattr(iss, "CACHE_DIR", tmp_path)
+    mock_response = mocker.Mock(text=ISS_TLE.replace("\n", "\r\n"))
+    mock_response.raise_for_status = mocker.Mock()
+    mocker.patch("httpx.get", return_value=mock_response)
+
+    path = iss.update_tle()
+
+    assert path.read_text() == ISS_TLE
+    assert iss._load_satellite().model.satnum == iss.ISS_NORAD_ID
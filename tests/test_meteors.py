@@ -2,7 +2,16 @@
 
 from datetime import datetime, timezone
 
-from skycli.sources.meteors import get_active_showers
+from skycli.sources import meteors
+from skycli.sources.events import _iter_meteor_peaks
+from skycli.sources.meteors import (
+    day_of_year,
+    get_active_showers,
+    get_meteor_timeline,
+    get_shower_index,
+    get_showers_tonight,
+    next_shower_peak,
+)
 
 
 def test_ursids_active_in_december():
@@ -35,3 +44,84 @@ def test_shower_info_structure():
         assert "peak_date" in shower
         assert "radiant_constellation" in shower
         assert "is_peak" in shower
+
+
+def test_peak_flag_within_a_day_of_peak():
+    """A shower is flagged at peak from the day before to the day after."""
+    flags = [
+        [s["is_peak"] for s in get_active_showers(datetime(2025, 12, day, tzinfo=timezone.utc)) if s["name"] == "Geminids"]
+        for day in (12, 13, 14, 15, 16)
+    ]
+    assert flags == [[False], [True], [True], [True], [False]]
+
+
+def test_shower_wrapping_year_end_is_indexed_both_sides():
+    """Feb 29 has its own slot and a shower active across Jan 1 is found on both sides."""
+    index = get_shower_index()
+    assert len(index.days) == 366
+    assert day_of_year(datetime(2024, 2, 29)) == 59
+    assert day_of_year(datetime(2025, 3, 1)) == day_of_year(datetime(2024, 3, 1)) == 60
+    assert ["Quadrantids"] == [s["name"] for s in get_active_showers(datetime(2026, 1, 1, tzinfo=timezone.utc))]
+
+
+def test_next_shower_peak_wraps_into_next_year():
+    """The next peak after the last one of the year is January's."""
+    peak, showers = next_shower_peak(datetime(2025, 12, 14, 18, tzinfo=timezone.utc))
+    assert (peak, [shower["name"] for shower in showers]) == (datetime(2025, 12, 14, tzinfo=timezone.utc), ["Geminids"])
+
+    peak, showers = next_shower_peak(datetime(2025, 12, 23, tzinfo=timezone.utc))
+    assert (peak, [shower["name"] for shower in showers]) == (datetime(2026, 1, 3, tzinfo=timezone.utc), ["Quadrantids"])
+    assert showers[0]["is_peak"]
+
+
+def test_showers_peaking_the_same_day_are_all_returned(monkeypatch):
+    """A day with two peaks gives both showers, most active first, then the next day's."""
+    def shower(name, zhr, day):
+        return {
+            "name": name, "peak_month": 8, "peak_day": day, "active_start": {"month": 8, "day": 1},
+            "active_end": {"month": 8, "day": 20}, "zhr": zhr, "radiant_ra": 0, "radiant_dec": 0,
+            "radiant_constellation": "Test",
+        }
+
+    records = [shower("Minor", 5, 12), shower("Major", 100, 12), shower("Later", 20, 13)]
+    monkeypatch.setattr(meteors, "_index", meteors.ShowerIndex.from_records(records))
+    start = datetime(2025, 8, 10, tzinfo=timezone.utc)
+
+    peak, showers = next_shower_peak(start)
+    assert (peak, [s["name"] for s in showers]) == (datetime(2025, 8, 12, tzinfo=timezone.utc), ["Major", "Minor"])
+
+    peaks = [event["title"] for event in _iter_meteor_peaks(start, datetime(2025, 8, 15, tzinfo=timezone.utc))]
+    assert peaks == ["Major Peak", "Minor Peak", "Later Peak"]
+
+
+def test_timeline_follows_radiant_and_daylight():
+    """Rates are zero in daylight and peak when the radiant is highest in the dark."""
+    # Geminids from London, starting at dusk on peak night
+    timeline = get_meteor_timeline(51.5, 0.0, datetime(2025, 12, 13, 18, 0, tzinfo=timezone.utc))
+
+    geminids = timeline[0]
+    assert geminids["name"] == "Geminids"
+    assert len(geminids["rates"]) == 25
+    rates = {rate["time"].hour: rate["rate"] for rate in geminids["rates"][:24]}
+    assert rates[12] == 0.0  # Midday
+    assert geminids["best_time"].hour in (1, 2, 3)
+    assert 0 < geminids["best_rate"] <= 150
+    assert rates[19] < geminids["best_rate"]  # Radiant still low in the east
+
+
+def test_moonlight_lowers_rates(monkeypatch):
+    """The same shower is less productive under a bright Moon."""
+    date = datetime(2025, 8, 12, 20, 0, tzinfo=timezone.utc)  # Perseids, Moon 84% lit
+    with_moon = get_meteor_timeline(51.5, 0.0, date)[0]
+
+    monkeypatch.setattr(meteors, "MOON_MAGNITUDE_LOSS", 0.0)
+    without_moon = get_meteor_timeline(51.5, 0.0, date)[0]
+
+    assert with_moon["best_rate"] < without_moon["best_rate"]
+    assert all(a["rate"] <= b["rate"] for a, b in zip(with_moon["rates"], without_moon["rates"]))
+
+
+def test_no_timeline_without_active_showers():
+    """Nothing is computed when no shower is active."""
+    assert get_meteor_timeline(51.5, 0.0, datetime(2025, 3, 15, tzinfo=timezone.utc)) == []
+    assert get_showers_tonight(51.5, 0.0, datetime(2025, 3, 15, tzinfo=timezone.utc)) == []
@@ -3,7 +3,9 @@
 from datetime import datetime, timezone
 
 import time_machine
+from skyfield.api import wgs84
 
+from skycli.ephemeris import get_body, get_ephemeris
 from skycli.sources.planets import get_visible_planets
 
 
@@ -43,3 +45,18 @@ def test_only_visible_planets_returned():
 
     for planet in result:
         assert planet["altitude"] > 0, f"{planet['name']} is below horizon"
+
+
+def test_positions_match_per_planet_skyfield_pipeline():
+    """Batched alt/az agrees with observing each planet on its own."""
+    date = datetime(2025, 1, 15, 22, 0, tzinfo=timezone.utc)
+    result = get_visible_planets(NYC_LAT, NYC_LON, date)
+    assert result
+
+    _, ts = get_ephemeris()
+    observer = get_body("Earth") + wgs84.latlon(NYC_LAT, NYC_LON)
+    t = ts.utc(2025, 1, 15, 22, 0)
+    for planet in result:
+        alt, az, _ = observer.at(t).observe(get_body(planet["name"])).apparent().altaz()
+        assert planet["altitude"] == round(alt.degrees, 0)
+        assert planet["azimuth"] == round(az.degrees, 1)
@@ -4,7 +4,11 @@ from datetime import datetime, timezone
 
 import time_machine
 
+from skycli.context import NightContext
 from skycli.report import build_report
+from skycli.sources.deep_sky import get_visible_dso
+from skycli.sources.planets import get_visible_planets
+from skycli.sources.sun_moon import get_moon_info, get_sun_times
 
 
 NYC_LAT = 40.7128
@@ -61,3 +65,14 @@ def test_report_includes_events():
 
     assert "events" in report
     assert isinstance(report["events"], list)
+
+
+def test_sources_accept_shared_context():
+    """Sources give the same answer with a shared NightContext as without."""
+    date = datetime(2025, 1, 16, 3, 0, tzinfo=timezone.utc)
+    context = NightContext(NYC_LAT, NYC_LON, date)
+
+    assert get_sun_times(NYC_LAT, NYC_LON, date, context=context) == get_sun_times(NYC_LAT, NYC_LON, date)
+    assert get_moon_info(NYC_LAT, NYC_LON, date, context=context) == get_moon_info(NYC_LAT, NYC_LON, date)
+    assert get_visible_planets(NYC_LAT, NYC_LON, date, context=context) == get_visible_planets(NYC_LAT, NYC_LON, date)
+    assert get_visible_dso(NYC_LAT, NYC_LON, date, context=context) == get_visible_dso(NYC_LAT, NYC_LON, date)
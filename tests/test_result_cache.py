@@ -0,0 +1,137 @@
+"""Tests for the location-quantized result cache."""
+
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from skycli import almanac_tables, context
+from skycli.almanac_tables import AlmanacTable, store_table
+from skycli.report import build_report
+from skycli.result_cache import ResultCache, SectionPolicy
+
+POLICY = SectionPolicy(grid_degrees=0.05, bucket_seconds=300, ttl_seconds=60, max_entries=2)
+DATE = datetime(2025, 1, 15, 22, 1, tzinfo=timezone.utc)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def record_calls(calls):
+    def compute(lat, lon, date):
+        calls.append((lat, lon, date))
+        return len(calls)
+    return compute
+
+
+def test_snap_to_cell_centre_and_bucket_start():
+    """Coordinates snap to their cell centre and times to their bucket start."""
+    cache = ResultCache({"planets": POLICY})
+
+    key, lat, lon, date = cache.snap("planets", 40.7128, -74.006, DATE)
+
+    assert abs(lat - 40.725) < 1e-9
+    assert abs(lon - -74.025) < 1e-9
+    assert date == datetime(2025, 1, 15, 22, 0, tzinfo=timezone.utc)
+    assert key == cache.snap("planets", 40.72, -74.01, DATE.replace(minute=4))[0]
+
+
+def test_nearby_requests_share_a_result():
+    """Requests in the same cell and bucket are computed once, at the snapped input."""
+    cache = ResultCache({"planets": POLICY})
+    calls = []
+
+    first = cache.get_or_compute("planets", 40.7128, -74.006, DATE, record_calls(calls))
+    second = cache.get_or_compute("planets", 40.72, -74.01, DATE.replace(minute=3), record_calls(calls))
+
+    assert first == second == 1
+    assert calls == [cache.snap("planets", 40.7128, -74.006, DATE)[1:]]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_other_cells_and_buckets_miss():
+    """A different cell or time bucket is computed separately."""
+    cache = ResultCache({"planets": POLICY})
+    calls = []
+
+    cache.get_or_compute("planets", 40.7128, -74.006, DATE, record_calls(calls))
+    cache.get_or_compute("planets", 40.80, -74.006, DATE, record_calls(calls))
+    cache.get_or_compute("planets", 40.7128, -74.006, DATE.replace(minute=6), record_calls(calls))
+
+    assert len(calls) == 3
+
+
+def test_results_expire_after_ttl():
+    """Results are recomputed once their TTL has passed."""
+    clock = FakeClock()
+    cache = ResultCache({"planets": POLICY}, clock=clock)
+    calls = []
+
+    cache.get_or_compute("planets", 40.7, -74.0, DATE, record_calls(calls))
+    clock.now = 59
+    cache.get_or_compute("planets", 40.7, -74.0, DATE, record_calls(calls))
+    clock.now = 61
+    cache.get_or_compute("planets", 40.7, -74.0, DATE, record_calls(calls))
+
+    assert len(calls) == 2
+
+
+def test_least_recently_used_is_evicted():
+    """Beyond max_entries, the least recently used result is dropped."""
+    cache = ResultCache({"planets": POLICY})
+    calls = []
+
+    cache.get_or_compute("planets", 10.0, 10.0, DATE, record_calls(calls))
+    cache.get_or_compute("planets", 20.0, 20.0, DATE, record_calls(calls))
+    cache.get_or_compute("planets", 10.0, 10.0, DATE, record_calls(calls))  # Refresh 10,10
+    cache.get_or_compute("planets", 30.0, 30.0, DATE, record_calls(calls))  # Evicts 20,20
+    cache.get_or_compute("planets", 10.0, 10.0, DATE, record_calls(calls))
+    cache.get_or_compute("planets", 20.0, 20.0, DATE, record_calls(calls))
+
+    assert [round(call[0], 3) for call in calls] == [10.025, 20.025, 30.025, 20.025]
+
+
+def test_cached_results_are_copies():
+    """Changing a returned result doesn't change what later callers get."""
+    cache = ResultCache({"planets": POLICY})
+
+    first = cache.get_or_compute("planets", 40.7, -74.0, DATE, lambda lat, lon, date: [{"name": "Mars"}])
+    first[0]["name"] = "Venus"
+    first.append({"name": "Jupiter"})
+
+    assert cache.get_or_compute("planets", 40.7, -74.0, DATE, record_calls([])) == [{"name": "Mars"}]
+
+
+def test_build_report_serves_cached_sections(mocker):
+    """A second report from a nearby location reuses the cached sections."""
+    cache = ResultCache()
+    planets = mocker.patch("skycli.report.get_visible_planets", return_value=[])
+
+    build_report(40.7128, -74.006, DATE, only=["planets"], cache=cache)
+    report = build_report(40.7130, -74.007, DATE, only=["planets"], cache=cache)
+
+    assert planets.call_count == 1
+    assert report["location"] == {"lat": 40.7130, "lon": -74.007}
+    assert cache.hits == 3  # sun, moon and planets
+
+
+def test_locations_with_tables_bypass_the_cache(tmp_path, monkeypatch, mocker):
+    """Sun and moon come from the exact location's almanac table, not a snapped one."""
+    monkeypatch.setattr(almanac_tables, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(almanac_tables, "_tables", {})
+    monkeypatch.setattr(almanac_tables, "_missing", OrderedDict())
+    store_table(AlmanacTable.from_days(40.7128, -74.006, 2025, []))
+    sun = mocker.patch("skycli.report.get_sun_times", return_value={})
+    moon = mocker.patch("skycli.report.get_moon_info", return_value={})
+    cache = ResultCache()
+
+    lookup = mocker.spy(context, "get_table")
+
+    build_report(40.7128, -74.006, DATE, only=["sun", "moon"], cache=cache)
+
+    assert sun.call_args.args == moon.call_args.args == (40.7128, -74.006, DATE)
+    assert cache.misses == 0
+    assert lookup.call_count == 1
@@ -0,0 +1,55 @@
+"""Tests for the shared multi-body rise/set search."""
+
+from skyfield import almanac
+from skyfield.api import wgs84
+
+from skycli.ephemeris import PLANET_KEYS, get_body, get_ephemeris
+from skycli.rise_set import SearchGrid, find_risings_and_settings
+
+
+def test_matches_skyfield_almanac_within_a_second():
+    """Every rise/set Skyfield finds is found within a second."""
+    eph, ts = get_ephemeris()
+    bodies = {name: get_body(name) for name in ("Moon", *PLANET_KEYS)}
+
+    for lat, lon in [(40.7128, -74.0060), (-33.9, 151.2), (51.5, 0.0)]:
+        location = wgs84.latlon(lat, lon)
+        observer = get_body("Earth") + location
+        for month in (1, 5, 9):
+            t0 = ts.utc(2025, month, 10)
+            t1 = ts.utc(2025, month, 11)
+            found = find_risings_and_settings(SearchGrid(observer, location, t0, t1), bodies)
+
+            for name, body in bodies.items():
+                f = almanac.risings_and_settings(eph, body, location)
+                times, events = almanac.find_discrete(t0, t1, f)
+                assert len(found[name]) == len(times), name
+                for (dt, is_rise), t, event in zip(found[name], times, events):
+                    assert is_rise == bool(event)
+                    assert abs((dt - t.utc_datetime()).total_seconds()) < 1.0
+
+
+def test_finds_grazing_crossings():
+    """A dip just below the horizon between samples is still found."""
+    _, ts = get_ephemeris()
+    location = wgs84.latlon(64.1, -21.9)
+    observer = get_body("Earth") + location
+
+    # Mars skims the horizon from Reykjavik, dipping below it for ~70 minutes
+    grid = SearchGrid(observer, location, ts.utc(2025, 1, 15), ts.utc(2025, 1, 16))
+    found = find_risings_and_settings(grid, {"Mars": get_body("Mars")})
+    events = found["Mars"]
+    assert [is_rise for _, is_rise in events] == [False, True]
+    assert events[0][0].hour == 13
+    assert events[1][0].hour == 14
+
+
+def test_body_that_never_crosses_has_no_events():
+    """Bodies that stay up or down all window return an empty list."""
+    _, ts = get_ephemeris()
+    location = wgs84.latlon(40.7128, -74.0060)
+    observer = get_body("Earth") + location
+    t0 = ts.utc(2025, 1, 15, 0)
+    t1 = ts.utc(2025, 1, 15, 0, 20)
+    found = find_risings_and_settings(SearchGrid(observer, location, t0, t1), {"Saturn": get_body("Saturn")})
+    assert found == {"Saturn": []}
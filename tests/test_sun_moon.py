@@ -3,8 +3,11 @@
 from datetime import datetime, timezone
 
 import time_machine
+from skyfield import almanac
+from skyfield.api import wgs84
 
-from skycli.sources.sun_moon import get_sun_times, get_moon_info
+from skycli.ephemeris import get_ephemeris
+from skycli.sources.sun_moon import get_moon_info, get_sun_times
 
 
 # NYC coordinates
@@ -34,6 +37,39 @@ def test_get_sun_times_winter_solstice():
     assert result["sunset"].hour == 21
 
 
+def test_get_sun_times_twilight_boundaries_in_order():
+    """Evening boundaries run sunset -> civil -> nautical -> astronomical, mornings the reverse."""
+    # London, where the whole day falls inside one UTC date
+    result = get_sun_times(51.5, 0.0, datetime(2025, 3, 10, tzinfo=timezone.utc))
+
+    assert (
+        result["astronomical_twilight_end"]
+        < result["nautical_twilight_end"]
+        < result["civil_twilight_end"]
+        < result["sunrise"]
+    )
+    assert (
+        result["sunset"]
+        < result["civil_twilight_start"]
+        < result["nautical_twilight_start"]
+        < result["astronomical_twilight_start"]
+    )
+    # Astronomical night starts ~19:50 UTC in mid-March
+    assert result["astronomical_twilight_start"].hour == 19
+
+
+def test_get_sun_times_matches_skyfield_almanac():
+    """Sunrise and sunset agree with Skyfield's almanac within a second."""
+    eph, ts = get_ephemeris()
+    for lat, lon in [(NYC_LAT, NYC_LON), (35.7, 139.7), (-33.9, 151.2)]:
+        result = get_sun_times(lat, lon, datetime(2025, 6, 21, tzinfo=timezone.utc))
+        f = almanac.sunrise_sunset(eph, wgs84.latlon(lat, lon))
+        times, events = almanac.find_discrete(ts.utc(2025, 6, 21), ts.utc(2025, 6, 22), f)
+        for t, event in zip(times, events):
+            key = "sunrise" if event == 1 else "sunset"
+            assert abs((result[key] - t.utc_datetime()).total_seconds()) < 1.0
+
+
 def test_get_moon_info_new_moon():
     """Moon info for a known new moon date."""
     # Jan 29, 2025 is a new moon
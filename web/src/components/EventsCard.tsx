@@ -63,6 +63,8 @@ const eventTypeConfig: Record<string, { color: string; icon: string }> = {
   conjunction: { color: '#fbbf24', icon: '⚹' },
   meteor: { color: '#e25822', icon: '☄️' },
   opposition: { color: '#ef4444', icon: '☍' },
+  elongation: { color: '#60a5fa', icon: '☿' },
+  perihelion: { color: '#f97316', icon: '☉' },
   equinox: { color: '#4ecdc4', icon: '☯' },
   solstice: { color: '#c9a227', icon: '☀️' },
 }